@@ -11,6 +11,7 @@ from tabulate import tabulate
 
 from chicken_dinner.assets.dictionary import update_dictionary
 from chicken_dinner.assets.maps import update_maps
+from chicken_dinner.constants import MAX_WORKERS
 from chicken_dinner.pubgapi import PUBG
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
@@ -19,6 +20,9 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 def get_pubg(api_key, shard):
     if api_key is None:
         raise ValueError("Must provide API key or environment variable 'PUBG_API_KEY'.")
+    # Use a pool of API keys when given a comma separated list
+    if "," in api_key:
+        api_key = api_key.split(",")
     pubg = PUBG(api_key, shard)
     return pubg
 
@@ -41,7 +45,7 @@ def assets():
 
 
 @click.command(short_help="Display leaderboards")
-@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key")
+@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key(s), comma separated")
 @click.option("--shard", default="steam", help="pubg api shard")
 @click.option("--show-ids", is_flag=True, help="show player ids")
 @click.argument("game_mode")
@@ -68,7 +72,7 @@ def leaderboard(api_key, shard, show_ids, game_mode):
 
 
 @click.command(short_help="Display player stats")
-@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key")
+@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key(s), comma separated")
 @click.option("--shard", default="steam", help="pubg api shard")
 @click.option("-l", "--lifetime", is_flag=True, help="lifetime stats")
 @click.option("-g", "--group", default=None, help="game mode group")
@@ -102,17 +106,57 @@ def stats(api_key, shard, lifetime, group, perspective, player_name):
         click.secho(line)
 
 
+def _fetch_match(pubg, match_id):
+    # Return the exception in place of a match, as PUBG.matches does
+    try:
+        return pubg.match(match_id)
+    except Exception as exc:
+        return exc
+
+
+def replay_filename(path, player_name, match, output_format):
+    created_at = match.created_at.replace("-", "").replace(":", "")
+    return os.path.join(path, player_name + "_" + created_at + "_" + match.id + "." + output_format)
+
+
+def replay_options(player_name, match, size):
+    return dict(
+        zoom=True,
+        labels=True,
+        label_players=[player_name],
+        highlight_winner=True,
+        label_highlights=True,
+        size=size,
+        end_frames=60,
+        use_hi_res=False,
+        color_teams=False if "solo" in match.game_mode else True,
+        interpolate=True,
+        damage=True,
+        interval=2,
+    )
+
+
 @click.command(short_help="Generate replay visualizations")
-@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key")
+@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key(s), comma separated")
 @click.option("--shard", default="steam", help="pubg api shard")
 @click.option("-w", "--wins-only", is_flag=True, help="wins only")
 @click.option("-l", "--latest", is_flag=True, help="latest match only")
 @click.option("-s", "--size", default=6, help="render size")
 @click.option("-p", "--path", default=".", help="the path for new files")
+@click.option("-j", "--processes", default=None, type=int, help="number of processes to render with")
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    default="html",
+    type=click.Choice(["html", "mp4", "webm", "gif"]),
+    help="output format",
+)
+@click.option("--bitrate", default=None, type=int, help="video bitrate in kbps")
 @click.option("-v", "--verbose", is_flag=True, help="enable verbose logging")
 @click.argument("player_name")
-def replay(api_key, shard, wins_only, latest, size, path, verbose, player_name):
-    """Generate html replay(s) for a player's recent games.
+def replay(api_key, shard, wins_only, latest, size, path, processes, output_format, bitrate, verbose, player_name):
+    """Generate html or video replay(s) for a player's recent games.
 
     usage: $ chicken-dinner replay --api-key=$PUBG_API_KEY --shard=steam -lw -s 6 -p /path/to/my/replays
     usage: $ chicken-dinner replay --api-key=$PUBG_API_KEY --shard=steam --latest --wins-only --size=6 --path=/path/to/my/replays
@@ -122,40 +166,106 @@ def replay(api_key, shard, wins_only, latest, size, path, verbose, player_name):
         logger.setLevel("INFO")
     pubg = get_pubg(api_key, shard)
     player = pubg.players_from_names(player_name)[0]
-    for match_id in player.match_ids:
-        match = pubg.match(match_id)
+    match_ids = player.match_ids
+    if latest and not wins_only:
+        match_ids = match_ids[:1]
+    if latest and wins_only:
+        # Only the latest win is needed, so fetch matches one at a time and
+        # stop at the first win
+        matches = (_fetch_match(pubg, match_id) for match_id in match_ids)
+    else:
+        # Match requests are not rate limited, so fetch them concurrently up front
+        matches = pubg.matches(match_ids)
+    for match_id, match in zip(match_ids, matches):
         click.echo("Match ID: " + match_id)
+        if isinstance(match, Exception):
+            click.secho("Failed: " + match_id + " (" + str(match) + ")", fg="red")
+            continue
         if wins_only and player_name not in match.winner.player_names:
             continue
         else:
             click.secho("Downloading: " + match_id, fg="yellow")
             match_telemetry = match.get_telemetry()
             click.secho("Rendering: " + match_id, fg="yellow")
-            filename = os.path.join(
-                path, player_name + "_" + match.created_at.replace("-", "").replace(":", "") + "_" + match_id + ".html"
-            )
+            filename = replay_filename(path, player_name, match, output_format)
             match_telemetry.playback_animation(
-                filename,
-                zoom=True,
-                labels=True,
-                label_players=[player_name],
-                highlight_winner=True,
-                label_highlights=True,
-                size=size,
-                end_frames=60,
-                use_hi_res=False,
-                color_teams=False if "solo" in match.game_mode else True,
-                interpolate=True,
-                damage=True,
-                interval=2,
-                fps=30,
+                filename, fps=30, processes=processes, bitrate=bitrate, **replay_options(player_name, match, size)
             )
             click.secho("Saved: " + filename, fg="green")
             if latest:
                 break
 
 
+@click.command(short_help="Generate replay visualizations for many players")
+@click.option("--api-key", default=os.environ.get("PUBG_API_KEY", None), help="pubg api key(s), comma separated")
+@click.option("--shard", default="steam", help="pubg api shard")
+@click.option("-w", "--wins-only", is_flag=True, help="wins only")
+@click.option("-l", "--latest", is_flag=True, help="latest match only")
+@click.option("-s", "--size", default=6, help="render size")
+@click.option("-p", "--path", default=".", help="the path for new files")
+@click.option("-j", "--processes", default=None, type=int, help="number of processes to render with")
+@click.option("-d", "--downloads", default=MAX_WORKERS, help="number of concurrent telemetry downloads")
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    default="html",
+    type=click.Choice(["html", "mp4", "webm", "gif"]),
+    help="output format",
+)
+@click.option("--bitrate", default=None, type=int, help="video bitrate in kbps")
+@click.option("-v", "--verbose", is_flag=True, help="enable verbose logging")
+@click.argument("player_names", nargs=-1, required=True)
+def replay_batch(
+    api_key, shard, wins_only, latest, size, path, processes, downloads, output_format, bitrate, verbose, player_names
+):
+    """Generate html or video replays for the recent games of many players.
+
+    Telemetry downloads overlap with rendering, which runs in a pool of
+    processes. Replays which already exist in the path are skipped.
+
+    usage: $ chicken-dinner replay-batch --api-key=$PUBG_API_KEY -w -j 4 -f mp4 -p /path/to/my/replays chocoTaco shroud
+    """
+    try:
+        from chicken_dinner.visual.batch import ReplayBatch
+    except ModuleNotFoundError as exc:
+        print("Use `pip install chicken_dinner[visual]` " "for visualization dependencies.")
+        raise exc
+
+    if verbose:
+        logger = logging.getLogger()
+        logger.setLevel("INFO")
+    pubg = get_pubg(api_key, shard)
+    players = pubg.players_from_names(list(player_names))
+    match_ids = []
+    for player in players:
+        player_match_ids = player.match_ids[:1] if latest and not wins_only else player.match_ids
+        match_ids.extend(match_id for match_id in player_match_ids if match_id not in match_ids)
+    # Match requests are not rate limited, so fetch them concurrently up front
+    matches = dict(zip(match_ids, pubg.matches(match_ids)))
+
+    batch = ReplayBatch(processes=processes, download_workers=downloads, fps=30, bitrate=bitrate)
+    for player in players:
+        for match_id in player.match_ids:
+            match = matches.get(match_id)
+            if match is None:
+                continue
+            if isinstance(match, Exception):
+                click.secho("Failed: " + match_id + " (" + str(match) + ")", fg="red")
+                continue
+            if wins_only and player.name not in match.winner.player_names:
+                continue
+            filename = replay_filename(path, player.name, match, output_format)
+            batch.add(match, filename, **replay_options(player.name, match, size))
+            if latest:
+                break
+    click.secho("Rendering " + str(len(batch)) + " replays", fg="yellow")
+    batch_stats = batch.run()
+    click.secho(batch_stats.summary(), fg="green")
+
+
 cli.add_command(replay, name="replay")
+cli.add_command(replay_batch, name="replay-batch")
 cli.add_command(assets, name="assets")
 cli.add_command(leaderboard, name="leaderboard")
 cli.add_command(stats, name="stats")
@@ -78,6 +78,8 @@ SHARD_URL = BASE_URL + "/shards/"
 STATUS_URL = BASE_URL + "/status"
 TOURNAMENTS_URL = BASE_URL + "/tournaments"
 PLAYER_FILTERS = {"player_ids": "playerIds", "player_names": "playerNames"}
+# Max number of player ids or names per players request
+MAX_PLAYER_FILTERS = 10
 SHARDS = [
     # platform
     "kakao",
@@ -109,9 +111,195 @@ SHARDS = [
     "xbox-sa",
 ]
 
+# Default max number of concurrent requests for bulk fetches
+MAX_WORKERS = 8
+
 # First season in which pc games are consolidated into one shard
 TRANSITION_SEASON = "division.bro.official.pc-2018-01"
 
+# Known keys of telemetry events and objects
+TELEMETRY_KEYS = (
+    "MatchId",
+    "PingQuality",
+    "SeasonState",
+    "accountId",
+    "additionalInfo",
+    "altitudeAbs",
+    "altitudeRel",
+    "assistant",
+    "attachedItems",
+    "attackId",
+    "attackType",
+    "attacker",
+    "blueZoneCustomOptions",
+    "cameraViewBehaviour",
+    "carePackageUniqueId",
+    "carryState",
+    "category",
+    "character",
+    "characters",
+    "childItem",
+    "circleAlgorithm",
+    "common",
+    "creatorAccountId",
+    "dBNODamageInfo",
+    "dBNOId",
+    "dBNOMaker",
+    "damage",
+    "damageCauserAdditionalInfo",
+    "damageCauserName",
+    "damageReason",
+    "damageTypeCategory",
+    "distance",
+    "distanceOnFoot",
+    "distanceOnFreefall",
+    "distanceOnParachute",
+    "distanceOnSwim",
+    "distanceOnVehicle",
+    "drivers",
+    "elapsedTime",
+    "fellowPassengers",
+    "feulPercent",
+    "finishDamageInfo",
+    "finisher",
+    "fireCount",
+    "fireWeaponStackCount",
+    "gameResult",
+    "gameResultOnFinished",
+    "gameState",
+    "healAmount",
+    "health",
+    "healthPercent",
+    "individualRanking",
+    "instigator",
+    "isAttackerInVehicle",
+    "isCustomGame",
+    "isEngineOn",
+    "isEventMode",
+    "isGame",
+    "isInBlueZone",
+    "isInRedZone",
+    "isInWaterVolume",
+    "isLedgeGrab",
+    "isSuicide",
+    "isThroughPenetrableWall",
+    "isWheelsInAir",
+    "item",
+    "itemId",
+    "itemPackage",
+    "itemPackageId",
+    "items",
+    "killCount",
+    "killer",
+    "killerDamageInfo",
+    "landRatio",
+    "location",
+    "mapName",
+    "maxSpeed",
+    "maxSwimDepthOfWater",
+    "name",
+    "numAlivePlayers",
+    "numAliveTeams",
+    "numJoinPlayers",
+    "numStartPlayers",
+    "objectLocation",
+    "objectType",
+    "ownerTeamId",
+    "parentItem",
+    "phase",
+    "phaseNum",
+    "poisonGasDamagePerSecond",
+    "poisonGasWarningPosition",
+    "poisonGasWarningRadius",
+    "radiusRate",
+    "rank",
+    "ranking",
+    "redZonePosition",
+    "redZoneRadius",
+    "releaseDuration",
+    "results",
+    "reviver",
+    "rideDistance",
+    "riders",
+    "safetyZonePosition",
+    "safetyZoneRadius",
+    "seatIndex",
+    "spreadRatio",
+    "stackCount",
+    "startDelay",
+    "stats",
+    "subCategory",
+    "survivors",
+    "swimDistance",
+    "teamId",
+    "teamSize",
+    "type",
+    "vehicle",
+    "vehicleId",
+    "vehicleType",
+    "vehicleUniqueId",
+    "velocity",
+    "victim",
+    "victimGameResult",
+    "victimWeapon",
+    "victimWeaponAdditionalInfo",
+    "wall",
+    "warningDuration",
+    "weaponId",
+    "weapon",
+    "weatherId",
+    "x",
+    "y",
+    "z",
+    "zone",
+)
+
+# Known keys of participant, roster, player-season and leaderboard stats
+STATS_KEYS = (
+    "assists",
+    "averageDamage",
+    "averageRank",
+    "bestRankPoint",
+    "boosts",
+    "dailyKills",
+    "dailyWaterKills",
+    "damageDealt",
+    "days",
+    "deathType",
+    "games",
+    "headshotKills",
+    "heals",
+    "killDeathRatio",
+    "killPlace",
+    "killStreaks",
+    "kills",
+    "longestKill",
+    "longestTimeSurvived",
+    "losses",
+    "maxKillStreaks",
+    "mostSurvivalTime",
+    "playerId",
+    "rankPoints",
+    "rankPointsTitle",
+    "revives",
+    "roadKills",
+    "roundMostKills",
+    "roundsPlayed",
+    "suicides",
+    "teamKills",
+    "timeSurvived",
+    "vehicleDestroys",
+    "walkDistance",
+    "waterKills",
+    "weaponsAcquired",
+    "weeklyKills",
+    "weeklyWaterKills",
+    "winPlace",
+    "winPoints",
+    "wins",
+    "won",
+)
+
 COLORS = [
     "#fc3f3f",
     "#d93636",
@@ -0,0 +1,186 @@
+"""Samples crawler."""
+import datetime
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from chicken_dinner.constants import MAX_WORKERS
+from chicken_dinner.store import TelemetryStore
+
+#: The time span covered by each samples request
+SAMPLES_WINDOW = datetime.timedelta(hours=24)
+#: The oldest samples available from the API
+SAMPLES_MAX_AGE = datetime.timedelta(days=14)
+# Margin so that the oldest start isn't too old by the time it is requested
+SAMPLES_MARGIN = datetime.timedelta(hours=1)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+#: The max number of attempts to fetch a match
+MAX_ATTEMPTS = 3
+CHECKPOINT_VERSION = 1
+
+
+class SamplesCrawler(object):
+    """Incremental crawler for the samples endpoint.
+
+    Walks consecutive ``filter[createdAt-start]`` windows of the samples
+    endpoint for each shard, from the oldest available samples up to the most
+    recent complete window. The matches of each window which are not already
+    in the telemetry store are fetched concurrently, and their telemetry is
+    added to the store. Match and telemetry requests do not apply to the rate
+    limit, so only the samples requests are rate limited.
+
+    Progress is saved to a JSON checkpoint file after each window, so that a
+    crawl can be stopped and resumed at any time. Matches which could not be
+    fetched are recorded in the checkpoint and retried with the following
+    windows, until they have been attempted ``max_attempts`` times.
+
+    :param pubg: a :class:`chicken_dinner.pubgapi.PUBG` instance
+    :param store: a :class:`chicken_dinner.store.TelemetryStore` instance, or
+        a path for one
+    :param str checkpoint: the path of the checkpoint file
+    :param list shards: (optional) the shards to crawl, by default the
+        instance shard of ``pubg``
+    :param int max_workers: the max number of concurrent match and telemetry
+        downloads
+    :param datetime.timedelta window: the time span of each samples window
+    :param int max_attempts: the max number of attempts to fetch a match
+        before giving up on it
+    """
+
+    def __init__(
+        self,
+        pubg,
+        store,
+        checkpoint,
+        shards=None,
+        max_workers=MAX_WORKERS,
+        window=SAMPLES_WINDOW,
+        max_attempts=MAX_ATTEMPTS,
+    ):
+        self._pubg = pubg
+        if isinstance(store, str):
+            store = TelemetryStore(store)
+        #: The telemetry store
+        self.store = store
+        #: The path of the checkpoint file
+        self.checkpoint = checkpoint
+        #: The shards to crawl
+        self.shards = shards or [pubg.shard]
+        #: The max number of concurrent downloads
+        self.max_workers = max_workers
+        #: The time span of each samples window
+        self.window = window
+        #: The max number of attempts to fetch a match
+        self.max_attempts = max_attempts
+        self._state = self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint, "r") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {"version": CHECKPOINT_VERSION, "shards": {}}
+        for shard in self.shards:
+            state["shards"].setdefault(shard, {"next_start": None, "failed": {}})
+        return state
+
+    def _save_checkpoint(self):
+        tmp = self.checkpoint + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._state, f)
+        os.replace(tmp, self.checkpoint)
+
+    def next_start(self, shard):
+        """The start of the next window to crawl for a shard.
+
+        :param str shard: the shard
+        :return: a UTC :class:`datetime.datetime`
+        """
+        now = datetime.datetime.utcnow().replace(microsecond=0)
+        oldest = now - SAMPLES_MAX_AGE + SAMPLES_MARGIN
+        next_start = self._state["shards"][shard]["next_start"]
+        if next_start is None:
+            return oldest
+        return max(datetime.datetime.strptime(next_start, TIMESTAMP_FORMAT), oldest)
+
+    def _window_available(self, shard):
+        return self.next_start(shard) + self.window <= datetime.datetime.utcnow()
+
+    def _ingest(self, match_id, shard):
+        try:
+            if match_id not in self.store:
+                match = self._pubg.match(match_id, shard)
+                self.store.fetch(self._pubg, match_id, shard, telemetry_url=match.telemetry_url)
+        except Exception as exc:
+            logging.warning("Failed to fetch match " + match_id + ": " + str(exc))
+            return False
+        return True
+
+    def crawl_window(self, shard):
+        """Crawl the next window of samples for a shard.
+
+        :param str shard: the shard
+        :return: the list of match ids which were added to the store, or
+            ``None`` if the next window is not yet complete
+        """
+        if not self._window_available(shard):
+            return None
+        start = self.next_start(shard)
+        samples = self._pubg.samples(start.strftime(TIMESTAMP_FORMAT), shard)
+        shard_state = self._state["shards"][shard]
+        # The number of failed attempts to fetch each match
+        failed = shard_state["failed"]
+        match_ids = list(dict.fromkeys(list(failed) + samples.match_ids))
+        match_ids = [match_id for match_id in match_ids if match_id not in self.store]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda match_id: self._ingest(match_id, shard), match_ids))
+
+        added = [match_id for match_id, ok in zip(match_ids, results) if ok]
+        shard_state["failed"] = {}
+        for match_id, ok in zip(match_ids, results):
+            if ok:
+                continue
+            attempts = failed.get(match_id, 0) + 1
+            if attempts < self.max_attempts:
+                shard_state["failed"][match_id] = attempts
+            else:
+                logging.warning("Giving up on match " + match_id + " after " + str(attempts) + " attempts.")
+        shard_state["next_start"] = (start + self.window).strftime(TIMESTAMP_FORMAT)
+        self._save_checkpoint()
+        logging.info(
+            "Crawled {} samples from {}: {} added, {} failed.".format(
+                shard, start.strftime(TIMESTAMP_FORMAT), len(added), len(shard_state["failed"])
+            )
+        )
+        return added
+
+    def crawl(self):
+        """Crawl every complete window of samples for each shard.
+
+        :return: the list of match ids which were added to the store
+        """
+        added = []
+        pending = list(self.shards)
+        while pending:
+            for shard in list(pending):
+                match_ids = self.crawl_window(shard)
+                if match_ids is None:
+                    pending.remove(shard)
+                else:
+                    added.extend(match_ids)
+        return added
+
+    def run(self):
+        """Continuously crawl samples as new windows become available.
+
+        Runs until interrupted.
+        """
+        while True:
+            self.crawl()
+            next_window = min(self.next_start(shard) + self.window for shard in self.shards)
+            sleep_duration = max((next_window - datetime.datetime.utcnow()).total_seconds(), 1)
+            logging.info("Waiting " + str(int(sleep_duration)) + " seconds for new samples.")
+            time.sleep(sleep_duration)
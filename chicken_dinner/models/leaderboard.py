@@ -13,13 +13,16 @@ class Leaderboard(object):
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
     :param str game_mode: the game mode for the leaderboard
     :param str shard: the shard for the seasons response
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, game_mode, shard=None):
+    def __init__(self, pubg, game_mode, shard=None, response=None):
         self._shard = shard
         self._game_mode = game_mode
         self._pubg = pubg
-        self.response = self._pubg._core.leaderboard(game_mode)
+        if response is None:
+            response = self._pubg._core.leaderboard(game_mode)
+        self.response = response
         self._rank_to_index = {p["attributes"]["rank"]: idx for idx, p in enumerate(self.response["included"])}
 
     @property
@@ -11,15 +11,18 @@ class Match(object):
     :param pubg: a PUBG instance
     :param str match_id: the ``match_id`` for this match
     :param str shard: the shard for this match
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, match_id, shard=None):
+    def __init__(self, pubg, match_id, shard=None, response=None):
         self._pubg = pubg
         self._shard = shard
         #: The match id for this match
         self.match_id = match_id
+        if response is None:
+            response = self._pubg._core.match(match_id, shard)
         #: The API response for this object
-        self.response = self._pubg._core.match(match_id, shard)
+        self.response = response
         self.roster_to_participant = {}
         self.participant_to_roster = {}
         self._participant_data = {}
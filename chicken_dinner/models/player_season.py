@@ -13,19 +13,21 @@ class PlayerSeason(object):
     :param str player_id: the player's account id
     :param str season_id: a season id for the player data
     :param str shard: the shard for the seasons response
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, player_id, season_id, shard=None):
+    def __init__(self, pubg, player_id, season_id, shard=None, response=None):
         self._pubg = pubg
         self._shard = shard
         self._player_id = player_id
         self._season_id = season_id
+        if response is None:
+            if season_id == "lifetime":
+                response = self._pubg._core.lifetime(player_id, shard)
+            else:
+                response = self._pubg._core.player_season(player_id, season_id, shard)
         #: The API response for this object.
-        self.response = None
-        if season_id == "lifetime":
-            self.response = self._pubg._core.lifetime(player_id, shard)
-        else:
-            self.response = self._pubg._core.player_season(player_id, season_id, shard)
+        self.response = response
 
     @property
     def shard(self):
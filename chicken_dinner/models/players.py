@@ -1,34 +1,111 @@
 """Players filtered results model."""
+from chicken_dinner.constants import MAX_PLAYER_FILTERS
 from chicken_dinner.models.player import Player
 
 
+def _is_not_found(exc):
+    # A 404 from the requests or aiohttp client
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status == 404 or getattr(exc, "status", None) == 404
+
+
 class Players(object):
     """Players model.
 
     An iterable containing multiple instances of the class
     :class:`chicken_dinner.models.Player`.
 
+    The API accepts at most 10 ids or names per request, so longer lists are
+    deduplicated and split into as few requests as possible, and the
+    responses are merged. A chunk with no matching players (404) contributes
+    no players, and only if no chunk matches is the error raised.
+
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
     :param str filter_type: either "player_ids" or "player_names"
     :param list filter_value: a list of ``player_ids`` or ``player_names``
-        corresponding to the ``filter_type`` parameter
+        corresponding to the ``filter_type`` parameter, or a comma separated
+        string of them
     :param str shard: the shard for the seasons response
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, filter_type, filter_value, shard=None):
+    def __init__(self, pubg, filter_type, filter_value, shard=None, response=None):
         self._pubg = pubg
         self._shard = shard
         #: The filter type for this Players query
         self.filter_type = filter_type
         #: The filter value for this Players query
         self.filter_value = filter_value
+        if response is None:
+            responses = []
+            for chunk in self.chunk_filter_value(filter_value):
+                try:
+                    responses.append(self._pubg._core.players(filter_type, chunk, shard))
+                except Exception as exc:
+                    if not _is_not_found(exc):
+                        raise
+                    responses.append(exc)
+            response = self.merge_responses(responses)
         #: The API response for this object
-        self.response = self._pubg._core.players(filter_type, filter_value, shard)
+        self.response = response
         self._players = [Player.from_data(pubg, p, shard=shard) for p in self.data]
 
     def __getitem__(self, idx):
         return self._players[idx]
 
+    def __len__(self):
+        return len(self._players)
+
+    @staticmethod
+    def chunk_filter_value(filter_value):
+        """Split player ids or names into chunks for separate requests.
+
+        :param filter_value: a list of ``player_ids`` or ``player_names``, or
+            a comma separated string of them
+        :return: a list of lists of at most ``MAX_PLAYER_FILTERS`` unique
+            values
+        """
+        if isinstance(filter_value, str):
+            filter_value = filter_value.split(",")
+        values = list(dict.fromkeys(filter_value))
+        return [values[i : i + MAX_PLAYER_FILTERS] for i in range(0, len(values), MAX_PLAYER_FILTERS)]
+
+    @staticmethod
+    def merge_responses(responses):
+        """Merge the responses of chunked players requests.
+
+        The ``data`` of every response is concatenated and their ``meta`` is
+        merged. ``links`` are those of the first response, since the links of
+        the others only point to their own chunk of the request.
+
+        :param list responses: the players responses, or the exceptions
+            raised by requests which failed. Requests for which no players
+            were found (404) are skipped, and any other exception is raised.
+        :return: a single response containing the players of every response
+        """
+        not_found = None
+        found = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                if not _is_not_found(response):
+                    raise response
+                not_found = response
+            else:
+                found.append(response)
+        if not found:
+            if not_found is not None:
+                raise not_found
+            return {"data": []}
+        if len(found) == 1:
+            return found[0]
+        merged = dict(found[0])
+        merged["data"] = [player for response in found for player in response["data"]]
+        meta = {}
+        for response in found:
+            meta.update(response.get("meta") or {})
+        merged["meta"] = meta
+        return merged
+
     @property
     def shard(self):
         """The shard for this player."""
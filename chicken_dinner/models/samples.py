@@ -10,15 +10,18 @@ class Samples(object):
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
     :param start: (optional) the timestamp from which samples are generated
     :param shard: the shard for the samples response
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, start=None, shard=None):
+    def __init__(self, pubg, start=None, shard=None, response=None):
         self._pubg = pubg
         self._shard = shard
         #: The start timestamp for this set of samples
         self.start = start
+        if response is None:
+            response = self._pubg._core.samples(start, shard)
         #: The API response for this object
-        self.response = self._pubg._core.samples(start, shard)
+        self.response = response
 
     @property
     def shard(self):
@@ -10,13 +10,16 @@ class Seasons(object):
 
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
     :param shard: the shard for the seasons response
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, shard=None):
+    def __init__(self, pubg, shard=None, response=None):
         self._pubg = pubg
         self._shard = shard
+        if response is None:
+            response = self._pubg._core.seasons(self.shard)
         #: The API response for this object
-        self.response = self._pubg._core.seasons(self.shard)
+        self.response = response
         self._seasons = [Season(self._pubg, s, self.shard) for s in self.data]
 
     def __getitem__(self, idx):
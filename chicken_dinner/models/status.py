@@ -8,12 +8,15 @@ class Status(object):
     Contains information about the status of the PUBG API.
 
     :param pubg: an instance of the :class:`chicken_dinner.pubgapi.PUBG` class
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg):
+    def __init__(self, pubg, response=None):
         self._pubg = pubg
+        if response is None:
+            response = self._pubg._core.status()
         #: The API response for this object
-        self.response = self._pubg._core.status()
+        self.response = response
 
     @property
     def data(self):
@@ -1,3 +1,5 @@
+from chicken_dinner.models.telemetry.events import LazyTelemetryEvent
 from chicken_dinner.models.telemetry.events import TelemetryEvent
+from chicken_dinner.models.telemetry.objects import LazyTelemetryObject
 from chicken_dinner.models.telemetry.objects import TelemetryObject
 from chicken_dinner.models.telemetry.telemetry import Telemetry
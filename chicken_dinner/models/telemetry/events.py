@@ -2,6 +2,8 @@
 import json
 
 from chicken_dinner.constants import asset_map
+from chicken_dinner.models.telemetry.objects import SHADOWED_KEYS
+from chicken_dinner.models.telemetry.objects import LazyTelemetryObject
 from chicken_dinner.models.telemetry.objects import TelemetryObject
 from chicken_dinner.util import camel_to_snake
 from chicken_dinner.util import remove_from_dict
@@ -87,3 +89,93 @@ class TelemetryEvent(object):
             if k[0] == "_":
                 continue
             yield k, v
+
+
+class LazyTelemetryEvent(TelemetryEvent):
+    """Lazily evaluated telemetry event model.
+
+    Provides the same interface as
+    :class:`chicken_dinner.models.telemetry.TelemetryEvent`, but keeps the
+    raw JSON object data and only snake-cases keys and wraps embedded objects
+    when an attribute is first accessed. Constructing events is nearly free,
+    which suits analyses that only touch a handful of fields.
+
+    :param dict data: the JSON object data associated with the telemetry event
+    :param bool map_assets: whether to map asset ids to asset names
+    """
+
+    def __init__(self, data, map_assets=False):
+        self._data = data
+        self._map_assets = map_assets
+        self._keymap = None
+        # Keys which would otherwise be shadowed by methods are set eagerly
+        for k in SHADOWED_KEYS:
+            if k in data:
+                setattr(self, k, self._convert(k, data[k]))
+
+    def __getattr__(self, name):
+        if name in ("_D", "_T", "_V"):
+            try:
+                value = self._data[name]
+            except KeyError:
+                raise AttributeError(name)
+            return asset_map.get(value, value) if self._map_assets else value
+        if name[0] == "_":
+            raise AttributeError(name)
+        try:
+            key = self._snake_keys()[name]
+        except KeyError:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        value = self._convert(key, self._data[key])
+        # Cache the converted value as a regular instance attribute
+        setattr(self, name, value)
+        return value
+
+    def _value(self, name):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            return self.__getattr__(name)
+
+    def _snake_keys(self):
+        if self._keymap is None:
+            self._keymap = {camel_to_snake(k): k for k in self._data if k not in ("_D", "_T", "_V")}
+        return self._keymap
+
+    def _convert(self, k, v):
+        map_assets = self._map_assets
+        if isinstance(v, dict):
+            return LazyTelemetryObject(v, k, map_assets)
+        elif isinstance(v, list):
+            if len(v) > 0 and isinstance(v[0], dict):
+                return [LazyTelemetryObject(e, k, map_assets) for e in v]
+            elif map_assets:  # Sometimes the list is just a list of strings (damageCauserAdditionalInfo)
+                return [asset_map.get(e, e) for e in v]
+            return v
+        elif k == "blueZoneCustomOptions":  # serialized json
+            return [LazyTelemetryObject(e, k, map_assets) for e in json.loads(v)]
+        elif map_assets:
+            return asset_map.get(v, v)
+        return v
+
+    def _materialize(self):
+        d = {k: getattr(self, k) for k in ("_D", "_T", "_V") if k in self._data}
+        d.update({k: self._value(k) for k in self._snake_keys()})
+        return d
+
+    def dumps(self):
+        """Serialize the event to a JSON string."""
+        return json.dumps(self, default=lambda x: x._materialize(), sort_keys=True, indent=4)
+
+    def keys(self):
+        """Get all attributes names."""
+        return list(self._snake_keys())
+
+    def values(self):
+        """Get all attribute values."""
+        return [self._value(k) for k in self._snake_keys()]
+
+    def items(self):
+        """Iterate through the attributes dictionary."""
+        for k in self._snake_keys():
+            yield k, self._value(k)
@@ -0,0 +1,151 @@
+"""Columnar telemetry arrays."""
+import numpy as np
+
+
+class TelemetryFrame(object):
+    """Columnar telemetry model.
+
+    Extracts typed NumPy columns for player positions, player damages and
+    circle positions from a telemetry instance in a single pass over the
+    relevant events, for use in vectorized analytics.
+
+    Each table is a dict of equal length one-dimensional arrays. The ``t``
+    column of every table is the number of seconds elapsed since the match
+    started, which is negative for pre-game events. Player columns hold
+    indices into the ``players`` list, with ``-1`` for a missing player
+    (e.g. environmental damage). Missing coordinates are ``nan``.
+
+    :param telemetry: a :class:`chicken_dinner.models.telemetry.Telemetry`
+        instance
+    """
+
+    def __init__(self, telemetry):
+        self._telemetry = telemetry
+        #: Player names, indexed by the player columns of each table
+        self.players = []
+        self._player_index = {}
+        for player in telemetry.player_names():
+            self._index(player)
+        #: Player position columns ``t``, ``player``, ``x``, ``y``, ``z``,
+        #: ``health``, ``ranking`` and ``elapsed_time``
+        self.positions = self._extract_positions()
+        #: Player damage columns ``t``, ``attacker``, ``victim``,
+        #: ``attack_id``, ``damage``, ``attacker_x``, ``attacker_y``,
+        #: ``attacker_z``, ``victim_x``, ``victim_y`` and ``victim_z``
+        self.damages = self._extract_damages()
+        #: Circle position columns ``t`` and ``{color}_x``, ``{color}_y``,
+        #: ``{color}_z``, ``{color}_radius`` for each of the circle colors
+        #: "white", "blue" and "red"
+        self.circles = self._extract_circles()
+
+    def __len__(self):
+        return len(self.positions["t"])
+
+    def _index(self, player):
+        if player not in self._player_index:
+            self._player_index[player] = len(self.players)
+            self.players.append(player)
+        return self._player_index[player]
+
+    def _extract_positions(self):
+        events = self._telemetry._filter_elapsed("log_player_position")
+        columns = {
+            "t": [],
+            "player": [],
+            "x": [],
+            "y": [],
+            "z": [],
+            "health": [],
+            "ranking": [],
+            "elapsed_time": [],
+        }
+        for dt, event in events:
+            character = event.character
+            columns["t"].append(dt)
+            columns["player"].append(self._index(character.name))
+            columns["x"].append(character.location.x)
+            columns["y"].append(character.location.y)
+            columns["z"].append(character.location.z)
+            columns["health"].append(character.health)
+            columns["ranking"].append(character.ranking)
+            columns["elapsed_time"].append(event.elapsed_time)
+        return {
+            "t": np.array(columns["t"], dtype=np.float64),
+            "player": np.array(columns["player"], dtype=np.int32),
+            "x": np.array(columns["x"], dtype=np.float64),
+            "y": np.array(columns["y"], dtype=np.float64),
+            "z": np.array(columns["z"], dtype=np.float64),
+            "health": np.array(columns["health"], dtype=np.float64),
+            "ranking": np.array(columns["ranking"], dtype=np.int32),
+            "elapsed_time": np.array(columns["elapsed_time"], dtype=np.float64),
+        }
+
+    def _extract_damages(self):
+        attackers = {}
+        for event in self._telemetry.filter_by("log_player_attack"):
+            attackers[event.attack_id] = event.attacker
+
+        names = ("t", "attacker", "victim", "attack_id", "damage")
+        coords = ("attacker_x", "attacker_y", "attacker_z", "victim_x", "victim_y", "victim_z")
+        columns = {name: [] for name in names + coords}
+        nan = float("nan")
+        for dt, event in self._telemetry._filter_elapsed("log_player_take_damage"):
+            attacker = getattr(event, "attacker", None)
+            attacker_name = getattr(attacker, "name", "")
+            attack_location = getattr(attackers.get(event.attack_id), "location", None)
+            columns["t"].append(dt)
+            columns["attacker"].append(self._index(attacker_name) if attacker_name else -1)
+            columns["victim"].append(self._index(event.victim.name))
+            columns["attack_id"].append(event.attack_id)
+            columns["damage"].append(event.damage)
+            if attack_location is not None:
+                columns["attacker_x"].append(attack_location.x)
+                columns["attacker_y"].append(attack_location.y)
+                columns["attacker_z"].append(attack_location.z)
+            else:
+                columns["attacker_x"].append(nan)
+                columns["attacker_y"].append(nan)
+                columns["attacker_z"].append(nan)
+            columns["victim_x"].append(event.victim.location.x)
+            columns["victim_y"].append(event.victim.location.y)
+            columns["victim_z"].append(event.victim.location.z)
+        arrays = {
+            "t": np.array(columns["t"], dtype=np.float64),
+            "attacker": np.array(columns["attacker"], dtype=np.int32),
+            "victim": np.array(columns["victim"], dtype=np.int32),
+            "attack_id": np.array(columns["attack_id"], dtype=np.int64),
+            "damage": np.array(columns["damage"], dtype=np.float64),
+        }
+        for name in coords:
+            arrays[name] = np.array(columns[name], dtype=np.float64)
+        return arrays
+
+    def _extract_circles(self):
+        circles = (
+            ("white", "poison_gas_warning_position", "poison_gas_warning_radius"),
+            ("blue", "safety_zone_position", "safety_zone_radius"),
+            ("red", "red_zone_position", "red_zone_radius"),
+        )
+        columns = {"t": []}
+        for color, _, _ in circles:
+            for suffix in ("_x", "_y", "_z", "_radius"):
+                columns[color + suffix] = []
+        for dt, event in self._telemetry._filter_elapsed("log_game_state_periodic"):
+            game_state = event.game_state
+            columns["t"].append(dt)
+            for color, position, radius in circles:
+                location = getattr(game_state, position)
+                columns[color + "_x"].append(location.x)
+                columns[color + "_y"].append(location.y)
+                columns[color + "_z"].append(location.z)
+                columns[color + "_radius"].append(getattr(game_state, radius))
+        return {name: np.array(values, dtype=np.float64) for name, values in columns.items()}
+
+    def player_positions(self, player):
+        """Get the position columns for a single player.
+
+        :param str player: the player name
+        :return: a dict of position columns filtered on the player
+        """
+        mask = self.positions["player"] == self._player_index[player]
+        return {name: column[mask] for name, column in self.positions.items()}
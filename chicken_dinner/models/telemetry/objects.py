@@ -5,6 +5,9 @@ from chicken_dinner.constants import asset_map
 from chicken_dinner.util import camel_to_snake
 from chicken_dinner.util import remove_from_dict
 
+# Raw keys whose snake cased names collide with the model methods
+SHADOWED_KEYS = ("items", "keys", "values")
+
 
 class TelemetryObject(object):
     """Telemetry object model.
@@ -68,3 +71,88 @@ class TelemetryObject(object):
             if k[0] == "_":
                 continue
             yield k, v
+
+
+class LazyTelemetryObject(TelemetryObject):
+    """Lazily evaluated telemetry object model.
+
+    Provides the same interface as
+    :class:`chicken_dinner.models.telemetry.TelemetryObject`, but keeps the
+    raw JSON object data and only snake-cases keys and wraps embedded objects
+    when an attribute is first accessed.
+
+    :param dict data: the JSON object data associated with the telemetry object
+    :param str reference: the key from the parent object that refernces this object
+    :param bool map_assets: whether to map asset ids to asset names
+    """
+
+    def __init__(self, data, reference, map_assets=False):
+        self._data = data
+        self._reference = reference
+        self._map_assets = map_assets
+        self._keymap = None
+        # Keys which would otherwise be shadowed by methods are set eagerly
+        for k in SHADOWED_KEYS:
+            if k in data:
+                setattr(self, k, self._convert(k, data[k]))
+
+    def __getattr__(self, name):
+        if name[0] == "_":
+            raise AttributeError(name)
+        try:
+            key = self._snake_keys()[name]
+        except KeyError:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        value = self._convert(key, self._data[key])
+        # Cache the converted value as a regular instance attribute
+        setattr(self, name, value)
+        return value
+
+    @property
+    def reference(self):
+        """The key name that references this object."""
+        return camel_to_snake(self._reference)
+
+    def _value(self, name):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            return self.__getattr__(name)
+
+    def _snake_keys(self):
+        if self._keymap is None:
+            self._keymap = {camel_to_snake(k): k for k in self._data}
+        return self._keymap
+
+    def _convert(self, k, v):
+        map_assets = self._map_assets
+        if isinstance(v, dict):
+            return LazyTelemetryObject(v, k, map_assets)
+        elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
+            return [LazyTelemetryObject(e, k, map_assets) for e in v]
+        elif map_assets:
+            if isinstance(v, list):
+                return [asset_map.get(e, e) for e in v]
+            return asset_map.get(v, v)
+        return v
+
+    def _materialize(self):
+        return {k: self._value(k) for k in self._snake_keys()}
+
+    def dumps(self):
+        """Serialize the event object to a JSON string."""
+        return json.dumps(self, default=lambda x: x._materialize(), sort_keys=True, indent=4)
+
+    def keys(self):
+        """Get all attributes names."""
+        return ["reference"] + list(self._snake_keys())
+
+    def values(self):
+        """Get all attribute values."""
+        return [self.reference] + [self._value(k) for k in self._snake_keys()]
+
+    def items(self):
+        """Iterate through the attributes dictionary."""
+        yield "reference", self.reference
+        for k in self._snake_keys():
+            yield k, self._value(k)
@@ -1,9 +1,10 @@
 """Telemetry class."""
-import datetime
-
 from chicken_dinner.constants import map_name_to_map
 from chicken_dinner.constants import map_to_map_name
+from chicken_dinner.models.telemetry.events import LazyTelemetryEvent
 from chicken_dinner.models.telemetry.events import TelemetryEvent
+from chicken_dinner.util import camel_to_snake
+from chicken_dinner.util import parse_timestamp
 
 
 class Telemetry(object):
@@ -15,9 +16,12 @@ class Telemetry(object):
     :param str shard: the shard for the match associated with this telemetry
     :param bool map_assets: whether to map asset ids to named values, e.g.
         map ``Item_Weapon_AK47_C`` to ``AKM``.
+    :param bool lazy: (default=*False*) whether to construct
+        :class:`chicken_dinner.models.telemetry.LazyTelemetryEvent` objects,
+        which convert event attributes only when they are first accessed
     """
 
-    def __init__(self, pubg, url, telemetry_json=None, shard=None, map_assets=False):
+    def __init__(self, pubg, url, telemetry_json=None, shard=None, map_assets=False, lazy=False):
         self._pubg = pubg
         self._shard = shard
         #: Whether asset ids are mapped to names
@@ -27,8 +31,21 @@ class Telemetry(object):
             self.response = telemetry_json
         else:
             self.response = self._pubg._core.telemetry(url)
+        #: Whether events are lazily evaluated
+        self.lazy = lazy
+        event_class = LazyTelemetryEvent if lazy else TelemetryEvent
         #: Snake cased object-attribute models for telemetry events and objects
-        self.events = [TelemetryEvent(e, map_assets) for e in self.response]
+        self.events = [event_class(e, map_assets) for e in self.response]
+        # Index event positions by event type so lookups don't scan all events
+        index = {}
+        for idx, event in enumerate(self.events):
+            try:
+                index[event._T].append(idx)
+            except KeyError:
+                index[event._T] = [idx]
+        self._event_index = {camel_to_snake(event_type): idx for event_type, idx in index.items()}
+        self._timestamps = None
+        self._match_start = None
         if getattr(self.events[-1], "common", None) is not None:
             #: The platform for this game, "pc" or "xbox"
             self.platform = "pc"
@@ -49,7 +66,7 @@ class Telemetry(object):
 
     def event_types(self):
         """A sorted list of event type names from this telemetry."""
-        return sorted(list(set([e.event_type for e in self.events])))
+        return sorted(self._event_index)
 
     def filter_by(self, event_type=None):
         """Get a list of telemetry events for a specific event type.
@@ -57,34 +74,52 @@ class Telemetry(object):
         :param event_type: the event type to filter
         """
         if event_type is not None:
-            events = [event for event in self.events if event.event_type == event_type]
+            events = [self.events[idx] for idx in self._event_index.get(event_type, [])]
         else:
             events = [event for event in self.events]
 
         return events
 
+    def _event_timestamps(self):
+        # Each event timestamp is parsed once, in microseconds since the epoch
+        if self._timestamps is None:
+            self._timestamps = [parse_timestamp(event.timestamp) for event in self.events]
+        return self._timestamps
+
+    def _filter_elapsed(self, event_type, start=None):
+        """Get events of a type paired with the seconds elapsed since start.
+
+        :param str event_type: the event type to filter
+        :param int start: (optional) the anchor timestamp in microseconds
+            since the epoch. Defaults to the start of the match.
+        :return: a list of ``(elapsed, event)`` tuples
+        """
+        timestamps = self._event_timestamps()
+        if start is None:
+            if self._match_start is None:
+                self._match_start = timestamps[self._event_index.get("log_match_start", [])[0]]
+            start = self._match_start
+        return [((timestamps[idx] - start) / 1e6, self.events[idx]) for idx in self._event_index.get(event_type, [])]
+
     def player_ids(self):
         """The account ids of all players in the match."""
         accounts = []
-        for event in self.events:
-            if event.event_type == "log_player_login":
-                accounts.append(event.account_id)
+        for event in self.filter_by("log_player_login"):
+            accounts.append(event.account_id)
         return accounts
 
     def players(self):
         """A map of player names to account ids for all players this match."""
         players = {}
-        for event in self.events:
-            if event.event_type == "log_player_create":
-                players[event.character.name] = event.character.account_id
+        for event in self.filter_by("log_player_create"):
+            players[event.character.name] = event.character.account_id
         return players
 
     def player_names(self):
         """A list of player names for all match pariticipants."""
         player_names = []
-        for event in self.events:
-            if event.event_type == "log_player_create":
-                player_names.append(event.character.name)
+        for event in self.filter_by("log_player_create"):
+            player_names.append(event.character.name)
         return player_names
 
     def damage_done(self, player=None, combat_only=True, distribution=False):
@@ -96,12 +131,8 @@ class Telemetry(object):
             damage for the match if true. if false return total damage done
             by each player. (default False)
         """
-        start = datetime.datetime.strptime(self.filter_by("log_match_start")[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
         damage = {}
-        damage_events = self.filter_by("log_player_take_damage")
-        for event in damage_events:
-            timestamp = datetime.datetime.strptime(event.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-            dt = (timestamp - start).total_seconds()
+        for dt, event in self._filter_elapsed("log_player_take_damage"):
             if dt < 0 or event.attack_id == -1:
                 continue
             victim = event.victim.name
@@ -137,12 +168,8 @@ class Telemetry(object):
             damage for the match if true. if false return total damage taken
             by each player. (default False)
         """
-        start = datetime.datetime.strptime(self.filter_by("log_match_start")[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
         damage = {}
-        damage_events = self.filter_by("log_player_take_damage")
-        for event in damage_events:
-            timestamp = datetime.datetime.strptime(event.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-            dt = (timestamp - start).total_seconds()
+        for dt, event in self._filter_elapsed("log_player_take_damage"):
             if dt < 0 or event.attack_id == -1:
                 continue
             victim = event.victim.name
@@ -172,18 +199,17 @@ class Telemetry(object):
     def rosters(self):
         """The team rosters for the match."""
         rosters = {}
-        for event in self.events[::-1]:
-            if event.event_type == "log_match_end":
-                for player in event.characters:
-                    try:
-                        team = player.character.team_id
-                        player_name = player.character.name
-                    except AttributeError:
-                        team = player.team_id
-                        player_name = player.name
-                    if team not in rosters:
-                        rosters[team] = []
-                    rosters[team].append(player_name)
+        for event in self.filter_by("log_match_end")[::-1]:
+            for player in event.characters:
+                try:
+                    team = player.character.team_id
+                    player_name = player.character.name
+                except AttributeError:
+                    team = player.team_id
+                    player_name = player.name
+                if team not in rosters:
+                    rosters[team] = []
+                rosters[team].append(player_name)
         return rosters
 
     def num_players(self):
@@ -202,19 +228,18 @@ class Telemetry(object):
         :param int rank: Get the specific rank number players for the match.
         """
         rankings = {}
-        for event in self.events[::-1]:
-            if event.event_type == "log_match_end":
-                for player in event.characters:
-                    try:
-                        ranking = player.character.ranking
-                    except AttributeError:
-                        ranking = player.ranking
-                    if ranking not in rankings:
-                        rankings[ranking] = []
-                    try:
-                        rankings[ranking].append(player.character.name)
-                    except AttributeError:
-                        rankings[ranking].append(player.name)
+        for event in self.filter_by("log_match_end")[::-1]:
+            for player in event.characters:
+                try:
+                    ranking = player.character.ranking
+                except AttributeError:
+                    ranking = player.ranking
+                if ranking not in rankings:
+                    rankings[ranking] = []
+                try:
+                    rankings[ranking].append(player.character.name)
+                except AttributeError:
+                    rankings[ranking].append(player.name)
         if rank is not None:
             return rankings.get(rank, None)
         return rankings
@@ -227,9 +252,9 @@ class Telemetry(object):
         return self.rankings(rank=1)
 
     @classmethod
-    def from_json(cls, telemetry_json, pubg=None, url=None, shard=None):
+    def from_json(cls, telemetry_json, pubg=None, url=None, shard=None, lazy=False):
         """Construct an instance of telemetry from the json response."""
-        return cls(pubg, url, telemetry_json, shard)
+        return cls(pubg, url, telemetry_json, shard, lazy=lazy)
 
     @classmethod
     def from_match_id(cls, match_id, pubg, shard=None):
@@ -238,31 +263,64 @@ class Telemetry(object):
         url = match.telemetry_url()
         return cls(pubg, url, shard=shard)
 
+    @classmethod
+    def from_store(cls, match_id, store, pubg=None, shard=None, map_assets=False, lazy=False):
+        """Construct an instance of telemetry from a local telemetry archive.
+
+        :param str match_id: the match id
+        :param store: a :class:`chicken_dinner.store.TelemetryStore` instance
+            or the path to its directory
+        :param pubg: (optional) a PUBG instance
+        :param str shard: (optional) the shard for the match
+        :param bool map_assets: whether to map asset ids to named values
+        :param bool lazy: whether to lazily evaluate events
+        """
+        if isinstance(store, str):
+            from chicken_dinner.store import TelemetryStore
+
+            store = TelemetryStore(store)
+        return cls(pubg, None, store.load(match_id), shard, map_assets=map_assets, lazy=lazy)
+
+    @classmethod
+    def stream(cls, url, pubg, map_assets=False, lazy=False):
+        """Iterate over telemetry events as they are downloaded.
+
+        Events are decoded incrementally from the response, so only the
+        current event is held in memory rather than the full telemetry.
+
+        :param str url: the url for the telemetry data
+        :param pubg: a PUBG instance
+        :param bool map_assets: whether to map asset ids to named values
+        :param bool lazy: whether to yield lazily evaluated events
+        :return: a generator of
+            :class:`chicken_dinner.models.telemetry.TelemetryEvent` objects
+        """
+        event_class = LazyTelemetryEvent if lazy else TelemetryEvent
+        for event in pubg._core.telemetry(url, stream=True):
+            yield event_class(event, map_assets)
+
     def map_name(self):
         """Get the map name for PC matches. None if not PC."""
-        for event in self.events:
-            if event.event_type == "log_match_start":
-                map_id = getattr(event, "map_name", None)
-                if map_id is not None:
-                    return map_to_map_name.get(map_id, map_id)
-                else:
-                    return self._pubg.match(self.match_id()).map_name
+        for event in self.filter_by("log_match_start"):
+            map_id = getattr(event, "map_name", None)
+            if map_id is not None:
+                return map_to_map_name.get(map_id, map_id)
+            else:
+                return self._pubg.match(self.match_id()).map_name
 
     def map_id(self):
         """Get the map id for PC matches. None if not PC."""
-        for event in self.events:
-            if event.event_type == "log_match_start":
-                map_id = getattr(event, "map_name", None)
-                if map_id is not None:
-                    return map_name_to_map.get(map_id, map_id)
-                else:
-                    return self._pubg.match(self.match_id()).map_id
+        for event in self.filter_by("log_match_start"):
+            map_id = getattr(event, "map_name", None)
+            if map_id is not None:
+                return map_name_to_map.get(map_id, map_id)
+            else:
+                return self._pubg.match(self.match_id()).map_id
 
     def match_id(self):
         """The match id for the match."""
-        for event in self.events:
-            if event.event_type == "log_match_definition":
-                return event.match_id
+        for event in self.filter_by("log_match_definition"):
+            return event.match_id
 
     def player_damages(self, include_pregame=False):
         """Get the player damages for the match.
@@ -275,22 +333,18 @@ class Telemetry(object):
         :param bool include_pregame: (default False) whether to include
             pre-game damage positions.
         """
-        start = datetime.datetime.strptime(self.filter_by("log_match_start")[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
         damages = {}
         attack_events = self.filter_by("log_player_attack")
         attackers = {}
         for event in attack_events:
             attackers[event.attack_id] = event.attacker
 
-        damage_events = self.filter_by("log_player_take_damage")
-        for event in damage_events:
+        for dt, event in self._filter_elapsed("log_player_take_damage"):
             try:
                 attacker = event.attacker.name
             except AttributeError:
                 continue
             if attacker != "":
-                timestamp = datetime.datetime.strptime(event.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-                dt = (timestamp - start).total_seconds()
                 if (not include_pregame and dt < 0) or event.attack_id == -1:
                     continue
                 if attacker not in damages:
@@ -324,15 +378,12 @@ class Telemetry(object):
         :param bool include_pregame: (default False) whether to include
             pre-game player positions.
         """
-        start = datetime.datetime.strptime(self.filter_by("log_match_start")[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-        locations = self.filter_by("log_player_position")
+        locations = self._filter_elapsed("log_player_position")
         if not include_pregame:
-            locations = [location for location in locations if location.elapsed_time > 0]
+            locations = [(dt, location) for dt, location in locations if location.elapsed_time > 0]
         player_positions = {}
         dead = []
-        for location in locations:
-            timestamp = datetime.datetime.strptime(location.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-            dt = (timestamp - start).total_seconds()
+        for dt, location in locations:
             player = location.character.name
             if player not in player_positions:
                 player_positions[player] = []
@@ -368,12 +419,10 @@ class Telemetry(object):
 
         The circle colors are "white", "blue", and "red"
         """
-        game_states = self.filter_by("log_game_state_periodic")
         circle_positions = {"white": [], "blue": [], "red": []}
-        start = datetime.datetime.strptime(game_states[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-        for game_state in game_states:
-            timestamp = datetime.datetime.strptime(game_state.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-            dt = (timestamp - start).total_seconds()
+        game_state_idx = self._event_index.get("log_game_state_periodic", [])
+        start = self._event_timestamps()[game_state_idx[0]]
+        for dt, game_state in self._filter_elapsed("log_game_state_periodic", start):
             circle_positions["blue"].append(
                 (
                     dt,
@@ -411,17 +460,13 @@ class Telemetry(object):
         (t, x, y, z) coordinates where t is taken from the "elapsedTime"
         field in the JSON response.
         """
-        start = datetime.datetime.strptime(self.filter_by("log_match_start")[0].timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-
         if land:
-            care_package_spawns = self.filter_by("log_care_package_land")
+            care_package_spawns = self._filter_elapsed("log_care_package_land")
         else:
-            care_package_spawns = self.filter_by("log_care_package_spawn")
+            care_package_spawns = self._filter_elapsed("log_care_package_spawn")
 
         care_package_positions = []
-        for care_package in care_package_spawns:
-            package_time = datetime.datetime.strptime(care_package.timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-            time_elapsed = (package_time - start).total_seconds()
+        for time_elapsed, care_package in care_package_spawns:
             care_package_positions.append(
                 (
                     time_elapsed,
@@ -456,14 +501,32 @@ class Telemetry(object):
         killed = set(players_killed) | (set(players) - set(winner))
         return list(killed)
 
+    def to_arrays(self):
+        """Extract columnar NumPy arrays for positions, damages and circles.
+
+        Requires ``numpy``, which is installed via
+        ``pip install chicken-dinner[frame]``.
+
+        :return: a :class:`chicken_dinner.models.telemetry.frame.TelemetryFrame`
+            instance
+        """
+        try:
+            from chicken_dinner.models.telemetry.frame import TelemetryFrame
+        except ModuleNotFoundError as exc:
+            print("Use `pip install chicken_dinner[frame]` for telemetry array dependencies.")
+            raise exc
+
+        return TelemetryFrame(self)
+
     def playback_animation(self, filename="playback.html", **kwargs):
         """Generate a playback animation from the telemetry data.
 
-        Generate an HTML5 animation using matplotlib and ffmpeg.
+        Generate an HTML5 animation, or a video file, e.g. ``.mp4``,
+        ``.webm`` or ``.gif``, using matplotlib and ffmpeg.
         Requires installation via ``pip install chicken-dinner[visual]``.
 
-        :param filename: a file to generate for the animation (default
-            "playback.html")
+        :param filename: a file to generate for the animation, an ``.html``
+            file or a video file (default "playback.html")
         :param bool labels: whether to label players by name
         :param int disable_labels_after: if passed, turns off player labels
             after number of seconds elapsed in game
@@ -497,6 +560,11 @@ class Telemetry(object):
             second-interval granularity
         :param int interval: interval between gameplay frames in seconds
         :param int fps: the frames per second for the animation
+        :param int processes: (optional) the number of processes in which to
+            render frames in parallel
+        :param str codec: (optional) the codec for a video file, by default
+            chosen by the file extension
+        :param int bitrate: (optional) the bitrate for a video file in kbps
         """
         try:
             from chicken_dinner.visual.playback import create_playback_animation
@@ -1,5 +1,5 @@
 """Tournament model."""
-from chicken_dinner.models.match import Match
+from chicken_dinner.constants import MAX_WORKERS
 
 
 class Tournament(object):
@@ -9,14 +9,15 @@ class Tournament(object):
 
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
     :param str tournament_id: a tournament id
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, tournament_id, created_at=None, shard="pc-tournament"):
+    def __init__(self, pubg, tournament_id, created_at=None, shard="pc-tournament", response=None):
         self._pubg = pubg
         self._shard = shard
         self._id = tournament_id
         self._created_at = created_at
-        self._response = None
+        self._response = response
 
     @property
     def created_at(self):
@@ -45,9 +46,13 @@ class Tournament(object):
         """The match ids associated with this tournament."""
         return [m["id"] for m in self.response["included"]]
 
-    def get_matches(self):
-        """Get a list of match objects for the tournament matches."""
-        return [Match(self._pubg, match_id, shard=self.shard) for match_id in self.match_ids]
+    def get_matches(self, max_workers=MAX_WORKERS):
+        """Get a list of match objects for the tournament matches.
+
+        :param int max_workers: the max number of matches to fetch
+            concurrently
+        """
+        return self._pubg.matches(self.match_ids, shard=self.shard, max_workers=max_workers, raise_errors=True)
 
     @property
     def meta(self):
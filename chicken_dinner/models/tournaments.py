@@ -8,13 +8,16 @@ class Tournaments(object):
     An object encapsulating metadata about a set of PUBG tournaments.
 
     :param pubg: an instance of the class :class:`chicken_dinner.pubgapi.PUBG`
+    :param dict response: (optional) the API response, if already fetched
     """
 
-    def __init__(self, pubg, shard="pc-tournament"):
+    def __init__(self, pubg, shard="pc-tournament", response=None):
         self._pubg = pubg
         self._shard = shard
+        if response is None:
+            response = self._pubg._core.tournaments()
         #: The API response for this object.
-        self.response = self._pubg._core.tournaments()
+        self.response = response
         self._tournaments = [
             Tournament(self._pubg, t["id"], t["attributes"]["createdAt"], self.shard) for t in self.response["data"]
         ]
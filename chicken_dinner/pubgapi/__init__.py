@@ -1,2 +1,4 @@
+from chicken_dinner.pubgapi.async_core import AsyncPUBGCore
+from chicken_dinner.pubgapi.async_pubg import AsyncPUBG
 from chicken_dinner.pubgapi.core import PUBGCore
 from chicken_dinner.pubgapi.pubg import PUBG
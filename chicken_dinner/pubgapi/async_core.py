@@ -0,0 +1,372 @@
+"""Asynchronous PUBG API JSON wrapper."""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from chicken_dinner.constants import SHARDS
+from chicken_dinner.pubgapi.cache import cache_key
+from chicken_dinner.pubgapi.core import CONDITIONAL_ENDPOINTS
+from chicken_dinner.pubgapi.core import RATE_LIMIT_WINDOW
+from chicken_dinner.pubgapi.core import SLEEP_BUFFER
+from chicken_dinner.pubgapi.core import STREAM_CHUNK_SIZE
+from chicken_dinner.pubgapi.core import PUBGCore
+from chicken_dinner.pubgapi.retry import DEFAULT_RETRY_POLICY
+from chicken_dinner.util import JSONArrayDecoder
+from chicken_dinner.util import json_loads
+
+#: Default max number of simultaneous connections
+MAX_CONNECTIONS = 100
+#: How often in seconds rate limited requests check for a reset
+RATE_LIMIT_POLL = 1
+
+
+class AsyncPUBGCore(PUBGCore):
+    """Asynchronous low level interface to the PUBG JSON API.
+
+    Provides the same endpoint methods as
+    :class:`chicken_dinner.pubgapi.PUBGCore`, which here return coroutines
+    of the deserialized JSON responses, for use within an ``asyncio`` event
+    loop. Requires ``aiohttp``.
+
+    Rate limited requests wait for the rate limit window to reset without
+    blocking the event loop, and the remaining requests in a window are
+    reserved as requests are made, so that concurrent tasks don't exceed the
+    rate limit. Match and telemetry requests are not rate limited.
+
+    The underlying ``aiohttp`` sessions, one for the API and one for the
+    telemetry CDN, are created on first use. Use ``await core.close()``, or
+    use the instance as an async context manager, to close them.
+
+    :param str api_key: your PUBG api key
+    :param str shard: (optional) the shard to use in all requests for this
+        instance
+    :param bool gzip: (optional) compress responses as gzip
+    :param cache: (optional) a response cache, e.g. a
+        :class:`chicken_dinner.pubgapi.cache.FileCache` or
+        :class:`chicken_dinner.pubgapi.cache.SQLiteCache` instance
+    :param limiter: (optional) a rate limiter consulted before each rate
+        limited request, e.g. a
+        :class:`chicken_dinner.pubgapi.limiter.SQLiteLimiter` instance
+    :param bool conditional: (default=*False*) whether to make conditional
+        requests to the leaderboard, lifetime, player, player season and
+        seasons endpoints
+    :param retry: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.RetryPolicy` for failed
+        requests. By default, only rate limited requests are retried, once.
+    :param circuit_breaker: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.CircuitBreaker` which stops
+        requests to a failing shard or host
+    :param stats: (optional) a
+        :class:`chicken_dinner.pubgapi.stats.RequestStats` instance which
+        records request latencies, sizes, decoding time, retries, cache hits
+        and rate limit sleeps
+    :param decoder: (optional) a callable which decodes JSON from the
+        ``bytes`` of a response, by default ``orjson.loads`` if ``orjson`` is
+        installed, otherwise ``json.loads``
+    :param int max_connections: the max number of simultaneous connections
+        to each of the API and the telemetry CDN
+    """
+
+    def __init__(
+        self,
+        api_key,
+        shard=None,
+        gzip=True,
+        cache=None,
+        limiter=None,
+        conditional=False,
+        retry=None,
+        circuit_breaker=None,
+        stats=None,
+        decoder=None,
+        max_connections=MAX_CONNECTIONS,
+    ):
+        self.session = None
+        self.telemetry_session = None
+        #: The response cache, if any
+        self.cache = cache
+        #: The rate limiter, if any
+        self.limiter = limiter
+        #: Whether to make conditional requests
+        self.conditional = conditional
+        self._conditional_responses = OrderedDict()
+        self._conditional_lock = threading.Lock()
+        #: The retry policy
+        self.retry = retry or DEFAULT_RETRY_POLICY
+        #: The circuit breaker, if any
+        self.circuit_breaker = circuit_breaker
+        #: The request statistics, if any
+        self.stats = stats
+        #: The JSON decoder
+        self.decoder = decoder or json_loads
+        self._rate_limit_lock = threading.Lock()
+        #: The max number of simultaneous connections
+        self.max_connections = max_connections
+        # Set explicitly either way, rather than relying on the client's
+        # default encodings
+        self._headers = {"Accept-Encoding": "gzip" if gzip else "identity"}
+        self.api_key = api_key
+        if shard is None or shard in SHARDS:
+            self.shard = shard
+        else:
+            raise ValueError("Invalid shard provided.")
+
+    @property
+    def api_key(self):
+        """The API key (or list of API keys) being used."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value):
+        api_key = self._set_api_keys(value)
+        self._headers.update({"Authorization": "Bearer " + api_key, "Accept": "application/vnd.api+json"})
+        if self.session is not None:
+            self.session.headers.update(self._headers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying sessions."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.telemetry_session is not None:
+            await self.telemetry_session.close()
+            self.telemetry_session = None
+
+    def _get_session(self, telemetry=False):
+        if self.session is None:
+            try:
+                import aiohttp
+            except ModuleNotFoundError as exc:
+                print("Use `pip install chicken_dinner[async]` for asyncio dependencies.")
+                raise exc
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(headers=self._headers, connector=connector)
+            # Telemetry is downloaded from a CDN with its own connections,
+            # and without the API key
+            headers = {key: value for key, value in self._headers.items() if key == "Accept-Encoding"}
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.telemetry_session = aiohttp.ClientSession(headers=headers, connector=connector)
+        return self.telemetry_session if telemetry else self.session
+
+    async def _acquire(self):
+        warned = False
+        while True:
+            now = time.time()
+            for rate_limit in self._rate_limits.values():
+                if rate_limit.reset + SLEEP_BUFFER <= now:
+                    # The rate limit window has reset, so estimate the next
+                    # one until a response reports it
+                    rate_limit.remaining = rate_limit.limit
+                    rate_limit.reset = now + RATE_LIMIT_WINDOW
+            api_key = max(self._rate_limits, key=lambda key: self._rate_limits[key].remaining)
+            if self._rate_limits[api_key].remaining > 0:
+                self._rate_limits[api_key].remaining -= 1
+                break
+            reset = min(rate_limit.reset for rate_limit in self._rate_limits.values())
+            sleep_duration = reset - now + SLEEP_BUFFER
+            if not warned:
+                logging.warning("Rate limited by AsyncPUBGCore. Sleeping for " + str(int(sleep_duration)) + " seconds.")
+                warned = True
+            # Responses to requests in flight may still update the reset time
+            sleep_duration = min(sleep_duration, RATE_LIMIT_POLL)
+            await asyncio.sleep(sleep_duration)
+            if self.stats is not None:
+                self.stats.record_rate_limit_sleep(sleep_duration)
+        limiter = self._limiter_for(api_key)
+        if limiter is not None:
+            delay = limiter.reserve()
+            if delay > 0:
+                limiter_name = type(limiter).__name__
+                logging.warning("Rate limited by " + limiter_name + ". Sleeping for " + str(int(delay)) + " seconds.")
+                await asyncio.sleep(delay)
+                if self.stats is not None:
+                    self.stats.record_rate_limit_sleep(delay)
+        return api_key
+
+    def _update_rate_limit(self, api_key, response):
+        if "X-RateLimit-Remaining" not in response.headers:
+            # Responses without rate limit headers, e.g. a 304 or from a
+            # proxy, leave the rate limit state unchanged
+            return
+        rate_limit = self._rate_limits[api_key]
+        reset = time.time() + self._get_rate_limit_delta(response)
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Limit" in response.headers:
+            rate_limit.limit = int(response.headers["X-RateLimit-Limit"])
+        if reset <= time.time():
+            # A late response from a rate limit window which has since reset
+            return
+        # Requests reserved by other tasks may not be counted by the response
+        # yet, so keep the lower count
+        self._set_rate_limit(api_key, min(rate_limit.remaining, remaining), reset)
+
+    async def _backoff(self, policy, attempt, reason, endpoint):
+        sleep_duration = policy.delay(attempt)
+        logging.warning("Request failed (" + reason + "). Retrying in " + str(round(sleep_duration, 1)) + " seconds.")
+        await asyncio.sleep(sleep_duration)
+        if self.stats is not None:
+            self.stats.record_retry(endpoint, sleep_duration)
+
+    def _record_response(self, endpoint, response, start, content):
+        latency = time.perf_counter() - start
+        # The compressed size is only known from the Content-Length header
+        compressed_bytes = response.content_length
+        if content is None:
+            # The body is recorded once it is read
+            self.stats.record_response(endpoint, latency, compressed_bytes)
+        else:
+            self.stats.record_response(endpoint, latency, compressed_bytes, len(content))
+
+    async def _get(self, url, params=None, limited=True, headers=None, endpoint=None, read=False):
+        session = self._get_session(telemetry=endpoint == "telemetry")
+        import aiohttp
+
+        policy = self.retry.for_endpoint(endpoint)
+        circuit = self._circuit(url)
+        headers = dict(headers or {})
+        if limited:
+            api_key = await self._acquire()
+            headers["Authorization"] = "Bearer " + api_key
+
+        attempt = 1
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.check(circuit)
+            start = time.perf_counter()
+            content = None
+            try:
+                response = await session.get(url, params=params, headers=headers)
+                if read and response.status < 400:
+                    # Read the body here so that interrupted downloads are
+                    # retried too
+                    content = await response.read()
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as exc:
+                self._record_failure(circuit)
+                if not policy.connection_errors or attempt >= policy.max_attempts:
+                    raise exc
+                await self._backoff(policy, attempt, type(exc).__name__, endpoint)
+                attempt += 1
+                continue
+            logging.debug(response.headers)
+            if self.stats is not None:
+                self._record_response(endpoint, response, start, content)
+
+            if response.status < 400:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.success(circuit)
+                break
+            response.release()
+            if response.status >= 500:
+                self._record_failure(circuit)
+            if response.status not in policy.statuses or attempt >= policy.max_attempts:
+                # Hard failures should be handled by end-user gracefully.
+                response.raise_for_status()
+            if response.status == 429:
+                reset_time = self._get_rate_limit_delta(response)
+                if limited:
+                    self._set_rate_limit(api_key, 0, time.time() + reset_time)
+                if limited and len(self._rate_limits) > 1:
+                    # Retry with the next key which has requests remaining
+                    api_key = await self._acquire()
+                    headers["Authorization"] = "Bearer " + api_key
+                else:
+                    sleep_duration = int(reset_time) + SLEEP_BUFFER
+                    logging.warning("Rate limited by API (429). Sleeping for " + str(int(sleep_duration)) + " seconds.")
+                    await asyncio.sleep(sleep_duration)
+                    if self.stats is not None:
+                        self.stats.record_rate_limit_sleep(sleep_duration)
+                if self.stats is not None:
+                    self.stats.record_retry(endpoint, 0)
+            else:
+                await self._backoff(policy, attempt, str(response.status), endpoint)
+                if limited:
+                    # The failed request still counts toward the rate limit
+                    api_key = await self._acquire()
+                    headers["Authorization"] = "Bearer " + api_key
+            attempt += 1
+
+        if limited:
+            self._update_rate_limit(api_key, response)
+
+        return response
+
+    async def _get_json(self, endpoint, url, params=None, limited=True, fileobj=None):
+        if fileobj is not None:
+            raise NotImplementedError("Raw responses are not supported by AsyncPUBGCore.")
+        key = cache_key(url, params)
+        ttl = 0
+        if self.cache is not None:
+            ttl = self.cache.ttl_for(endpoint)
+        if ttl != 0:
+            content = self.cache.get(key)
+            if content is not None:
+                logging.debug("Cache hit: " + key)
+                if self.stats is not None:
+                    self.stats.record_cache_hit(endpoint)
+                return self._decode(endpoint, content)
+
+        conditional = self.conditional and endpoint in CONDITIONAL_ENDPOINTS
+        headers = self._conditional_headers(key) if conditional else None
+        response = await self._get(url, params, limited, headers=headers, endpoint=endpoint, read=True)
+        if response.status == 304:
+            response.release()
+            content = self._conditional_response(key)
+            if content is not None:
+                if self.stats is not None:
+                    self.stats.record_not_modified(endpoint)
+                return self._decode(endpoint, content)
+            # The kept response was evicted in the meantime
+            response = await self._get(url, params, limited, endpoint=endpoint, read=True)
+        try:
+            content = await response.read()
+        finally:
+            response.release()
+        if ttl != 0:
+            self.cache.set(key, content, ttl)
+        data = self._decode(endpoint, content)
+        if conditional:
+            self._store_conditional(key, response.headers, content)
+        return data
+
+    async def _iter_stream(self, url):
+        response = await self._get(url, limited=False, endpoint="telemetry")
+        decoder = JSONArrayDecoder()
+        decompressed_bytes = 0
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                decompressed_bytes += len(chunk)
+                for element in decoder.feed(chunk):
+                    yield element
+                if decoder.finished:
+                    return
+            for element in decoder.feed(b"", final=True):
+                yield element
+        finally:
+            response.release()
+            if self.stats is not None:
+                self.stats.record_bytes("telemetry", decompressed_bytes=decompressed_bytes)
+
+    def telemetry(self, url, stream=False):
+        """Download the telemetry data.
+
+        Description: https://documentation.playbattlegrounds.com/en/telemetry.html
+
+        Calls here do not apply to the rate limit.
+
+        :param str url: the telemetry data URL
+        :param bool stream: (default=*False*) if *True*, incrementally decode
+            the (gzipped) response as it is downloaded and return an async
+            iterator over the telemetry events instead of the full list
+        :return: a coroutine of the JSON response for the telemetry URL
+        """
+        if stream:
+            return self._iter_stream(url)
+        return self._get_json("telemetry", url, limited=False)
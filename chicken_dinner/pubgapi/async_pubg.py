@@ -0,0 +1,315 @@
+"""Asynchronous PUBG model-API interface."""
+import asyncio
+
+from chicken_dinner.constants import MAX_WORKERS
+from chicken_dinner.models import Leaderboard
+from chicken_dinner.models import Player
+from chicken_dinner.models import Players
+from chicken_dinner.models import PlayerSeason
+from chicken_dinner.models import Samples
+from chicken_dinner.models import Seasons
+from chicken_dinner.models import Status
+from chicken_dinner.models import Tournament
+from chicken_dinner.models import Tournaments
+from chicken_dinner.models.match import Match
+from chicken_dinner.models.telemetry import LazyTelemetryEvent
+from chicken_dinner.models.telemetry import Telemetry
+from chicken_dinner.models.telemetry import TelemetryEvent
+from chicken_dinner.pubgapi.async_core import MAX_CONNECTIONS
+from chicken_dinner.pubgapi.async_core import AsyncPUBGCore
+from chicken_dinner.pubgapi.pubg import PUBG
+
+
+class AsyncPUBG(PUBG):
+    """Asynchronous high level type-based interface to the PUBG JSON API.
+
+    Provides the same methods as :class:`chicken_dinner.pubgapi.PUBG`, which
+    here are coroutines, for use within an ``asyncio`` event loop. Requires
+    ``aiohttp``.
+
+    The models returned are fully loaded, but their methods which make
+    further requests, e.g. ``Match.get_telemetry``, are not supported. Use
+    the corresponding coroutines of this class instead, e.g.
+    ``await pubg.telemetry(match.telemetry_url)``.
+
+    :param api_key: your PUBG api key, or a list of api keys to use as a pool
+    :param str shard: (optional) a shard to use for all requests with this
+        instance
+    :param bool gzip: (default=*True*) whether to gzip the responses.
+    :param cache: (optional) a response cache, e.g. a
+        :class:`chicken_dinner.pubgapi.cache.FileCache` or
+        :class:`chicken_dinner.pubgapi.cache.SQLiteCache` instance
+    :param limiter: (optional) a rate limiter, e.g. a
+        :class:`chicken_dinner.pubgapi.limiter.TokenBucketLimiter` or
+        :class:`chicken_dinner.pubgapi.limiter.SQLiteLimiter` instance
+    :param bool conditional: (default=*False*) whether to make conditional
+        requests for player, season and leaderboard data, reusing the last
+        response when the API responds with 304 Not Modified
+    :param retry: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.RetryPolicy` for failed requests
+    :param circuit_breaker: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.CircuitBreaker` which stops
+        requests to a failing shard or host
+    :param stats: (optional) a
+        :class:`chicken_dinner.pubgapi.stats.RequestStats` instance which
+        records request latencies, sizes, decoding time, retries, cache hits
+        and rate limit sleeps
+    :param decoder: (optional) a callable which decodes JSON from the
+        ``bytes`` of a response, by default ``orjson.loads`` if ``orjson`` is
+        installed, otherwise ``json.loads``
+    :param int max_connections: the max number of simultaneous connections
+        to each of the API and the telemetry CDN
+    """
+
+    def __init__(
+        self,
+        api_key,
+        shard=None,
+        gzip=True,
+        cache=None,
+        limiter=None,
+        conditional=False,
+        retry=None,
+        circuit_breaker=None,
+        stats=None,
+        decoder=None,
+        max_connections=MAX_CONNECTIONS,
+    ):
+        self._core = AsyncPUBGCore(
+            api_key,
+            shard,
+            gzip,
+            cache=cache,
+            limiter=limiter,
+            conditional=conditional,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            stats=stats,
+            decoder=decoder,
+            max_connections=max_connections,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying session."""
+        await self._core.close()
+
+    async def current_season(self, shard=None):
+        """Get the current season.
+
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.Season` object for the current
+            season
+        """
+        seasons = await self.seasons(shard)
+        return seasons.current()
+
+    async def leaderboard(self, game_mode, shard=None):
+        """Get a leaderboard for a game mode.
+
+        :param str game_mode: the game mode for which to fetch the leaderboard
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.Leaderboard` object
+        """
+        shard = shard or self.shard
+        response = await self._core.leaderboard(game_mode, shard)
+        return Leaderboard(self, game_mode, shard, response=response)
+
+    async def lifetime(self, player_id, shard=None):
+        """Get a player's information for their player lifetime.
+
+        :param str player_id: the player's account id
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.PlayerSeason` object
+        """
+        shard = shard or self.shard
+        if isinstance(player_id, Player):
+            player_id = player_id.id
+        response = await self._core.lifetime(player_id, shard)
+        return PlayerSeason(self, player_id, "lifetime", shard, response=response)
+
+    async def match(self, match_id, shard=None):
+        """Get match info by ``match_id``.
+
+        :param str match_id: the match_id to query
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.Match` object
+        """
+        shard = shard or self.shard
+        response = await self._core.match(match_id, shard)
+        return Match(self, match_id, shard, response=response)
+
+    async def matches(self, match_ids, shard=None, max_workers=MAX_WORKERS, raise_errors=False):
+        """Get multiple matches concurrently.
+
+        :param list match_ids: the match ids to query
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :param int max_workers: the max number of concurrent requests
+        :param bool raise_errors: (default=*False*) whether to raise the first
+            error encountered. Otherwise, the exception for a match which
+            could not be fetched is returned in its place.
+        :return: a list of :class:`chicken_dinner.models.Match` objects in
+            the same order as ``match_ids``
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(match_id):
+            async with semaphore:
+                return await self.match(match_id, shard)
+
+        return await asyncio.gather(*[fetch(match_id) for match_id in match_ids], return_exceptions=not raise_errors)
+
+    async def samples(self, start=None, shard=None):
+        """Get match samples.
+
+        :param str start: (optional) the start timestamp from which to get
+            samples
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.Samples` object
+        """
+        shard = shard or self.shard
+        response = await self._core.samples(start, shard)
+        return Samples(self, start, shard, response=response)
+
+    async def seasons(self, shard=None):
+        """Get an iterable of PUBG seasons.
+
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: an iterable :class:`chicken_dinner.models.Seasons` object
+        """
+        shard = shard or self.shard
+        response = await self._core.seasons(shard)
+        return Seasons(self, shard, response=response)
+
+    async def status(self):
+        """Get the status of the PUBG API.
+
+        :return: a :class:`chicken_dinner.models.Status` object
+        """
+        response = await self._core.status()
+        return Status(self, response=response)
+
+    async def player_season(self, player_id, season_id, shard=None):
+        """Get a player's information for a particular season.
+
+        :param str player_id: the player's account id
+        :param str season_id: the PUBG season id or "current" for current
+            season
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.PlayerSeason` object
+        """
+        shard = shard or self.shard
+        if season_id == "current":
+            season_id = (await self.current_season(shard)).id
+        if isinstance(player_id, Player):
+            player_id = player_id.id
+        response = await self._core.player_season(player_id, season_id, shard)
+        return PlayerSeason(self, player_id, season_id, shard, response=response)
+
+    async def player(self, player_id, shard=None):
+        """Get a player's metadata.
+
+        :param str player_id: the player's account id
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: a :class:`chicken_dinner.models.Player` object
+        """
+        shard = shard or self.shard
+        response = await self._core.player(player_id, shard)
+        return Player(self, player_id, data=response["data"], shard=shard)
+
+    async def players(self, filter_type, filter_value, shard=None):
+        """Get multiple players' metadata.
+
+        :param str filter_type: query by either "player_ids" or "player_names"
+        :param list filter_value: a list of strings of the ``player_ids`` or
+            ``player_names`` to search
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: an iterable :class:`chicken_dinner.models.Players` object
+        """
+        shard = shard or self.shard
+        chunks = Players.chunk_filter_value(filter_value)
+        responses = await asyncio.gather(
+            *[self._core.players(filter_type, chunk, shard) for chunk in chunks], return_exceptions=True
+        )
+        return Players(self, filter_type, filter_value, shard, response=Players.merge_responses(responses))
+
+    async def players_from_ids(self, player_ids, shard=None):
+        """Get multiple players' metadata from a list of ``player_ids``.
+
+        :param list player_ids: a list of strings of ``player_ids`` of any
+            length, which is fetched in chunks of 10
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: an iterable :class:`chicken_dinner.models.Players` object
+        """
+        return await self.players("player_ids", player_ids, shard)
+
+    async def players_from_names(self, player_names, shard=None):
+        """Get multiple players' metadata from a list of ``player_names``.
+
+        :param list player_names: a list of strings of ``player_names`` of
+            any length, which is fetched in chunks of 10
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :return: an iterable :class:`chicken_dinner.models.Players` object
+        """
+        return await self.players("player_names", player_names, shard)
+
+    def telemetry(self, url, map_assets=False, stream=False, lazy=False):
+        """Get a telemetry object from a telemetry url.
+
+        :param str url: the url for the telemetry data
+        :param bool map_assets: whether to map asset ids to named values, e.g.
+            map ``Item_Weapon_AK47_C`` to ``AKM``.
+        :param bool stream: (default=*False*) if *True*, return an async
+            iterator of :class:`chicken_dinner.models.telemetry.TelemetryEvent`
+            objects which are decoded as the telemetry is downloaded
+        :param bool lazy: (default=*False*) whether to convert event
+            attributes only when they are first accessed
+        :return: a coroutine of a
+            :class:`chicken_dinner.models.telemetry.Telemetry` object
+        """
+        if stream:
+            return self._stream_telemetry(url, map_assets, lazy)
+        return self._telemetry(url, map_assets, lazy)
+
+    async def _telemetry(self, url, map_assets, lazy):
+        response = await self._core.telemetry(url)
+        return Telemetry(self, url, response, map_assets=map_assets, lazy=lazy)
+
+    async def _stream_telemetry(self, url, map_assets, lazy):
+        event_class = LazyTelemetryEvent if lazy else TelemetryEvent
+        async for event in self._core.telemetry(url, stream=True):
+            yield event_class(event, map_assets)
+
+    async def tournament(self, tournament_id):
+        """Get a tournament by its id.
+
+        :param str tournament_id: the tournament id for which to get data
+        :return: a :class:`chicken_dinner.models.Tournament` object
+        """
+        response = await self._core.tournament(tournament_id)
+        return Tournament(self, tournament_id, response=response)
+
+    async def tournaments(self):
+        """Get a list of tournaments.
+
+        :return: a :class:`chicken_dinner.models.Tournaments` object
+        """
+        response = await self._core.tournaments()
+        return Tournaments(self, response=response)
@@ -0,0 +1,248 @@
+"""Response caches for PUBGCore."""
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from urllib.parse import urlencode
+
+#: Default max size of a cache in bytes
+DEFAULT_MAX_SIZE = 2 ** 30
+
+#: Default time to live in seconds for each PUBGCore endpoint. ``None``
+#: caches responses indefinitely and ``0`` disables caching.
+DEFAULT_TTL = {
+    "leaderboard": 600,
+    "lifetime": 600,
+    "match": None,
+    "player": 60,
+    "player_season": 600,
+    "players": 60,
+    "samples": 3600,
+    "seasons": 86400,
+    "status": 0,
+    "telemetry": None,
+    "tournament": 600,
+    "tournaments": 600,
+}
+
+
+def cache_key(url, params=None):
+    """Construct a cache key for a request.
+
+    :param str url: the request url
+    :param dict params: (optional) the request query parameters
+    :return: the url including its sorted query string
+    """
+    if params:
+        return url + "?" + urlencode(sorted(params.items()))
+    return url
+
+
+class BaseCache(ABC):
+    """Base class for PUBGCore response caches.
+
+    Caches store the (decompressed) response bodies of API requests, so that
+    repeated requests cost no network I/O and no rate limit budget. Entries
+    expire according to a time to live per endpoint, and the least recently
+    used entries are evicted once the cache exceeds its max size.
+
+    :param int max_size: the max total size of cached responses in bytes
+    :param dict ttl: (optional) a map of endpoint names to time to live in
+        seconds, overriding :data:`DEFAULT_TTL`
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, ttl=None):
+        #: The max total size of cached responses in bytes
+        self.max_size = max_size
+        #: A map of endpoint names to time to live in seconds
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl is not None:
+            self.ttl.update(ttl)
+
+    def ttl_for(self, endpoint):
+        """The time to live for responses from an endpoint.
+
+        :param str endpoint: the PUBGCore endpoint name, e.g. ``match``
+        :return: the time to live in seconds, ``None`` if responses never
+            expire, or ``0`` if responses should not be cached
+        """
+        return self.ttl.get(endpoint, 0)
+
+    @abstractmethod
+    def get(self, key):
+        """Get a cached response body.
+
+        :param str key: the cache key
+        :return: the cached ``bytes`` or ``None`` if missing or expired
+        """
+
+    @abstractmethod
+    def set(self, key, value, ttl=None):
+        """Cache a response body.
+
+        :param str key: the cache key
+        :param bytes value: the response body
+        :param ttl: (optional) the time to live in seconds, or ``None`` to
+            never expire
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Remove all cached responses."""
+
+
+class FileCache(BaseCache):
+    """A response cache backed by files in a directory.
+
+    Each response is stored in its own file, named by a hash of its key.
+    File modification times track when each entry was last used. The
+    directory may be shared by multiple threads and processes, as the size
+    of the cache is taken from the directory whenever an entry is added.
+
+    :param str path: the cache directory, created if it doesn't exist
+    :param int max_size: the max total size of cached responses in bytes
+    :param dict ttl: (optional) a map of endpoint names to time to live in
+        seconds, overriding :data:`DEFAULT_TTL`
+    """
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE, ttl=None):
+        super().__init__(max_size, ttl)
+        #: The cache directory
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _entries(self):
+        return [entry for entry in os.scandir(self.path) if entry.is_file() and not entry.name.endswith(".tmp")]
+
+    def _filename(self, key):
+        return os.path.join(self.path, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def get(self, key):
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                expires = float(f.readline())
+                value = f.read()
+        except (OSError, ValueError):
+            return None
+        if expires < time.time():
+            self._remove(filename)
+            return None
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires = float("inf") if ttl is None else time.time() + ttl
+        filename = self._filename(key)
+        # A unique temporary file, since the directory may be shared by
+        # other threads and processes
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as f:
+            tmp = f.name
+            f.write(repr(expires).encode("ascii") + b"\n")
+            f.write(value)
+        with self._lock:
+            os.replace(tmp, filename)
+            self._evict()
+
+    def _remove(self, filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def _evict(self):
+        # Other processes may add and remove entries, so the size is summed
+        # from the directory rather than tracked in memory
+        entries = []
+        size = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            size += stat.st_size
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries():
+                self._remove(entry.path)
+
+
+class SQLiteCache(BaseCache):
+    """A response cache backed by a SQLite database.
+
+    The database may be shared by multiple threads and processes.
+
+    :param str path: the database file
+    :param int max_size: the max total size of cached responses in bytes
+    :param dict ttl: (optional) a map of endpoint names to time to live in
+        seconds, overriding :data:`DEFAULT_TTL`
+    """
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE, ttl=None):
+        super().__init__(max_size, ttl)
+        #: The database file
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, expires REAL, accessed REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires is not None and expires < now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return value
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), expires, now),
+            )
+            size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if size > self.max_size:
+                self._evict(size)
+
+    def _evict(self, size):
+        evicted = []
+        for key, entry_size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if size <= self.max_size:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
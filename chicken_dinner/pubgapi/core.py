@@ -1,10 +1,18 @@
 """PUBG API JSON wrapper."""
 import datetime
 import logging
+import socket
+import threading
 import time
+from collections import OrderedDict
+from urllib.parse import urlparse
 
 import requests
-from requests.exceptions import RequestException
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError
+from requests.exceptions import ContentDecodingError
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as RawHTTPError
 
 from chicken_dinner.constants import PLAYER_FILTERS
 from chicken_dinner.constants import SHARD_URL
@@ -12,8 +20,25 @@ from chicken_dinner.constants import SHARDS
 from chicken_dinner.constants import STATUS_URL
 from chicken_dinner.constants import TOURNAMENTS_URL
 from chicken_dinner.constants import TRANSITION_SEASON
+from chicken_dinner.pubgapi.cache import cache_key
+from chicken_dinner.pubgapi.retry import DEFAULT_RETRY_POLICY
+from chicken_dinner.util import iter_json_array
+from chicken_dinner.util import json_loads
 
 SLEEP_BUFFER = 2
+# The length of a rate limit window in seconds
+RATE_LIMIT_WINDOW = 60
+STREAM_CHUNK_SIZE = 2 ** 16
+# Endpoints which support conditional requests
+CONDITIONAL_ENDPOINTS = ("leaderboard", "lifetime", "player", "player_season", "seasons")
+# Max number of responses kept for conditional requests
+MAX_CONDITIONAL_ENTRIES = 1024
+# Default max number of connections kept alive per host
+POOL_SIZE = 32
+# Request errors which may be retried
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, ChunkedEncodingError)
+# Errors reading a raw response body, which requests doesn't wrap
+RAW_RETRY_EXCEPTIONS = RETRY_EXCEPTIONS + (RawHTTPError,)
 MONTHNAMES = [
     None,  # placeholder index
     "Jan",
@@ -32,6 +57,32 @@ MONTHNAMES = [
 UTC = datetime.timezone(datetime.timedelta(0))
 
 
+class _RateLimit(object):
+    """The rate limit state of an API key."""
+
+    def __init__(self):
+        # Set some defaults to ensure the first API call is attempted
+        self.limit = 10
+        self.remaining = 10
+        self.reset = 0
+
+
+class _PoolAdapter(HTTPAdapter):
+    """An HTTP adapter which optionally enables TCP keep-alive."""
+
+    def __init__(self, pool_size=POOL_SIZE, max_retries=0, keep_alive=True):
+        self._keep_alive = keep_alive
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._keep_alive:
+            # Detect connections dropped while idle between requests
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class PUBGCore(object):
     """Low level interface to the PUBG JSON API.
 
@@ -40,34 +91,165 @@ class PUBGCore(object):
 
     Info: https://documentation.playbattlegrounds.com/en/introduction.html
 
-    :param str api_key: your PUBG api key
+    When given a list of API keys, the remaining rate limit of each key is
+    tracked separately, and each rate limited request is made with the key
+    which has the most requests remaining, so that throughput scales with
+    the number of keys.
+
+    :param api_key: your PUBG api key, or a list of api keys
     :param str shard: (optional) the shard to use in all requests for this
         instance
     :param bool gzip: (optional) compress responses as gzip
+    :param cache: (optional) a response cache, e.g. a
+        :class:`chicken_dinner.pubgapi.cache.FileCache` or
+        :class:`chicken_dinner.pubgapi.cache.SQLiteCache` instance
+    :param limiter: (optional) a rate limiter consulted before each rate
+        limited request, e.g. a
+        :class:`chicken_dinner.pubgapi.limiter.TokenBucketLimiter` or
+        :class:`chicken_dinner.pubgapi.limiter.SQLiteLimiter` instance shared
+        by every client using the same API key, or a dict of limiters for
+        each api key
+    :param bool conditional: (default=*False*) whether to make conditional
+        requests to the leaderboard, lifetime, player, player season and
+        seasons endpoints. The last response for each URL is kept in memory
+        along with its ``ETag`` and ``Last-Modified`` validators, and is
+        returned again without downloading or decoding when the API responds
+        with 304 Not Modified.
+    :param retry: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.RetryPolicy` for failed
+        requests. By default, only rate limited requests are retried, once.
+    :param circuit_breaker: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.CircuitBreaker` which stops
+        requests to a failing shard or host
+    :param int pool_size: the max number of connections kept alive for each
+        host, which should be at least the number of concurrent requests
+    :param int max_retries: the number of times ``urllib3`` retries failed
+        connections, before and independently of the ``retry`` policy
+    :param bool keep_alive: (default=*True*) whether to enable TCP keep-alive
+        on pooled connections
+    :param stats: (optional) a
+        :class:`chicken_dinner.pubgapi.stats.RequestStats` instance which
+        records request latencies, sizes, decoding time, retries, cache hits
+        and rate limit sleeps
+    :param decoder: (optional) a callable which decodes JSON from the
+        ``bytes`` of a response, by default ``orjson.loads`` if ``orjson`` is
+        installed, otherwise ``json.loads``
     """
 
-    def __init__(self, api_key, shard=None, gzip=True):
+    def __init__(
+        self,
+        api_key,
+        shard=None,
+        gzip=True,
+        cache=None,
+        limiter=None,
+        conditional=False,
+        retry=None,
+        circuit_breaker=None,
+        pool_size=POOL_SIZE,
+        max_retries=0,
+        keep_alive=True,
+        stats=None,
+        decoder=None,
+    ):
         self.session = requests.Session()
+        # Telemetry is downloaded from a CDN with its own connections, and
+        # without the API key
+        self.telemetry_session = requests.Session()
+        for session in (self.session, self.telemetry_session):
+            adapter = _PoolAdapter(pool_size, max_retries, keep_alive)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        #: The response cache, if any
+        self.cache = cache
+        #: The rate limiter, if any
+        self.limiter = limiter
+        #: Whether to make conditional requests
+        self.conditional = conditional
+        self._conditional_responses = OrderedDict()
+        self._conditional_lock = threading.Lock()
+        #: The retry policy
+        self.retry = retry or DEFAULT_RETRY_POLICY
+        #: The circuit breaker, if any
+        self.circuit_breaker = circuit_breaker
+        #: The request statistics, if any
+        self.stats = stats
+        #: The JSON decoder
+        self.decoder = decoder or json_loads
+        self._rate_limit_lock = threading.Lock()
+        # Set explicitly either way, since requests otherwise advertises
+        # every encoding it can decode
+        self._accept_encoding = "gzip" if gzip else "identity"
+        self.telemetry_session.headers.update({"Accept-Encoding": self._accept_encoding})
         self.api_key = api_key
-        if gzip:
-            self.session.headers.update({"Accept-Encoding": "gzip"})
         if shard is None or shard in SHARDS:
             self.shard = shard
         else:
             raise ValueError("Invalid shard provided.")
-        # Set some defaults to ensure the first API call is attempted
-        self._rate_limit_remaining = 10
-        self._rate_limit_reset = 0
 
     @property
     def api_key(self):
-        """The API key being used."""
+        """The API key (or list of API keys) being used."""
         return self._api_key
 
     @api_key.setter
     def api_key(self, value):
+        api_key = self._set_api_keys(value)
+        self.session.headers = {
+            "Authorization": "Bearer " + api_key,
+            "Accept": "application/vnd.api+json",
+            "Accept-Encoding": self._accept_encoding,
+        }
+
+    def _set_api_keys(self, value):
+        api_keys = [value] if isinstance(value, str) else list(value)
+        if not api_keys:
+            raise ValueError("An API key must be provided.")
         self._api_key = value
-        self.session.headers = {"Authorization": "Bearer " + value, "Accept": "application/vnd.api+json"}
+        self._rate_limits = {key: _RateLimit() for key in api_keys}
+        return api_keys[0]
+
+    @property
+    def api_keys(self):
+        """The list of API keys being used."""
+        return list(self._rate_limits)
+
+    def _limiter_for(self, api_key):
+        if isinstance(self.limiter, dict):
+            return self.limiter.get(api_key)
+        return self.limiter
+
+    def _select_key(self):
+        """Select the API key for a rate limited request.
+
+        Must be called with the rate limit lock held.
+
+        :return: a tuple of the API key and the number of seconds until its
+            rate limit resets, or ``0`` if it has requests remaining
+        """
+        now = time.time()
+        for rate_limit in self._rate_limits.values():
+            if rate_limit.reset <= now:
+                # The rate limit window has reset, so estimate the next one
+                # until a response reports it
+                rate_limit.remaining = rate_limit.limit
+                rate_limit.reset = now + RATE_LIMIT_WINDOW
+        key = max(self._rate_limits, key=lambda k: self._rate_limits[k].remaining)
+        if self._rate_limits[key].remaining > 0:
+            return key, 0
+        key = min(self._rate_limits, key=lambda k: self._rate_limits[k].reset)
+        return key, self._rate_limits[key].reset - now
+
+    def _set_rate_limit(self, api_key, remaining, reset, limit=None):
+        with self._rate_limit_lock:
+            rate_limit = self._rate_limits[api_key]
+            if limit is not None:
+                rate_limit.limit = limit
+            rate_limit.remaining = remaining
+            rate_limit.reset = reset
+        limiter = self._limiter_for(api_key)
+        if limiter is not None:
+            limiter.update(remaining, reset)
 
     def _check_shard(self, shard):
         shard = shard or self.shard
@@ -78,41 +260,200 @@ class PUBGCore(object):
         else:
             return shard
 
-    def _get(self, url, params=None, limited=True):
-        if limited:
-            reset_time = self._rate_limit_reset - time.time()
-            if self._rate_limit_remaining == 0 and reset_time > 0:
-                sleep_duration = reset_time + SLEEP_BUFFER
-                logging.warning("Rate limited by PUBGCore. Sleeping for " + str(int(sleep_duration)) + " seconds.")
-                time.sleep(sleep_duration)
-
-        response = self.session.get(url, params=params)
-        logging.debug(response.headers)
+    def _acquire(self):
+        while True:
+            with self._rate_limit_lock:
+                api_key, reset_time = self._select_key()
+                if reset_time <= 0:
+                    self._rate_limits[api_key].remaining -= 1
+                    break
+            sleep_duration = reset_time + SLEEP_BUFFER
+            logging.warning("Rate limited by PUBGCore. Sleeping for " + str(int(sleep_duration)) + " seconds.")
+            time.sleep(sleep_duration)
+            if self.stats is not None:
+                self.stats.record_rate_limit_sleep(sleep_duration)
+        limiter = self._limiter_for(api_key)
+        if limiter is not None:
+            delay = limiter.acquire()
+            if self.stats is not None:
+                self.stats.record_rate_limit_sleep(delay)
+        return api_key
+
+    def _circuit(self, url):
+        # Requests to the API are grouped by shard, and any others by host
+        if url.startswith(SHARD_URL):
+            return url[len(SHARD_URL) :].split("/", 1)[0]
+        return urlparse(url).netloc
+
+    def _record_failure(self, circuit):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.failure(circuit)
+
+    def _backoff(self, policy, attempt, reason, endpoint):
+        sleep_duration = policy.delay(attempt)
+        logging.warning("Request failed (" + reason + "). Retrying in " + str(round(sleep_duration, 1)) + " seconds.")
+        time.sleep(sleep_duration)
+        if self.stats is not None:
+            self.stats.record_retry(endpoint, sleep_duration)
+
+    def _record_response(self, endpoint, response, stream, start):
+        latency = time.perf_counter() - start
+        if stream:
+            # The body is recorded once it is read
+            self.stats.record_response(endpoint, latency)
+        else:
+            self.stats.record_response(endpoint, latency, response.raw.tell(), len(response.content))
 
-        try:
-            response.raise_for_status()
-        except RequestException as exc:
+    def _get(self, url, params=None, limited=True, stream=False, headers=None, endpoint=None):
+        policy = self.retry.for_endpoint(endpoint)
+        circuit = self._circuit(url)
+        session = self.telemetry_session if endpoint == "telemetry" else self.session
+        headers = dict(headers or {})
+        if limited:
+            api_key = self._acquire()
+            headers["Authorization"] = "Bearer " + api_key
+
+        attempt = 1
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.check(circuit)
+            start = time.perf_counter()
+            try:
+                response = session.get(url, params=params, stream=stream, headers=headers)
+            except RETRY_EXCEPTIONS as exc:
+                self._record_failure(circuit)
+                if not policy.connection_errors or attempt >= policy.max_attempts:
+                    raise exc
+                self._backoff(policy, attempt, type(exc).__name__, endpoint)
+                attempt += 1
+                continue
+            logging.debug(response.headers)
+            if self.stats is not None:
+                self._record_response(endpoint, response, stream, start)
+
+            if response.status_code < 400:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.success(circuit)
+                break
+            if response.status_code >= 500:
+                self._record_failure(circuit)
+            if response.status_code not in policy.statuses or attempt >= policy.max_attempts:
+                # Hard failures should be handled by end-user gracefully.
+                response.raise_for_status()
+            response.close()
             if response.status_code == 429:
                 reset_time = self._get_rate_limit_delta(response)
-                sleep_duration = int(reset_time) + SLEEP_BUFFER
-                logging.warning("Rate limited by API (429). Sleeping for " + str(int(sleep_duration)) + " seconds.")
-                time.sleep(sleep_duration)
+                if limited:
+                    self._set_rate_limit(api_key, 0, time.time() + reset_time)
+                if limited and len(self._rate_limits) > 1:
+                    # Retry with the next key which has requests remaining
+                    api_key = self._acquire()
+                    headers["Authorization"] = "Bearer " + api_key
+                else:
+                    sleep_duration = int(reset_time) + SLEEP_BUFFER
+                    logging.warning("Rate limited by API (429). Sleeping for " + str(int(sleep_duration)) + " seconds.")
+                    time.sleep(sleep_duration)
+                    if self.stats is not None:
+                        self.stats.record_rate_limit_sleep(sleep_duration)
+                if self.stats is not None:
+                    self.stats.record_retry(endpoint, 0)
             else:
-                raise exc
-            # Try again and just raise on failure because something else
-            # must be wrong. Hard failures should be handled by end-user
-            # gracefully.
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-
-        if limited:
+                self._backoff(policy, attempt, str(response.status_code), endpoint)
+                if limited:
+                    # The failed request still counts toward the rate limit
+                    api_key = self._acquire()
+                    headers["Authorization"] = "Bearer " + api_key
+            attempt += 1
+
+        # Responses without rate limit headers, e.g. a 304 or from a proxy,
+        # leave the rate limit state unchanged
+        if limited and "X-RateLimit-Remaining" in response.headers:
             delta = self._get_rate_limit_delta(response)
-
-            self._rate_limit_reset = time.time() + delta
-            self._rate_limit_remaining = int(response.headers["X-RateLimit-Remaining"])
+            limit = response.headers.get("X-RateLimit-Limit")
+            self._set_rate_limit(
+                api_key,
+                int(response.headers["X-RateLimit-Remaining"]),
+                time.time() + delta,
+                limit=None if limit is None else int(limit),
+            )
 
         return response
 
+    def _get_json(self, endpoint, url, params=None, limited=True, fileobj=None):
+        if fileobj is not None:
+            # Raw responses bypass the cache and conditional requests
+            return self._download_raw(url, fileobj, endpoint, params, limited)
+        key = cache_key(url, params)
+        ttl = 0
+        if self.cache is not None:
+            ttl = self.cache.ttl_for(endpoint)
+        if ttl != 0:
+            content = self.cache.get(key)
+            if content is not None:
+                logging.debug("Cache hit: " + key)
+                if self.stats is not None:
+                    self.stats.record_cache_hit(endpoint)
+                return self._decode(endpoint, content)
+
+        conditional = self.conditional and endpoint in CONDITIONAL_ENDPOINTS
+        headers = self._conditional_headers(key) if conditional else None
+        response = self._get(url, params, limited, headers=headers, endpoint=endpoint)
+        if response.status_code == 304:
+            content = self._conditional_response(key)
+            if content is not None:
+                if self.stats is not None:
+                    self.stats.record_not_modified(endpoint)
+                return self._decode(endpoint, content)
+            # The kept response was evicted in the meantime
+            response = self._get(url, params, limited, endpoint=endpoint)
+        if ttl != 0:
+            self.cache.set(key, response.content, ttl)
+        data = self._decode(endpoint, response.content)
+        if conditional:
+            self._store_conditional(key, response.headers, response.content)
+        return data
+
+    def _decode(self, endpoint, content):
+        start = time.perf_counter()
+        data = self.decoder(content)
+        if self.stats is not None:
+            self.stats.record_decode(endpoint, time.perf_counter() - start)
+        return data
+
+    def _conditional_headers(self, key):
+        with self._conditional_lock:
+            entry = self._conditional_responses.get(key)
+        headers = {}
+        if entry is not None:
+            etag, last_modified, _ = entry
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _conditional_response(self, key):
+        with self._conditional_lock:
+            entry = self._conditional_responses.get(key)
+            if entry is None:
+                return None
+            self._conditional_responses.move_to_end(key)
+        logging.debug("Not modified: " + key)
+        return entry[2]
+
+    def _store_conditional(self, key, response_headers, content):
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        # The body is kept rather than the decoded response, so that each
+        # hit is decoded afresh and callers can't mutate each other's results
+        with self._conditional_lock:
+            self._conditional_responses[key] = (etag, last_modified, content)
+            self._conditional_responses.move_to_end(key)
+            while len(self._conditional_responses) > MAX_CONDITIONAL_ENTRIES:
+                self._conditional_responses.popitem(last=False)
+
     def _get_rate_limit_delta(self, response):
         server_datetime = response.headers["Date"].split(" ")
         server_hms = server_datetime[4].split(":")
@@ -132,7 +473,61 @@ class PUBGCore(object):
 
         return delta
 
-    def leaderboard(self, game_mode, shard=None):
+    def _download_raw(self, url, fileobj, endpoint, params=None, limited=True):
+        policy = self.retry.for_endpoint(endpoint)
+        seekable = getattr(fileobj, "seekable", lambda: False)()
+        position = fileobj.tell() if seekable else None
+        attempt = 1
+        while True:
+            response = self._get(url, params, limited, stream=True, endpoint=endpoint)
+            try:
+                return self._write_raw(response, fileobj, endpoint)
+            except RAW_RETRY_EXCEPTIONS as exc:
+                self._record_failure(self._circuit(url))
+                # Only retry if the partial body can be discarded
+                if not seekable or not policy.connection_errors or attempt >= policy.max_attempts:
+                    raise exc
+                fileobj.seek(position)
+                fileobj.truncate()
+                self._backoff(policy, attempt, type(exc).__name__, endpoint)
+                attempt += 1
+
+    def _write_raw(self, response, fileobj, endpoint):
+        encoding = response.headers.get("Content-Encoding", "identity").strip().lower()
+        if encoding not in ("gzip", "identity", ""):
+            response.close()
+            raise ContentDecodingError("Unsupported Content-Encoding: " + encoding + ".")
+        written = 0
+        try:
+            # A gzipped body is passed through as is, and an identity body
+            # needs no decoding
+            for chunk in response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False):
+                fileobj.write(chunk)
+                written += len(chunk)
+        finally:
+            response.close()
+            if self.stats is not None:
+                self.stats.record_bytes(endpoint, written)
+        return written
+
+    def _iter_stream(self, response, endpoint):
+        decompressed_bytes = 0
+
+        def iter_chunks():
+            nonlocal decompressed_bytes
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                decompressed_bytes += len(chunk)
+                yield chunk
+
+        try:
+            for element in iter_json_array(iter_chunks()):
+                yield element
+        finally:
+            response.close()
+            if self.stats is not None:
+                self.stats.record_bytes(endpoint, response.raw.tell(), decompressed_bytes)
+
+    def leaderboard(self, game_mode, shard=None, fileobj=None):
         """Get a response from the leaderboards endpoint.
 
         Description: https://documentation.pubg.com/en/leaderboards-endpoint.html
@@ -140,13 +535,16 @@ class PUBGCore(object):
         :param str game_mode: the PUBG game mode to query
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the json response from ``/{shard}/leaderboards/{game_mode}``
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the json response from ``/{shard}/leaderboards/{game_mode}``,
+            or the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/leaderboards/" + game_mode
-        return self._get(url).json()
+        return self._get_json("leaderboard", url, fileobj=fileobj)
 
-    def lifetime(self, player_id, shard=None):
+    def lifetime(self, player_id, shard=None, fileobj=None):
         """Get a response from the lifetime stats endpoint.
 
         Description: https://documentation.pubg.com/en/lifetime-stats.html
@@ -154,13 +552,16 @@ class PUBGCore(object):
         :param str player_id: the PUBG ``player_id`` (account id) to query
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the json response from ``/{shard}/players/{player_id}/seasons/lifetime``
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the json response from ``/{shard}/players/{player_id}/seasons/lifetime``,
+            or the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/players/" + player_id + "/seasons/lifetime"
-        return self._get(url).json()
+        return self._get_json("lifetime", url, fileobj=fileobj)
 
-    def match(self, match_id, shard=None):
+    def match(self, match_id, shard=None, fileobj=None):
         """Get a response from the match endpoint.
 
         Description: https://documentation.playbattlegrounds.com/en/matches-endpoint.html
@@ -170,13 +571,16 @@ class PUBGCore(object):
         :param str match_id: the ``match_id`` to query
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the json response from ``/{shard}/matches/{match_id}``
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the json response from ``/{shard}/matches/{match_id}``, or
+            the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/matches/" + match_id
-        return self._get(url, limited=False).json()
+        return self._get_json("match", url, limited=False, fileobj=fileobj)
 
-    def player(self, player_id, shard=None):
+    def player(self, player_id, shard=None, fileobj=None):
         """Get a response from the player endpoint.
 
         Endpoints: https://documentation.playbattlegrounds.com/en/players-endpoint.html
@@ -184,13 +588,16 @@ class PUBGCore(object):
         :param str player_id: the PUBG ``player_id`` (account id) to query
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the JSON response from ``/{shard}/players/{player_id}``
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response from ``/{shard}/players/{player_id}``, or
+            the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/players/" + str(player_id)
-        return self._get(url).json()
+        return self._get_json("player", url, fileobj=fileobj)
 
-    def player_season(self, player_id, season_id, shard=None):
+    def player_season(self, player_id, season_id, shard=None, fileobj=None):
         """Get a response from the player/season endpoint.
 
         Endpoints: https://documentation.playbattlegrounds.com/en/players-endpoint.html
@@ -199,8 +606,11 @@ class PUBGCore(object):
         :param str season_id: the ``season_id`` to query
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
         :return: the JSON response from
-            ``/{shard}/players/{player_id}/seasons/{season_id}``
+            ``/{shard}/players/{player_id}/seasons/{season_id}``, or the number
+            of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         platform_region = shard.split("-")
@@ -212,9 +622,9 @@ class PUBGCore(object):
             logging.info("Using shard " + shard + ".")
         url = SHARD_URL + shard + "/players/" + str(player_id)
         url = url + "/seasons/" + str(season_id)
-        return self._get(url).json()
+        return self._get_json("player_season", url, fileobj=fileobj)
 
-    def players(self, filter_type, filter_value, shard=None):
+    def players(self, filter_type, filter_value, shard=None, fileobj=None):
         """Get a response from the players endpoint.
 
         Description: https://documentation.playbattlegrounds.com/en/players-endpoint.html
@@ -224,7 +634,10 @@ class PUBGCore(object):
             ``player_names`` to search
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the response from the ``/{shard}/players`` endpoint
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the response from the ``/{shard}/players`` endpoint, or the
+            number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         if filter_type not in PLAYER_FILTERS:
@@ -234,9 +647,9 @@ class PUBGCore(object):
 
         params = {"filter[" + PLAYER_FILTERS[filter_type] + "]": filter_value}
         url = SHARD_URL + shard + "/players"
-        return self._get(url, params).json()
+        return self._get_json("players", url, params, fileobj=fileobj)
 
-    def samples(self, start=None, shard=None):
+    def samples(self, start=None, shard=None, fileobj=None):
         """Get a response from the samples endpoint.
 
         Description: https://documentation.playbattlegrounds.com/en/samples-endpoint.html
@@ -245,38 +658,47 @@ class PUBGCore(object):
             samples
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the JSON response from the ``/{shard}/samples`` endpoint
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response from the ``/{shard}/samples`` endpoint, or
+            the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/samples"
         params = {}
         if start is not None:
             params = {"filter[createdAt-start]": start}
-        return self._get(url, params).json()
+        return self._get_json("samples", url, params, fileobj=fileobj)
 
-    def seasons(self, shard=None):
+    def seasons(self, shard=None, fileobj=None):
         """Get a response from the seasons endpoint.
 
         Description: https://documentation.playbattlegrounds.com/en/players-endpoint.html#/Seasons/get_seasons
 
         :param str shard: (optional) the ``shard`` to use if different from
             the one used on instantiation
-        :return: the JSON response from the ``/{shard}/seasons`` endpoint.
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response from the ``/{shard}/seasons`` endpoint, or
+            the number of bytes written if ``fileobj`` is given
         """
         shard = self._check_shard(shard)
         url = SHARD_URL + shard + "/seasons"
-        return self._get(url).json()
+        return self._get_json("seasons", url, fileobj=fileobj)
 
-    def status(self):
+    def status(self, fileobj=None):
         """Get a response from the status endpoint.
 
         Description: https://documentation.playbattlegrounds.com/en/status-endpoint.html
 
-        :return: the JSON response from the ``/status`` endpoint.
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response from the ``/status`` endpoint, or the
+            number of bytes written if ``fileobj`` is given
         """
-        return self._get(STATUS_URL, limited=False).json()
+        return self._get_json("status", STATUS_URL, limited=False, fileobj=fileobj)
 
-    def telemetry(self, url):
+    def telemetry(self, url, stream=False, fileobj=None):
         """Download the telemetry data.
 
         Description: https://documentation.playbattlegrounds.com/en/telemetry.html
@@ -284,25 +706,47 @@ class PUBGCore(object):
         Calls here do not apply to the rate limit.
 
         :param str url: the telemetry data URL
-        :return: the JSON response for the telemetry URL
+        :param bool stream: (default=*False*) if *True*, incrementally decode
+            the (gzipped) response as it is downloaded and return an iterator
+            over the telemetry events instead of the full list
+        :param fileobj: (optional) a binary file object to which the response
+            body is written in chunks as it is downloaded, without being
+            decompressed or decoded. The body is gzipped if the server sent
+            it gzipped, and plain JSON otherwise. Any other
+            ``Content-Encoding`` raises ``ContentDecodingError``. If the
+            connection drops during the download, it is retried under the
+            retry policy only if ``fileobj`` is seekable, in which case the
+            partial body is truncated first.
+        :return: the JSON response for the telemetry URL, or the number of
+            bytes written if ``fileobj`` is given
         """
-        return self._get(url, limited=False).json()
+        if fileobj is not None:
+            return self._download_raw(url, fileobj, "telemetry", limited=False)
+        if stream:
+            return self._iter_stream(self._get(url, limited=False, stream=True, endpoint="telemetry"), "telemetry")
+        return self._get_json("telemetry", url, limited=False)
 
-    def tournament(self, tournament_id):
+    def tournament(self, tournament_id, fileobj=None):
         """Get information about a tournament.
 
         Description: https://documentation.playbattlegrounds.com/en/tournaments-endpoint.html#/Tournaments/get_tournaments__id_
 
         :param str tournament_id: the tournament ID on which to retrieve data
-        :return: the JSON response for the tournament id
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response for the tournament id, or the number of
+            bytes written if ``fileobj`` is given
         """
-        return self._get(TOURNAMENTS_URL + "/" + tournament_id).json()
+        return self._get_json("tournament", TOURNAMENTS_URL + "/" + tournament_id, fileobj=fileobj)
 
-    def tournaments(self):
+    def tournaments(self, fileobj=None):
         """Get a list of tournaments.
 
         Description: https://documentation.playbattlegrounds.com/en/tournaments-endpoint.html#/Tournaments/get_tournaments
 
-        :return: the JSON response for the tournaments endpoint
+        :param fileobj: (optional) a binary file object to which the response
+            body is written as it is downloaded, as for :meth:`telemetry`
+        :return: the JSON response for the tournaments endpoint, or the number
+            of bytes written if ``fileobj`` is given
         """
-        return self._get(TOURNAMENTS_URL).json()
+        return self._get_json("tournaments", TOURNAMENTS_URL, fileobj=fileobj)
@@ -0,0 +1,186 @@
+"""Rate limiters for PUBGCore."""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+
+#: Default number of requests allowed per rate limit period
+RATE_LIMIT = 10
+#: Default rate limit period in seconds
+RATE_LIMIT_PERIOD = 60
+
+
+class BaseLimiter(ABC):
+    """Base class for PUBGCore rate limiters.
+
+    Limiters are token buckets which are consulted before each rate limited
+    request. Tokens refill continuously at ``rate`` per ``period`` seconds, up
+    to a max of ``burst`` tokens, and each request takes one token. Requests
+    made when no token is available reserve a future token, and wait until
+    it is available.
+
+    The bucket is also drained to the ``X-RateLimit-Remaining`` reported by
+    each response, so that it never allows more requests than the API, and
+    when the API reports no remaining requests, no token is available until
+    the reported reset time.
+
+    :param int rate: the number of requests allowed per period
+    :param float period: the period in seconds
+    :param int burst: (optional) the max number of requests which may be made
+        at once, by default ``rate``
+    """
+
+    def __init__(self, rate=RATE_LIMIT, period=RATE_LIMIT_PERIOD, burst=None):
+        #: The number of requests allowed per period
+        self.rate = rate
+        #: The period in seconds
+        self.period = period
+        #: The max number of requests which may be made at once
+        self.burst = rate if burst is None else burst
+
+    @abstractmethod
+    def reserve(self):
+        """Take a token for a request.
+
+        :return: the number of seconds to wait before making the request
+        """
+
+    @abstractmethod
+    def update(self, remaining, reset):
+        """Update the bucket with the rate limit reported by a response.
+
+        :param int remaining: the number of requests remaining
+        :param float reset: the epoch time at which the rate limit resets
+        """
+
+    def acquire(self):
+        """Take a token for a request, sleeping until it is available.
+
+        :return: the number of seconds slept
+        """
+        delay = self.reserve()
+        if delay > 0:
+            limiter_name = type(self).__name__
+            logging.warning("Rate limited by " + limiter_name + ". Sleeping for " + str(int(delay)) + " seconds.")
+            time.sleep(delay)
+        return max(delay, 0)
+
+    def _refill(self, tokens, updated, now):
+        return min(self.burst, tokens + (now - updated) * self.rate / self.period)
+
+    def _take(self, tokens, updated, now):
+        tokens = self._refill(tokens, updated, now) - 1
+        return tokens, max(0.0, -tokens * self.period / self.rate)
+
+    def _drain(self, tokens, updated, now, remaining, reset):
+        tokens = min(self._refill(tokens, updated, now), remaining)
+        if remaining <= 0 and reset > now:
+            # Delay the next token until the reset time
+            tokens = min(tokens, 1 - (reset - now) * self.rate / self.period)
+        return tokens
+
+
+class TokenBucketLimiter(BaseLimiter):
+    """An in-process token bucket rate limiter.
+
+    The limiter may be shared by multiple threads and PUBGCore instances
+    which use the same API key.
+
+    :param int rate: the number of requests allowed per period
+    :param float period: the period in seconds
+    :param int burst: (optional) the max number of requests which may be made
+        at once, by default ``rate``
+    """
+
+    def __init__(self, rate=RATE_LIMIT, period=RATE_LIMIT_PERIOD, burst=None):
+        super().__init__(rate, period, burst)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.time()
+
+    def reserve(self):
+        with self._lock:
+            now = time.time()
+            self._tokens, delay = self._take(self._tokens, self._updated, now)
+            self._updated = now
+        return delay
+
+    def update(self, remaining, reset):
+        with self._lock:
+            now = time.time()
+            self._tokens = self._drain(self._tokens, self._updated, now, remaining, reset)
+            self._updated = now
+
+
+class SQLiteLimiter(BaseLimiter):
+    """A token bucket rate limiter shared across processes.
+
+    The bucket is stored in a SQLite database, and each reservation is made
+    in an exclusive transaction, so that every process using the database
+    shares the same rate limit.
+
+    :param str path: the database file
+    :param str name: (default="default") the name of the bucket, e.g. to
+        share one database between several API keys
+    :param int rate: the number of requests allowed per period
+    :param float period: the period in seconds
+    :param int burst: (optional) the max number of requests which may be made
+        at once, by default ``rate``
+    """
+
+    def __init__(self, path, name="default", rate=RATE_LIMIT, period=RATE_LIMIT_PERIOD, burst=None):
+        super().__init__(rate, period, burst)
+        #: The database file
+        self.path = path
+        #: The name of the bucket
+        self.name = name
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+            connection.execute(
+                "INSERT OR IGNORE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (name, self.burst, time.time()),
+            )
+            connection.execute("COMMIT")
+
+    def _connect(self):
+        # Connections can't be shared with forked processes
+        if self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+            self._pid = os.getpid()
+        return self._connection
+
+    def _transact(self, fn):
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                tokens, updated = connection.execute(
+                    "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = time.time()
+                tokens, result = fn(tokens, updated, now)
+                connection.execute(
+                    "UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?", (tokens, now, self.name)
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return result
+
+    def reserve(self):
+        return self._transact(self._take)
+
+    def update(self, remaining, reset):
+        def drain(tokens, updated, now):
+            return self._drain(tokens, updated, now, remaining, reset), None
+
+        self._transact(drain)
@@ -1,4 +1,7 @@
 """PUBG model-API interface."""
+from concurrent.futures import ThreadPoolExecutor
+
+from chicken_dinner.constants import MAX_WORKERS
 from chicken_dinner.models import Leaderboard
 from chicken_dinner.models import Player
 from chicken_dinner.models import Players
@@ -10,25 +13,74 @@ from chicken_dinner.models import Tournament
 from chicken_dinner.models import Tournaments
 from chicken_dinner.models.match import Match
 from chicken_dinner.models.telemetry import Telemetry
+from chicken_dinner.pubgapi.core import POOL_SIZE
 from chicken_dinner.pubgapi.core import PUBGCore
 
 
 class PUBG(object):
     """High level type-based interface to the PUBG JSON API.
 
-    :param str api_key: your PUBG api key
+    :param api_key: your PUBG api key, or a list of api keys to use as a pool
     :param str shard: (optional) a shard to use for all requests with this
         instance
     :param bool gzip: (default=*True*) whether to gzip the responses. Responses
         are automatically unzipped by the underlying ``requests`` library.
+    :param cache: (optional) a response cache, e.g. a
+        :class:`chicken_dinner.pubgapi.cache.FileCache` or
+        :class:`chicken_dinner.pubgapi.cache.SQLiteCache` instance
+    :param limiter: (optional) a rate limiter, e.g. a
+        :class:`chicken_dinner.pubgapi.limiter.TokenBucketLimiter` or
+        :class:`chicken_dinner.pubgapi.limiter.SQLiteLimiter` instance
+    :param bool conditional: (default=*False*) whether to make conditional
+        requests for player, season and leaderboard data, reusing the last
+        response when the API responds with 304 Not Modified
+    :param retry: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.RetryPolicy` for failed requests
+    :param circuit_breaker: (optional) a
+        :class:`chicken_dinner.pubgapi.retry.CircuitBreaker` which stops
+        requests to a failing shard or host
+    :param stats: (optional) a
+        :class:`chicken_dinner.pubgapi.stats.RequestStats` instance which
+        records request latencies, sizes, decoding time, retries, cache hits
+        and rate limit sleeps
+    :param decoder: (optional) a callable which decodes JSON from the
+        ``bytes`` of a response, by default ``orjson.loads`` if ``orjson`` is
+        installed, otherwise ``json.loads``
+    :param int pool_size: the max number of connections kept alive for each
+        host, which should be at least the number of concurrent requests
     """
 
-    def __init__(self, api_key, shard=None, gzip=True):
-        self._core = PUBGCore(api_key, shard, gzip)
+    def __init__(
+        self,
+        api_key,
+        shard=None,
+        gzip=True,
+        cache=None,
+        limiter=None,
+        conditional=False,
+        retry=None,
+        circuit_breaker=None,
+        stats=None,
+        decoder=None,
+        pool_size=POOL_SIZE,
+    ):
+        self._core = PUBGCore(
+            api_key,
+            shard,
+            gzip,
+            cache=cache,
+            limiter=limiter,
+            conditional=conditional,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            stats=stats,
+            decoder=decoder,
+            pool_size=pool_size,
+        )
 
     @property
     def api_key(self):
-        """The API key being used."""
+        """The API key (or list of API keys) being used."""
         return self._core.api_key
 
     @api_key.setter
@@ -95,6 +147,38 @@ class PUBG(object):
         shard = shard or self.shard
         return Match(self, match_id, shard)
 
+    def matches(self, match_ids, shard=None, max_workers=MAX_WORKERS, raise_errors=False):
+        """Get multiple matches concurrently.
+
+        Match requests do not apply to the rate limit, so matches are fetched
+        in a thread pool sharing this instance's session.
+
+        :param list match_ids: the match ids to query
+        :param str shard: (optional) the shard to use if different from the
+            instance shard
+        :param int max_workers: the max number of concurrent requests
+        :param bool raise_errors: (default=*False*) whether to raise the first
+            error encountered. Otherwise, the exception for a match which
+            could not be fetched is returned in its place.
+        :return: a list of :class:`chicken_dinner.models.Match` objects in
+            the same order as ``match_ids``
+        """
+        shard = shard or self.shard
+
+        def fetch(match_id):
+            try:
+                return Match(self, match_id, shard)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            matches = list(executor.map(fetch, match_ids))
+        if raise_errors:
+            for match in matches:
+                if isinstance(match, Exception):
+                    raise match
+        return matches
+
     def samples(self, start=None, shard=None):
         """Get match samples.
 
@@ -176,7 +260,8 @@ class PUBG(object):
     def players_from_ids(self, player_ids, shard=None):
         """Get multiple players' metadata from a list of ``player_ids``.
 
-        :param list player_ids: a list of strings of ``player_ids``
+        :param list player_ids: a list of strings of ``player_ids`` of any
+            length, which is fetched in chunks of 10
         :param str shard: (optional) the shard to use if different from the
             instance shard
         :return: an iterable :class:`chicken_dinner.models.Players` object
@@ -189,7 +274,8 @@ class PUBG(object):
     def players_from_names(self, player_names, shard=None):
         """Get multiple players' metadata from a list of ``player_names``.
 
-        :param list player_names: a list of strings of ``player_names``
+        :param list player_names: a list of strings of ``player_names`` of
+            any length, which is fetched in chunks of 10
         :param str shard: (optional) the shard to use if different from the
             instance shard
         :return: an iterable :class:`chicken_dinner.models.Players` object
@@ -199,15 +285,22 @@ class PUBG(object):
         shard = shard or self.shard
         return Players(self, "player_names", player_names, shard)
 
-    def telemetry(self, url, map_assets=False):
+    def telemetry(self, url, map_assets=False, stream=False, lazy=False):
         """Get a telemetry object from a telemetry url.
 
         :param str url: the url for the telemetry data
         :param bool map_assets: whether to map asset ids to named values, e.g.
             map ``Item_Weapon_AK47_C`` to ``AKM``.
+        :param bool stream: (default=*False*) if *True*, return an iterator
+            of :class:`chicken_dinner.models.telemetry.TelemetryEvent`
+            objects which are decoded as the telemetry is downloaded
+        :param bool lazy: (default=*False*) whether to convert event
+            attributes only when they are first accessed
         :return: a :class:`chicken_dinner.models.telemetry.Telemetry` object
         """
-        return Telemetry(self, url)
+        if stream:
+            return Telemetry.stream(url, self, map_assets=map_assets, lazy=lazy)
+        return Telemetry(self, url, map_assets=map_assets, lazy=lazy)
 
     def tournament(self, tournament_id):
         """Get a tournament by its id.
@@ -0,0 +1,144 @@
+"""Retry policies and circuit breakers for PUBGCore."""
+import random
+import threading
+import time
+
+from requests.exceptions import RequestException
+
+#: HTTP status codes which are retried by default
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(RequestException):
+    """Raised when a request is refused because its circuit is open."""
+
+
+class RetryPolicy(object):
+    """Retry policy for PUBGCore requests.
+
+    Failed requests are retried after a backoff delay which grows
+    exponentially with each attempt and is randomized with "full jitter", so
+    that many clients don't retry in lockstep. Rate limited (429) responses
+    instead wait for the rate limit to reset.
+
+    :param int max_attempts: the max number of attempts for a request,
+        including the first
+    :param float backoff: the base backoff delay in seconds
+    :param float max_backoff: the max backoff delay in seconds
+    :param statuses: the HTTP status codes which are retried
+    :param bool connection_errors: whether to retry connection errors and
+        timeouts
+    :param dict endpoints: (optional) a map of endpoint names, e.g.
+        ``telemetry``, to the RetryPolicy to use for that endpoint
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=1,
+        max_backoff=60,
+        statuses=RETRY_STATUSES,
+        connection_errors=True,
+        endpoints=None,
+    ):
+        #: The max number of attempts for a request
+        self.max_attempts = max_attempts
+        #: The base backoff delay in seconds
+        self.backoff = backoff
+        #: The max backoff delay in seconds
+        self.max_backoff = max_backoff
+        #: The HTTP status codes which are retried
+        self.statuses = frozenset(statuses)
+        #: Whether to retry connection errors and timeouts
+        self.connection_errors = connection_errors
+        #: Policies for specific endpoints
+        self.endpoints = endpoints or {}
+
+    def for_endpoint(self, endpoint):
+        """Get the policy for an endpoint.
+
+        :param str endpoint: the PUBGCore endpoint name
+        :return: the RetryPolicy for the endpoint
+        """
+        return self.endpoints.get(endpoint, self)
+
+    def delay(self, attempt):
+        """The backoff delay after a failed attempt.
+
+        :param int attempt: the number of the failed attempt, starting at 1
+        :return: the delay in seconds
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+#: The default policy, which retries rate limited requests once
+DEFAULT_RETRY_POLICY = RetryPolicy(max_attempts=2, statuses=(429,), connection_errors=False)
+
+
+class CircuitBreaker(object):
+    """Circuit breaker for PUBGCore requests.
+
+    Tracks consecutive failures (server errors and connection errors) for
+    each circuit, which is the shard of a request to the API, or the host of
+    any other request, e.g. the telemetry CDN. Once a circuit fails
+    ``threshold`` times in a row, it opens, and requests on it immediately
+    raise :class:`CircuitOpenError` rather than adding load to a failing
+    service. After ``recovery_time`` seconds, one trial request is allowed,
+    which closes the circuit if it succeeds.
+
+    :param int threshold: the number of consecutive failures which opens a
+        circuit
+    :param float recovery_time: the number of seconds after which an open
+        circuit allows a trial request
+    """
+
+    def __init__(self, threshold=5, recovery_time=30):
+        #: The number of consecutive failures which opens a circuit
+        self.threshold = threshold
+        #: The number of seconds before an open circuit allows a trial request
+        self.recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened = {}
+
+    def is_open(self, circuit):
+        """Whether a circuit is open.
+
+        :param str circuit: the circuit
+        """
+        return circuit in self._opened
+
+    def check(self, circuit):
+        """Check that a request may be made on a circuit.
+
+        :param str circuit: the circuit
+        :raises CircuitOpenError: if the circuit is open
+        """
+        with self._lock:
+            opened = self._opened.get(circuit)
+            if opened is None:
+                return
+            if time.time() - opened < self.recovery_time:
+                raise CircuitOpenError("Circuit open for " + circuit + ".")
+            # Allow one trial request and hold off any others
+            self._opened[circuit] = time.time()
+
+    def success(self, circuit):
+        """Record a successful request on a circuit.
+
+        :param str circuit: the circuit
+        """
+        with self._lock:
+            self._failures.pop(circuit, None)
+            self._opened.pop(circuit, None)
+
+    def failure(self, circuit):
+        """Record a failed request on a circuit.
+
+        :param str circuit: the circuit
+        """
+        with self._lock:
+            failures = self._failures.get(circuit, 0) + 1
+            self._failures[circuit] = failures
+            if failures >= self.threshold:
+                self._opened[circuit] = time.time()
@@ -0,0 +1,189 @@
+"""Request instrumentation for PUBGCore."""
+import bisect
+import threading
+
+#: Default upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class EndpointStats(object):
+    """Request statistics for a single endpoint.
+
+    :param buckets: the upper bounds in seconds of the latency histogram
+        buckets
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        #: The upper bounds in seconds of the latency histogram buckets
+        self.buckets = tuple(buckets)
+        #: The number of requests which received a response
+        self.requests = 0
+        #: The number of responses in each latency bucket, with a final
+        #: bucket for responses slower than the last bound
+        self.latency_histogram = [0] * (len(self.buckets) + 1)
+        #: The total latency of all requests in seconds
+        self.latency_total = 0.0
+        #: The number of response bytes received, before decompression, where
+        #: known
+        self.compressed_bytes = 0
+        #: The number of response bytes after decompression
+        self.decompressed_bytes = 0
+        #: The total time spent decoding JSON responses in seconds
+        self.decode_time = 0.0
+        #: The number of retried requests
+        self.retries = 0
+        #: The number of responses served from the response cache
+        self.cache_hits = 0
+        #: The number of 304 Not Modified responses to conditional requests
+        self.not_modified = 0
+
+    @property
+    def latency_mean(self):
+        """The mean latency of requests in seconds."""
+        if self.requests == 0:
+            return 0.0
+        return self.latency_total / self.requests
+
+    def to_dict(self):
+        """The statistics as a dict."""
+        bounds = [str(bound) for bound in self.buckets] + ["inf"]
+        return {
+            "requests": self.requests,
+            "latency_mean": self.latency_mean,
+            "latency_histogram": dict(zip(bounds, self.latency_histogram)),
+            "compressed_bytes": self.compressed_bytes,
+            "decompressed_bytes": self.decompressed_bytes,
+            "decode_time": self.decode_time,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+        }
+
+
+class RequestStats(object):
+    """Request instrumentation for PUBGCore.
+
+    Records per endpoint latency histograms, response sizes, JSON decoding
+    time, retries and cache hits, as well as the time spent sleeping for rate
+    limits and retry backoff, so that it can be seen whether time goes to the
+    network, to throttling or to decoding. A single instance may be shared by
+    several PUBGCore instances and threads.
+
+    Each ``record_*`` method is a hook called by PUBGCore, which subclasses
+    may extend to forward measurements to a metrics system.
+
+    :param buckets: the upper bounds in seconds of the latency histogram
+        buckets
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        #: The upper bounds in seconds of the latency histogram buckets
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded statistics."""
+        with self._lock:
+            #: The :class:`EndpointStats` of each endpoint
+            self.endpoints = {}
+            #: The total time spent sleeping for rate limits in seconds
+            self.rate_limit_sleep = 0.0
+            #: The total time spent sleeping before retries in seconds
+            self.retry_sleep = 0.0
+
+    def _endpoint(self, endpoint):
+        endpoint = endpoint or "unknown"
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = EndpointStats(self.buckets)
+        return self.endpoints[endpoint]
+
+    def record_response(self, endpoint, latency, compressed_bytes=None, decompressed_bytes=None):
+        """Record a response.
+
+        :param str endpoint: the endpoint name
+        :param float latency: the time until the response was received in
+            seconds
+        :param int compressed_bytes: (optional) the size of the response body
+            before decompression
+        :param int decompressed_bytes: (optional) the size of the response
+            body after decompression
+        """
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.requests += 1
+            stats.latency_total += latency
+            stats.latency_histogram[bisect.bisect_left(self.buckets, latency)] += 1
+            if compressed_bytes is not None:
+                stats.compressed_bytes += compressed_bytes
+            if decompressed_bytes is not None:
+                stats.decompressed_bytes += decompressed_bytes
+
+    def record_bytes(self, endpoint, compressed_bytes=None, decompressed_bytes=None):
+        """Record the size of a streamed response body once it is read.
+
+        :param str endpoint: the endpoint name
+        :param int compressed_bytes: (optional) the size of the response body
+            before decompression
+        :param int decompressed_bytes: (optional) the size of the response
+            body after decompression
+        """
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            if compressed_bytes is not None:
+                stats.compressed_bytes += compressed_bytes
+            if decompressed_bytes is not None:
+                stats.decompressed_bytes += decompressed_bytes
+
+    def record_decode(self, endpoint, duration):
+        """Record the time spent decoding a JSON response.
+
+        :param str endpoint: the endpoint name
+        :param float duration: the decoding time in seconds
+        """
+        with self._lock:
+            self._endpoint(endpoint).decode_time += duration
+
+    def record_retry(self, endpoint, sleep_duration):
+        """Record a retried request.
+
+        :param str endpoint: the endpoint name
+        :param float sleep_duration: the backoff time before the retry in
+            seconds
+        """
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+            self.retry_sleep += sleep_duration
+
+    def record_cache_hit(self, endpoint):
+        """Record a response served from the response cache.
+
+        :param str endpoint: the endpoint name
+        """
+        with self._lock:
+            self._endpoint(endpoint).cache_hits += 1
+
+    def record_not_modified(self, endpoint):
+        """Record a 304 Not Modified response to a conditional request.
+
+        :param str endpoint: the endpoint name
+        """
+        with self._lock:
+            self._endpoint(endpoint).not_modified += 1
+
+    def record_rate_limit_sleep(self, sleep_duration):
+        """Record time spent sleeping for a rate limit.
+
+        :param float sleep_duration: the sleep time in seconds
+        """
+        with self._lock:
+            self.rate_limit_sleep += sleep_duration
+
+    def to_dict(self):
+        """The statistics as a dict."""
+        with self._lock:
+            return {
+                "endpoints": {endpoint: stats.to_dict() for endpoint, stats in self.endpoints.items()},
+                "rate_limit_sleep": self.rate_limit_sleep,
+                "retry_sleep": self.retry_sleep,
+            }
@@ -0,0 +1,234 @@
+"""Local telemetry archive."""
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from chicken_dinner.models.telemetry import Telemetry
+from chicken_dinner.util import iter_json_array
+from chicken_dinner.util import json_loads
+
+ARCHIVE_FILENAME = "telemetry.pack"
+INDEX_FILENAME = "index.jsonl"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class TelemetryStore(object):
+    """Compressed local telemetry archive.
+
+    Persists gzipped telemetry for many matches in a single append-only
+    archive file alongside an index file which maps each match id to the
+    offset and length of its telemetry in the archive. Telemetry can then be
+    read back by match id, or iterated over for an entire archive, without
+    any network access.
+
+    A store may be read by multiple processes, but should only be written to
+    by one process at a time.
+
+    :param str path: the directory for the archive, created if it doesn't
+        exist
+    """
+
+    def __init__(self, path):
+        #: The directory of the archive
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._archive_path = os.path.join(path, ARCHIVE_FILENAME)
+        self._index_path = os.path.join(path, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._index = {}
+        self._index_newline = False
+        self._load_index()
+
+    def __contains__(self, match_id):
+        return match_id in self._index
+
+    def __iter__(self):
+        return iter(list(self._index))
+
+    def __len__(self):
+        return len(self._index)
+
+    def _load_index(self):
+        try:
+            archive_size = os.path.getsize(self._archive_path)
+        except OSError:
+            archive_size = 0
+        stale = False
+        try:
+            with open(self._index_path, "r") as f:
+                for line in f:
+                    # An interrupted write may leave the last line unterminated
+                    self._index_newline = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry["offset"] + entry["length"] <= archive_size:
+                        self._index[entry["match_id"]] = (entry["offset"], entry["length"])
+                    else:
+                        stale = True
+        except FileNotFoundError:
+            pass
+        if stale:
+            # Drop entries for telemetry which was never fully written, before
+            # later writes to the archive cover their range and make them look
+            # valid
+            self._write_index()
+
+    def _write_index(self):
+        partial = self._index_path + ".tmp"
+        with open(partial, "w") as f:
+            for match_id, (offset, length) in self._index.items():
+                f.write(json.dumps({"match_id": match_id, "offset": offset, "length": length}) + "\n")
+        os.replace(partial, self._index_path)
+        self._index_newline = False
+
+    @property
+    def match_ids(self):
+        """The match ids in the archive, in the order they were added."""
+        return list(self._index)
+
+    def put(self, match_id, telemetry, overwrite=False):
+        """Add telemetry for a match to the archive.
+
+        :param str match_id: the match id
+        :param telemetry: the telemetry as gzipped or raw JSON ``bytes``, or
+            the deserialized JSON response
+        :param bool overwrite: (default=*False*) whether to replace telemetry
+            already in the archive for this match
+        """
+        # Skip encoding telemetry which is already stored
+        if match_id in self._index and not overwrite:
+            return
+        if not isinstance(telemetry, bytes):
+            telemetry = json.dumps(telemetry, separators=(",", ":")).encode("utf-8")
+        if telemetry[:2] != GZIP_MAGIC:
+            telemetry = gzip.compress(telemetry)
+        with self._lock:
+            # Another thread may have stored it meanwhile
+            if match_id in self._index and not overwrite:
+                return
+            with open(self._archive_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(telemetry)
+            self._add_to_index(match_id, offset, len(telemetry))
+
+    def _add_to_index(self, match_id, offset, length):
+        with open(self._index_path, "a") as f:
+            if self._index_newline:
+                f.write("\n")
+                self._index_newline = False
+            f.write(json.dumps({"match_id": match_id, "offset": offset, "length": length}) + "\n")
+        self._index[match_id] = (offset, length)
+
+    def get_bytes(self, match_id):
+        """Get the gzipped telemetry for a match.
+
+        :param str match_id: the match id
+        :return: the gzipped telemetry ``bytes``
+        """
+        offset, length = self._index[match_id]
+        with open(self._archive_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def load(self, match_id):
+        """Get the deserialized telemetry for a match.
+
+        :param str match_id: the match id
+        :return: the telemetry JSON as a list of events
+        """
+        return json_loads(gzip.decompress(self.get_bytes(match_id)))
+
+    def stream(self, match_id, chunk_size=2 ** 16):
+        """Iterate over the raw telemetry events for a match.
+
+        Events are decoded incrementally, so the full telemetry is never held
+        in memory.
+
+        :param str match_id: the match id
+        :param int chunk_size: the number of bytes to decompress at a time
+        :return: a generator of event dicts
+        """
+        offset, length = self._index[match_id]
+        with open(self._archive_path, "rb") as f:
+            f.seek(offset)
+            with gzip.GzipFile(fileobj=_Slice(f, length)) as gz:
+                for event in iter_json_array(iter(lambda: gz.read(chunk_size), b"")):
+                    yield event
+
+    def telemetry(self, match_id, pubg=None, shard=None, map_assets=False, lazy=False):
+        """Get a Telemetry instance for a match in the archive.
+
+        :param str match_id: the match id
+        :param pubg: (optional) a PUBG instance
+        :param str shard: (optional) the shard for the match
+        :param bool map_assets: whether to map asset ids to named values
+        :param bool lazy: whether to lazily evaluate events
+        :return: a :class:`chicken_dinner.models.telemetry.Telemetry` instance
+        """
+        return Telemetry(pubg, None, self.load(match_id), shard, map_assets=map_assets, lazy=lazy)
+
+    def iter_telemetry(self, **kwargs):
+        """Iterate over the Telemetry instances for every match in the archive.
+
+        Keyword arguments are passed to :meth:`telemetry`.
+
+        :return: a generator of ``(match_id, telemetry)`` tuples
+        """
+        for match_id in self:
+            yield match_id, self.telemetry(match_id, **kwargs)
+
+    def fetch(self, pubg, match_id, shard=None, telemetry_url=None):
+        """Download the telemetry for a match and add it to the archive.
+
+        Matches already in the archive are not downloaded again. The gzipped
+        response is written to disk as it is downloaded and copied into the
+        archive, without being decompressed or decoded.
+
+        :param pubg: a PUBG instance
+        :param str match_id: the match id
+        :param str shard: (optional) the shard for the match
+        :param str telemetry_url: (optional) the telemetry url for the match,
+            if known, to avoid requesting the match
+        """
+        if match_id in self._index:
+            return
+        if telemetry_url is None:
+            telemetry_url = pubg.match(match_id, shard).telemetry_url
+        # Spool the gzipped response body to disk, so that downloads may run
+        # concurrently and only the copy into the archive is serialized
+        with tempfile.TemporaryFile(dir=self.path) as tmp:
+            length = pubg._core.telemetry(telemetry_url, fileobj=tmp)
+            tmp.seek(0)
+            if tmp.read(2) != GZIP_MAGIC:
+                # The response was not gzipped
+                tmp.seek(0)
+                self.put(match_id, tmp.read())
+                return
+            tmp.seek(0)
+            with self._lock:
+                if match_id in self._index:
+                    return
+                with open(self._archive_path, "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    shutil.copyfileobj(tmp, f)
+                self._add_to_index(match_id, offset, length)
+
+
+class _Slice(object):
+    """A read-only file-like view of a section of a file."""
+
+    def __init__(self, f, length):
+        self._f = f
+        self._remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
@@ -1,17 +1,210 @@
 """Utility functions."""
+import calendar
+import codecs
 import copy
+import json
 import re
+from functools import lru_cache
+
+from chicken_dinner.constants import STATS_KEYS
+from chicken_dinner.constants import TELEMETRY_KEYS
+
+try:
+    # Decodes several times faster than the standard library
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
+CAMEL_TO_SNAKE_CACHE_SIZE = 1024
 
 stats_map = {"DBNOs": "dbnos", "dBNOs": "dbnos", "top10s": "top_10s", "dBNOId": "dbno_id"}
 
+_FIRST_CAP = re.compile("(.)([A-Z][a-z]+)")
+_ALL_CAP = re.compile("([a-z0-9])([A-Z])")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = frozenset("-0123456789")
+_NUMBER_PREFIX = re.compile(r"-?\d*(\.\d*)?([eE][+-]?\d*)?")
+_DELIMITERS = frozenset(",] \t\n\r")
+# A value cut off by the end of a chunk fails to decode within this many
+# characters of the end of the buffer, except for an unterminated string
+_MAX_TOKEN_LENGTH = 64
 
-def camel_to_snake(name):
+# What the decoder expects next in the array
+_FIRST_VALUE = 0
+_VALUE = 1
+_DELIMITER = 2
+
+
+@lru_cache(maxsize=CAMEL_TO_SNAKE_CACHE_SIZE)
+def _camel_to_snake(name):
     try:
         return stats_map[name]
     except KeyError as exc:
         pass
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _FIRST_CAP.sub(r"\1_\2", name)
+    return _ALL_CAP.sub(r"\1_\2", s1).lower()
+
+
+#: Precomputed snake cased names for the known API keys
+snake_case_table = {k: _camel_to_snake.__wrapped__(k) for k in TELEMETRY_KEYS + STATS_KEYS}
+snake_case_table.update(stats_map)
+
+
+def camel_to_snake(name):
+    """Convert a camelCased key name to snake_case.
+
+    Known API keys are looked up in a precomputed table, and other names are
+    memoized in a bounded cache.
+    """
+    try:
+        return snake_case_table[name]
+    except KeyError:
+        return _camel_to_snake(name)
+
+
+def camel_to_snake_cache_info():
+    """Get the hit and miss counters of the ``camel_to_snake`` cache.
+
+    Lookups of keys in the precomputed table are not counted.
+
+    :return: a named tuple of ``hits``, ``misses``, ``maxsize`` and
+        ``currsize``
+    """
+    return _camel_to_snake.cache_info()
+
+
+@lru_cache(maxsize=32)
+def _day_microseconds(date):
+    year, month, day = date.split("-")
+    return calendar.timegm((int(year), int(month), int(day), 0, 0, 0)) * 1000000
+
+
+def parse_timestamp(timestamp):
+    """Parse a telemetry timestamp into microseconds since the epoch.
+
+    A fast parser for the fixed ``%Y-%m-%dT%H:%M:%S.%fZ`` UTC format used by
+    the ``_D`` key of telemetry events. Integer microseconds keep elapsed time
+    computations exact.
+
+    :param str timestamp: a timestamp, e.g. ``2020-05-09T12:34:56.789Z``
+    :return: the number of microseconds since the epoch
+    """
+    if timestamp[10] != "T" or timestamp[-1] != "Z":
+        raise ValueError("Invalid timestamp: " + timestamp)
+    seconds, _, fraction = timestamp[17:-1].partition(".")
+    return (
+        _day_microseconds(timestamp[:10])
+        + (int(timestamp[11:13]) * 3600 + int(timestamp[14:16]) * 60 + int(seconds)) * 1000000
+        + int(fraction.ljust(6, "0")[:6])
+    )
+
+
+def _is_truncated(buffer, exc):
+    # Corrupt input fails at the same position however much more of the
+    # stream arrives, while a truncated value fails near the end of the buffer
+    return exc.msg.startswith("Unterminated string") or len(buffer) - exc.pos <= _MAX_TOKEN_LENGTH
+
+
+class JSONArrayDecoder(object):
+    """Incremental decoder for a JSON array.
+
+    Chunks of the array are fed to the decoder as they arrive, and each call
+    returns the elements which were completed by that chunk. Only the
+    undecoded remainder of the stream is buffered, so the full array is never
+    held in memory.
+
+    :param str encoding: the encoding used to decode ``bytes`` chunks
+    """
+
+    def __init__(self, encoding="utf-8"):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._started = False
+        self._expect = _FIRST_VALUE
+        #: Whether the end of the array has been decoded
+        self.finished = False
+
+    def feed(self, chunk, final=False):
+        """Decode the next chunk of the array.
+
+        :param chunk: the next ``bytes`` or ``str`` chunk of the array
+        :param bool final: whether this is the last chunk of the stream
+        :return: a list of the elements completed by this chunk
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk, final=final)
+        buffer = self._buffer + chunk
+        pos = 0
+        values = []
+        while not self.finished:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                if final:
+                    raise ValueError("Unexpected end of JSON array.")
+                break
+            char = buffer[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array.")
+                self._started = True
+                pos += 1
+                continue
+            if self._expect == _DELIMITER:
+                if char == ",":
+                    self._expect = _VALUE
+                elif char == "]":
+                    self.finished = True
+                else:
+                    raise ValueError("Expected ',' or ']' in JSON array.")
+                pos += 1
+                continue
+            if char == "]" and self._expect == _FIRST_VALUE:
+                self.finished = True
+                pos += 1
+                break
+            if char in ",]":
+                raise ValueError("Expected a value in JSON array.")
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                if final or not _is_truncated(buffer, exc):
+                    raise
+                break
+            # A value ending with the buffer may be truncated (e.g. numbers)
+            if end == len(buffer) and not final:
+                break
+            # A number may also be a truncated prefix of a longer one, e.g.
+            # "1" of "1.5", so it is only complete once followed by a delimiter
+            if (
+                not final
+                and char in _NUMBER_START
+                and buffer[end] not in _DELIMITERS
+                and _NUMBER_PREFIX.match(buffer, pos).end() == len(buffer)
+            ):
+                break
+            values.append(value)
+            self._expect = _DELIMITER
+            pos = end
+        self._buffer = buffer[pos:]
+        return values
+
+
+def iter_json_array(chunks, encoding="utf-8"):
+    """Incrementally decode a JSON array, yielding one element at a time.
+
+    :param chunks: an iterable of ``bytes`` or ``str`` chunks which together
+        make up a JSON array
+    :param str encoding: the encoding used to decode ``bytes`` chunks
+    """
+    decoder = JSONArrayDecoder(encoding)
+    for chunk in chunks:
+        for value in decoder.feed(chunk):
+            yield value
+        if decoder.finished:
+            return
+    for value in decoder.feed(b"", final=True):
+        yield value
 
 
 def remove_from_dict(d, keys):
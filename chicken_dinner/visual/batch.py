@@ -0,0 +1,213 @@
+"""Batch rendering of replays for many matches."""
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from chicken_dinner.constants import MAX_WORKERS
+from chicken_dinner.visual.playback import playback_data
+from chicken_dinner.visual.playback import save_playback
+from chicken_dinner.visual.playback import set_map_cache_size
+
+
+def _render_replay(data, options, filename, fps, codec, bitrate):
+    start = time.perf_counter()
+    # Render to a temporary file, so that an interrupted render isn't
+    # mistaken for a finished replay when the batch is run again
+    base, ext = os.path.splitext(filename)
+    partial = base + ".part" + ext
+    try:
+        save_playback(data, options, partial, fps, None, codec, bitrate)
+    except Exception:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, filename)
+    return time.perf_counter() - start
+
+
+class BatchStats(object):
+    """Progress and per stage throughput of a batch of replays."""
+
+    def __init__(self):
+        #: The number of replays requested
+        self.replays = 0
+        #: The number of replays skipped because their file already exists
+        self.skipped = 0
+        #: The number of replays which failed to download or render
+        self.failed = 0
+        #: The number of telemetry downloads
+        self.downloads = 0
+        #: The total time spent downloading and parsing telemetry in seconds
+        self.download_time = 0.0
+        #: The number of replays rendered
+        self.renders = 0
+        #: The total time spent rendering replays in seconds
+        self.render_time = 0.0
+        #: The elapsed time of the batch in seconds
+        self.wall_time = 0.0
+
+    def _throughput(self, count):
+        if self.wall_time == 0:
+            return 0.0
+        return count / self.wall_time * 3600
+
+    def to_dict(self):
+        """The statistics as a dict, with throughputs per hour."""
+        return {
+            "replays": self.replays,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "downloads": self.downloads,
+            "download_time": self.download_time,
+            "downloads_per_hour": self._throughput(self.downloads),
+            "renders": self.renders,
+            "render_time": self.render_time,
+            "renders_per_hour": self._throughput(self.renders),
+            "wall_time": self.wall_time,
+        }
+
+    def summary(self):
+        """A human readable summary of the statistics."""
+        lines = [
+            "{} replays: {} rendered, {} skipped, {} failed in {:.1f}s".format(
+                self.replays, self.renders, self.skipped, self.failed, self.wall_time
+            ),
+            "download: {} matches, {:.1f}s busy, {:.1f} per hour".format(
+                self.downloads, self.download_time, self._throughput(self.downloads)
+            ),
+            "render: {} replays, {:.1f}s busy, {:.1f} per hour".format(
+                self.renders, self.render_time, self._throughput(self.renders)
+            ),
+        ]
+        return "\n".join(lines)
+
+
+class ReplayBatch(object):
+    """Render replays for many matches.
+
+    Telemetry is downloaded in a thread pool while replays are rendered in a
+    pool of processes, so that downloads overlap with rendering. Telemetry
+    for a match is downloaded once, however many replays are made from it,
+    and replays whose file already exists are skipped, so an interrupted
+    batch can be run again to finish it. The number of matches downloaded
+    ahead of the renderers is bounded to limit memory use.
+
+    :param int processes: (optional) the number of render processes, by
+        default the number of CPUs
+    :param int download_workers: the max number of concurrent telemetry
+        downloads
+    :param int max_pending: (optional) the max number of matches being
+        downloaded or waiting to be rendered, by default twice the number of
+        render processes
+    :param int fps: the frames per second of the replays
+    :param str codec: (optional) the codec for video files
+    :param int bitrate: (optional) the bitrate for video files in kbps
+    """
+
+    def __init__(
+        self, processes=None, download_workers=MAX_WORKERS, max_pending=None, fps=30, codec=None, bitrate=None
+    ):
+        #: The number of render processes
+        self.processes = processes or os.cpu_count()
+        #: The max number of concurrent telemetry downloads
+        self.download_workers = download_workers
+        #: The max number of matches being downloaded or waiting to render
+        self.max_pending = max_pending or 2 * self.processes
+        #: The frames per second of the replays
+        self.fps = fps
+        #: The codec for video files
+        self.codec = codec
+        #: The bitrate for video files in kbps
+        self.bitrate = bitrate
+        self._replays = OrderedDict()
+
+    def __len__(self):
+        return sum(len(replays) for _, replays in self._replays.values())
+
+    def add(self, match, filename, **options):
+        """Add a replay to the batch.
+
+        :param match: a :class:`chicken_dinner.models.match.Match` instance
+        :param str filename: the ``.html`` or video file to generate
+        :param options: the playback options, as for
+            :func:`chicken_dinner.visual.playback.create_playback_animation`
+            but without ``fps``, ``processes``, ``codec`` and ``bitrate``,
+            which are set for the whole batch
+        """
+        self._replays.setdefault(match.id, (match, []))[1].append((filename, options))
+
+    def _download(self, match):
+        start = time.perf_counter()
+        data = playback_data(match.get_telemetry())
+        return data, time.perf_counter() - start
+
+    def run(self):
+        """Render every replay in the batch.
+
+        Replays which fail to download or render are logged and counted as
+        failed, without stopping the batch.
+
+        :return: a :class:`BatchStats` instance
+        """
+        stats = BatchStats()
+        start = time.perf_counter()
+        queue = []
+        for match, replays in self._replays.values():
+            stats.replays += len(replays)
+            todo = [(filename, options) for filename, options in replays if not os.path.exists(filename)]
+            stats.skipped += len(replays) - len(todo)
+            if todo:
+                queue.append((match, todo))
+        queue.reverse()
+
+        # Each render worker holds its own copy of the map images it uses,
+        # so only keep the last one
+        renderer = ProcessPoolExecutor(self.processes, initializer=set_map_cache_size, initargs=(1,))
+        with ThreadPoolExecutor(self.download_workers) as downloader, renderer:
+            downloading = {}
+            rendering = {}
+            # Matches with renders in progress, for the bound on pending work
+            pending = {}
+            while queue or downloading or rendering:
+                while queue and len(downloading) < self.download_workers and len(pending) < self.max_pending:
+                    match, todo = queue.pop()
+                    downloading[downloader.submit(self._download, match)] = (match, todo)
+                    pending[match.id] = len(todo)
+                done, _ = wait(list(downloading) + list(rendering), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in downloading:
+                        match, todo = downloading.pop(future)
+                        try:
+                            data, duration = future.result()
+                        except Exception as exc:
+                            logging.warning("Failed to download match " + match.id + ": " + str(exc))
+                            stats.failed += len(todo)
+                            del pending[match.id]
+                            continue
+                        stats.downloads += 1
+                        stats.download_time += duration
+                        for filename, options in todo:
+                            render = renderer.submit(
+                                _render_replay, data, options, filename, self.fps, self.codec, self.bitrate
+                            )
+                            rendering[render] = (match, filename)
+                    else:
+                        match, filename = rendering.pop(future)
+                        try:
+                            stats.render_time += future.result()
+                            stats.renders += 1
+                            logging.info("Saved replay: " + filename)
+                        except Exception as exc:
+                            logging.warning("Failed to render " + filename + ": " + str(exc))
+                            stats.failed += 1
+                        pending[match.id] -= 1
+                        if pending[match.id] == 0:
+                            del pending[match.id]
+        stats.wall_time = time.perf_counter() - start
+        logging.info(stats.summary())
+        return stats
@@ -2,20 +2,130 @@
 import logging
 import os
 import random
+from collections import OrderedDict
 
 import matplotlib.image as mpimg
-import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import patheffects
 from matplotlib import rc
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
 
 from chicken_dinner.constants import COLORS
 from chicken_dinner.constants import map_dimensions
+from chicken_dinner.visual.render import render_html5_video
+from chicken_dinner.visual.render import render_video
+from chicken_dinner.visual.render import write_video
 
 rc("animation", embed_limit=100)
 
 
 MAP_ASSET_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "assets", "maps")
+#: The default number of map images whose mip levels are cached in each
+#: process, see :func:`set_map_cache_size`
+MAP_CACHE_SIZE = 2
+# The min width or height in pixels of the coarsest mip level
+_MIN_LEVEL_SIZE = 128
+# The mip levels of recently used map images, by path
+_map_cache = OrderedDict()
+_map_cache_size = MAP_CACHE_SIZE
+
+
+def _load_map_levels(img_path):
+    img = mpimg.imread(img_path)
+    if img.dtype != np.uint8:
+        # Keep levels as 8 bit pixels rather than floats, a quarter of the
+        # memory for the same (8 bit) map images
+        img = np.rint(img * 255).astype(np.uint8)
+    levels = [img]
+    while min(img.shape[:2]) >= 2 * _MIN_LEVEL_SIZE:
+        height, width = img.shape[0] // 2, img.shape[1] // 2
+        blocks = img[: height * 2, : width * 2].reshape(height, 2, width, 2, *img.shape[2:])
+        img = np.rint(blocks.mean(axis=(1, 3), dtype=np.float32)).astype(np.uint8)
+        levels.append(img)
+    return tuple(levels)
+
+
+def map_levels(img_path):
+    """Load a map image with its mip levels.
+
+    Each level is downsampled from the one before it by averaging 2x2
+    blocks of pixels. The levels of the most recently used map images are
+    cached, so they are shared by every playback rendered in a process with
+    the same map image.
+
+    :param str img_path: the path of the map image
+    :return: a tuple of 8 bit image arrays, from full resolution to the
+        coarsest
+    """
+    levels = _map_cache.pop(img_path, None)
+    if levels is None:
+        levels = _load_map_levels(img_path)
+    _map_cache[img_path] = levels
+    while len(_map_cache) > _map_cache_size:
+        _map_cache.popitem(last=False)
+    return levels
+
+
+def set_map_cache_size(size):
+    """Set the number of map images whose mip levels are cached in this
+    process.
+
+    Every process keeps its own cache, so render worker processes only cache
+    one map image.
+
+    :param int size: the number of map images
+    """
+    global _map_cache_size
+    _map_cache_size = size
+    while len(_map_cache) > _map_cache_size:
+        _map_cache.popitem(last=False)
+
+
+def _map_level(levels, visible_fraction, pixels):
+    """The index of the coarsest level which still has at least as many
+    pixels across the visible part of the map as the rendered frame."""
+    level = 0
+    while level + 1 < len(levels) and levels[level + 1].shape[1] * visible_fraction >= pixels:
+        level += 1
+    return level
+
+
+def _resample(coords, frames, tidx, vidxs, step=False):
+    """Interpolate coordinates onto every frame at once.
+
+    For each frame ``t``, the value is interpolated linearly between the last
+    coordinate at or before ``t`` and the first coordinate after it, or with
+    ``step``, taken from the first coordinate after it. Frames before the
+    first or after the last coordinate take the first or last value.
+
+    :param list coords: a list of coordinate tuples sorted by time
+    :param frames: an array of frame times
+    :param int tidx: the index of the time in each coordinate tuple
+    :param list vidxs: the indices of the values in each coordinate tuple
+    :param bool step: whether to step rather than interpolate
+    :return: an array of the values of shape ``(len(vidxs), len(frames))``
+    """
+    coords = np.asarray(coords, dtype=float)
+    times = coords[:, tidx]
+    values = coords[:, vidxs].T
+    # The index of the first coordinate after each frame
+    idx = np.searchsorted(times, frames, side="right")
+    after = np.minimum(idx, len(times) - 1)
+    if step:
+        return values[:, after]
+    before = np.maximum(idx - 1, 0)
+    t0 = times[before]
+    t1 = times[after]
+    v0 = values[:, before]
+    v1 = values[:, after]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resampled = v0 + (frames - t0) * (v1 - v0) / (t1 - t0)
+    resampled[:, idx == 0] = values[:, :1]
+    resampled[:, idx == len(times)] = values[:, -1:]
+    return resampled
 
 
 def create_playback_animation(
@@ -43,6 +153,9 @@ def create_playback_animation(
     interpolate=True,
     interval=1,
     fps=30,
+    processes=None,
+    codec=None,
+    bitrate=None,
 ):
     """Create a playback animation from telemetry data.
 
@@ -51,9 +164,14 @@ def create_playback_animation(
 
     To view the animation, open the resulting file in your browser.
 
+    If the filename has a video extension, e.g. ``.mp4``, ``.webm`` or
+    ``.gif``, frames are instead piped to ``ffmpeg`` as they are rendered
+    and encoded straight to the video file, so memory use is constant in the
+    length of the video.
+
     :param telemetry: an Telemetry instance
-    :param filename: a file to generate for the animation (default
-        "playback.html")
+    :param filename: a file to generate for the animation, an ``.html``
+        file or a video file (default "playback.html")
     :param bool labels: whether to label players by name
     :param int disable_labels_after: if passed, turns off player labels
         after number of seconds elapsed in game
@@ -87,25 +205,244 @@ def create_playback_animation(
         second-interval granularity
     :param int interval: interval between gameplay frames in seconds
     :param int fps: the frames per second for the animation
+    :param int processes: (optional) the number of processes in which to
+        render frames in parallel, which are piped to a single ``ffmpeg``
+        encode, by default frames are rendered sequentially in this process
+    :param str codec: (optional) the codec for a video file, by default
+        chosen by the file extension
+    :param int bitrate: (optional) the bitrate for a video file in kbps
     """
-    # Extract data
-    positions = telemetry.player_positions()
-    circles = telemetry.circle_positions()
-    rankings = telemetry.rankings()
-    winner = telemetry.winner()
-    killed = telemetry.killed()
-    rosters = telemetry.rosters()
-    damages = telemetry.player_damages()
-    package_spawns = telemetry.care_package_positions(land=False)
-    package_lands = telemetry.care_package_positions(land=True)
-    map_id = telemetry.map_id()
-    mapx, mapy = map_dimensions[map_id]
+    data = playback_data(telemetry)
+    options = dict(
+        labels=labels,
+        disable_labels_after=disable_labels_after,
+        label_players=label_players,
+        dead_player_labels=dead_player_labels,
+        zoom=zoom,
+        zoom_edge_buffer=zoom_edge_buffer,
+        use_hi_res=use_hi_res,
+        use_no_text=use_no_text,
+        color_teams=color_teams,
+        team_colors=random_team_colors(data["rosters"]) if color_teams else None,
+        highlight_teams=highlight_teams,
+        highlight_players=highlight_players,
+        highlight_color=highlight_color,
+        highlight_winner=highlight_winner,
+        label_highlights=label_highlights,
+        care_packages=care_packages,
+        damage=damage,
+        end_frames=end_frames,
+        size=size,
+        dpi=dpi,
+        interpolate=interpolate,
+        interval=interval,
+    )
+
+    return save_playback(data, options, filename, fps, processes, codec, bitrate)
+
+
+def save_playback(data, options, filename, fps=30, processes=None, codec=None, bitrate=None):
+    """Render a playback animation to an HTML5 animation or a video file.
+
+    :param dict data: the data from :func:`playback_data`
+    :param dict options: the options of :func:`build_playback`
+    :param filename: the ``.html`` or video file to generate
+    :param int fps: the frames per second for the animation
+    :param int processes: (optional) the number of processes in which to
+        render frames in parallel
+    :param str codec: (optional) the codec for a video file
+    :param int bitrate: (optional) the bitrate for a video file in kbps
+    """
+    if os.path.splitext(filename)[1].lower() not in (".html", ".htm"):
+        logging.info("Encoding file: {file}".format(file=filename))
+        if processes is None:
+            write_video(build_playback(data, **options), filename, fps, codec, bitrate)
+        else:
+            render_video(data, options, filename, fps, processes, codec, bitrate)
+        logging.info("Saved file.")
+        return True
+
+    if processes is None:
+        playback = build_playback(data, **options)
+        # Create the animation
+        animation = FuncAnimation(
+            playback.fig,
+            playback.update,
+            frames=playback.frames,
+            interval=int(1000 / fps),
+            init_func=playback.init,
+            blit=True,
+        )
+
+        # Write the html5 to buffer
+        h5 = animation.to_html5_video()
+    else:
+        h5 = render_html5_video(data, options, fps=fps, processes=processes)
+
+    # Save to disk
+    logging.info("Saving file: {file}".format(file=filename))
+    with open(filename, "w") as f:
+        f.write(h5)
+    logging.info("Saved file.")
+
+    return True
+
+
+def playback_data(telemetry):
+    """Extract the data used by a playback animation from telemetry.
+
+    :param telemetry: a Telemetry instance
+    :return: a dict of the player positions, circles, rosters, damages and
+        care packages of the match, which can be pickled for rendering in
+        other processes
+    """
+    return {
+        "positions": telemetry.player_positions(),
+        "circles": telemetry.circle_positions(),
+        "winner": telemetry.winner(),
+        "killed": telemetry.killed(),
+        "rosters": telemetry.rosters(),
+        "damages": telemetry.player_damages(),
+        "package_spawns": telemetry.care_package_positions(land=False),
+        "package_lands": telemetry.care_package_positions(land=True),
+        "map_id": telemetry.map_id(),
+    }
+
+
+def random_team_colors(rosters):
+    """Randomly select a color for each team from the pre-defined palette.
+
+    :param dict rosters: a dict of team ids to lists of player names
+    :return: a dict of player names to colors
+    """
+    colors = COLORS
+    idx = list(range(len(colors)))
+    random.shuffle(idx)
+    player_colors = {}
+    count = 0
+    for team_id, roster in rosters.items():
+        for player in roster:
+            player_colors[player] = colors[idx[count]]
+        count += 1
+    return player_colors
+
+
+def playback_frames(data, end_frames=20, interpolate=True, interval=1):
+    """Get the frame numbers of a playback animation.
+
+    :param dict data: the data from :func:`playback_data`
+    :param int end_frames: the number of extra end frames after game has
+        been completed
+    :param bool interpolate: whether frames are interpolated
+    :param int interval: interval between gameplay frames in seconds
+    :return: a range of frame numbers
+    """
+    positions = data["positions"]
     all_times = []
     for player, pos in positions.items():
         for p in pos:
             all_times.append(int(p[0]))
     all_times = sorted(list(set(all_times)))
 
+    # Get the max "frame number"
+    maxlength = 0
+    for player, pos in positions.items():
+        try:
+            if pos[-1][0] > maxlength:
+                maxlength = pos[-1][0]
+        except IndexError:
+            continue
+
+    if interpolate:
+        maxlength = max(all_times)
+    else:
+        maxlength = max([maxlength, len(data["circles"])])
+
+    return range(0, maxlength + end_frames, interval)
+
+
+class Playback(object):
+    """The figure and frame functions of a playback animation.
+
+    :param fig: the matplotlib figure
+    :param init: the function which initializes the animation
+    :param update: the function which updates the figure for a frame
+    :param frames: the frame numbers of the animation
+    """
+
+    def __init__(self, fig, init, update, frames):
+        #: The matplotlib figure
+        self.fig = fig
+        #: The function which initializes the animation
+        self.init = init
+        #: The function which updates the figure for a frame
+        self.update = update
+        #: The frame numbers of the animation
+        self.frames = frames
+
+    @property
+    def size(self):
+        """The width and height of the rendered frames in pixels."""
+        return self.fig.canvas.get_width_height()
+
+    def render(self, frame):
+        """Render a frame.
+
+        :param int frame: the frame number
+        :return: the frame as RGBA ``bytes``
+        """
+        self.update(frame)
+        self.fig.canvas.draw()
+        return bytes(self.fig.canvas.buffer_rgba())
+
+
+def build_playback(
+    data,
+    labels=True,
+    disable_labels_after=None,
+    label_players=None,
+    dead_player_labels=False,
+    zoom=False,
+    zoom_edge_buffer=0.5,
+    use_hi_res=False,
+    use_no_text=False,
+    color_teams=True,
+    team_colors=None,
+    highlight_teams=None,
+    highlight_players=None,
+    highlight_color="#FFFF00",
+    highlight_winner=False,
+    label_highlights=True,
+    care_packages=True,
+    damage=True,
+    end_frames=20,
+    size=5,
+    dpi=100,
+    interpolate=True,
+    interval=1,
+):
+    """Build the figure and frame functions of a playback animation.
+
+    Takes the options of :func:`create_playback_animation`. Each frame is
+    drawn independently of the frames before it, so frames may be rendered
+    in any order, e.g. in separate processes.
+
+    :param dict data: the data from :func:`playback_data`
+    :param dict team_colors: (optional) a dict of player names to colors,
+        by default from :func:`random_team_colors`
+    :return: a :class:`Playback` instance
+    """
+    positions = data["positions"]
+    circles = data["circles"]
+    winner = data["winner"]
+    killed = data["killed"]
+    rosters = data["rosters"]
+    damages = data["damages"]
+    package_spawns = data["package_spawns"]
+    package_lands = data["package_lands"]
+    map_id = data["map_id"]
+    mapx, mapy = map_dimensions[map_id]
+
     if label_players is None:
         label_players = []
 
@@ -133,35 +470,35 @@ def create_playback_animation(
 
     label_players = list(set(label_players))
 
-    team_colors = None
-    if color_teams:
-        # Randomly select colors from the pre-defined palette
-        colors = COLORS
-        idx = list(range(len(colors)))
-        random.shuffle(idx)
-        team_colors = {}
-        count = 0
-        for team_id, roster in rosters.items():
-            for player in roster:
-                team_colors[player] = colors[idx[count]]
-            count += 1
-
-    # Get the max "frame number"
-    maxlength = 0
-    for player, pos in positions.items():
-        try:
-            if pos[-1][0] > maxlength:
-                maxlength = pos[-1][0]
-        except IndexError:
-            continue
+    frames = playback_frames(data, end_frames, interpolate, interval)
 
+    # Resample the circles and player tracks onto the frames once, so that
+    # each frame update only indexes arrays
+    circle_tracks = None
+    player_tracks = {}
     if interpolate:
-        maxlength = max(all_times)
-    else:
-        maxlength = max([maxlength, len(circles)])
+        frame_times = np.array(frames, dtype=float)
+        if all(len(circles[color]) > 0 for color in ("blue", "red", "white")):
+            circle_tracks = {
+                "blue": _resample(circles["blue"], frame_times, 0, [1, 2, 4]),
+                "red": _resample(circles["red"], frame_times, 0, [1, 2, 4], step=True),
+                "white": _resample(circles["white"], frame_times, 0, [1, 2, 4], step=True),
+            }
+            for track in circle_tracks.values():
+                track[1] = mapy - track[1]
+        for player, pos in positions.items():
+            if len(pos) > 0:
+                track = _resample(pos, frame_times, 0, [1, 2])
+                track[1] = mapy - track[1]
+                player_tracks[player] = track
+    damage_times = {player: np.array([int(attack[0]) for attack in attacks]) for player, attacks in damages.items()}
+
+    if color_teams and team_colors is None:
+        team_colors = random_team_colors(rosters)
 
     # Initialize the plot and artist objects
-    fig = plt.figure(frameon=False, dpi=dpi)
+    fig = Figure(frameon=False, dpi=dpi)
+    FigureCanvasAgg(fig)
     ax = fig.add_axes([0, 0, 1, 1])
     ax.axis("off")
 
@@ -176,14 +513,19 @@ def create_playback_animation(
         map_image = map_id + no_text + "_Low_Res.png"
     img_path = os.path.join(MAP_ASSET_PATH, map_image)
     try:
-        img = mpimg.imread(img_path)
+        map_images = map_levels(img_path)
     except FileNotFoundError:
         raise FileNotFoundError(
             "High resolution images not included in package.\n"
             "Download images from https://github.com/pubg/api-assets/tree/master/Assets/Maps\n"
             "and place in folder: " + MAP_ASSET_PATH
         )
-    ax.imshow(img, extent=[0, mapx, 0, mapy])
+    # Draw the map from the mip level nearest the rendered resolution, rather
+    # than resampling the full resolution image for every frame
+    map_pixels = size * dpi
+    full_map_level = _map_level(map_images, 1, map_pixels)
+    map_level = full_map_level
+    map_artist = ax.imshow(map_images[map_level], extent=[0, mapx, 0, mapy])
 
     players = ax.scatter(-10000, -10000, marker="o", c="w", edgecolor="k", s=60, linewidths=1, zorder=20)
     deaths = ax.scatter(-10000, -10000, marker="X", c="r", edgecolor="k", s=60, linewidths=1, alpha=0.5, zorder=10)
@@ -195,6 +537,8 @@ def create_playback_animation(
         -10000, -10000, marker="X", c=highlight_color, edgecolor="k", s=60, linewidths=1, zorder=15
     )
 
+    label_effects = [patheffects.withStroke(linewidth=2, foreground="w")]
+    dead_label_effects = [patheffects.withStroke(linewidth=1, foreground="gray")]
     if labels:
         if label_players is not None:
             name_labels = {
@@ -205,11 +549,11 @@ def create_playback_animation(
         else:
             name_labels = {player_name: ax.text(0, 0, player_name, size=8, zorder=19) for player_name in positions}
         for label in name_labels.values():
-            label.set_path_effects([patheffects.withStroke(linewidth=2, foreground="w")])
+            label.set_path_effects(label_effects)
 
-    blue_circle = plt.Circle((0, 0), 0, edgecolor="b", linewidth=2, fill=False, zorder=5)
-    white_circle = plt.Circle((0, 0), 0, edgecolor="w", linewidth=2, fill=False, zorder=6)
-    red_circle = plt.Circle((0, 0), 0, color="r", edgecolor=None, lw=0, fill=True, alpha=0.3, zorder=7)
+    blue_circle = Circle((0, 0), 0, edgecolor="b", linewidth=2, fill=False, zorder=5)
+    white_circle = Circle((0, 0), 0, edgecolor="w", linewidth=2, fill=False, zorder=6)
+    red_circle = Circle((0, 0), 0, color="r", edgecolor=None, lw=0, fill=True, alpha=0.3, zorder=7)
 
     care_package_spawns, = ax.plot(
         -10000,
@@ -293,102 +637,76 @@ def create_playback_animation(
             updates = *updates, *damage_lines
         return updates
 
-    def interpolate_coords(t, coords, tidx, vidx, step=False):
-        inter = False
-        for idx, coord in enumerate(coords):
-            if coord[tidx] > t:
-                inter = True
-                break
-
-        if not inter:
-            return coords[-1][vidx]
-
-        if idx == 0:
-            return coords[0][vidx]
-        else:
-            v0 = coords[idx - 1][vidx]
-            t0 = coords[idx - 1][tidx]
-
-        v1 = coords[idx][vidx]
-        t1 = coords[idx][tidx]
-
-        if step:
-            return v1
-        else:
-            return v0 + (t - t0) * (v1 - v0) / (t1 - t0)
-
     # Frame update function
     def update(frame):
+        nonlocal map_level
         logging.info("Processing frame {frame}".format(frame=frame))
-        try:
-            if interpolate:
-                blue_circle.center = (
-                    interpolate_coords(frame, circles["blue"], 0, 1),
-                    mapy - interpolate_coords(frame, circles["blue"], 0, 2),
-                )
-                red_circle.center = (
-                    interpolate_coords(frame, circles["red"], 0, 1, True),
-                    mapy - interpolate_coords(frame, circles["red"], 0, 2, True),
-                )
-                white_circle.center = (
-                    interpolate_coords(frame, circles["white"], 0, 1, True),
-                    mapy - interpolate_coords(frame, circles["white"], 0, 2, True),
-                )
+        frame_idx = frame // interval
 
-                blue_circle.set_radius(interpolate_coords(frame, circles["blue"], 0, 4))
-                red_circle.set_radius(interpolate_coords(frame, circles["red"], 0, 4, True))
-                white_circle.set_radius(interpolate_coords(frame, circles["white"], 0, 4, True))
+        # Every artist is set from the frame number alone, so that a frame is
+        # drawn the same whichever frames were drawn before it
+        if interpolate:
+            circle_frame = frame_idx if circle_tracks is not None else None
+        else:
+            circle_count = min(len(circles[color]) for color in ("blue", "red", "white"))
+            # Frames after the last circle keep showing the last circle
+            circle_frame = min(frame, circle_count - 1) if circle_count > 0 else None
+
+        if circle_frame is None:
+            for circle in (blue_circle, red_circle, white_circle):
+                circle.center = 0, 0
+                circle.set_radius(0)
+        else:
+            if interpolate:
+                blue_x, blue_y, blue_r = circle_tracks["blue"][:, circle_frame]
+                red_x, red_y, red_r = circle_tracks["red"][:, circle_frame]
+                white_x, white_y, white_r = circle_tracks["white"][:, circle_frame]
             else:
-                blue_circle.center = circles["blue"][frame][1], mapy - circles["blue"][frame][2]
-                red_circle.center = circles["red"][frame][1], mapy - circles["red"][frame][2]
-                white_circle.center = circles["white"][frame][1], mapy - circles["white"][frame][2]
-
-                blue_circle.set_radius(circles["blue"][frame][4])
-                red_circle.set_radius(circles["red"][frame][4])
-                white_circle.set_radius(circles["white"][frame][4])
-        except IndexError:
-            pass
-
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-
-        xwidth = xlim[1] - xlim[0]
-        ywidth = ylim[1] - ylim[0]
-
-        if zoom:
-            try:
-                if interpolate:
-                    margin_offset = (1 + zoom_edge_buffer) * interpolate_coords(frame, circles["blue"], 0, 4)
-                    xmin = max([0, interpolate_coords(frame, circles["blue"], 0, 1) - margin_offset])
-                    xmax = min([mapx, interpolate_coords(frame, circles["blue"], 0, 1) + margin_offset])
-                    ymin = max([0, mapy - interpolate_coords(frame, circles["blue"], 0, 2) - margin_offset])
-                    ymax = min([mapy, mapy - interpolate_coords(frame, circles["blue"], 0, 2) + margin_offset])
-                else:
-                    margin_offset = (1 + zoom_edge_buffer) * circles["blue"][frame][4]
-                    xmin = max([0, circles["blue"][frame][1] - margin_offset])
-                    xmax = min([mapx, circles["blue"][frame][1] + margin_offset])
-                    ymin = max([0, mapy - circles["blue"][frame][2] - margin_offset])
-                    ymax = min([mapy, mapy - circles["blue"][frame][2] + margin_offset])
-
-                # ensure full space taken by map
-                if xmax - xmin >= ymax - ymin:
-                    if ymin == 0:
-                        ymax = ymin + (xmax - xmin)
-                    elif ymax == mapy:
-                        ymin = ymax - (xmax - xmin)
-                else:
-                    if xmin == 0:
-                        xmax = xmin + (ymax - ymin)
-                    elif xmax == mapx:
-                        xmin = xmax - (ymax - ymin)
+                _, blue_x, blue_y, _, blue_r = circles["blue"][circle_frame]
+                _, red_x, red_y, _, red_r = circles["red"][circle_frame]
+                _, white_x, white_y, _, white_r = circles["white"][circle_frame]
+                blue_y = mapy - blue_y
+                red_y = mapy - red_y
+                white_y = mapy - white_y
+            blue_circle.center = blue_x, blue_y
+            red_circle.center = red_x, red_y
+            white_circle.center = white_x, white_y
+
+            blue_circle.set_radius(blue_r)
+            red_circle.set_radius(red_r)
+            white_circle.set_radius(white_r)
+
+        if zoom and circle_frame is not None:
+            margin_offset = (1 + zoom_edge_buffer) * blue_r
+            xmin = max([0, blue_x - margin_offset])
+            xmax = min([mapx, blue_x + margin_offset])
+            ymin = max([0, blue_y - margin_offset])
+            ymax = min([mapy, blue_y + margin_offset])
+
+            # ensure full space taken by map
+            if xmax - xmin >= ymax - ymin:
+                if ymin == 0:
+                    ymax = ymin + (xmax - xmin)
+                elif ymax == mapy:
+                    ymin = ymax - (xmax - xmin)
+            else:
+                if xmin == 0:
+                    xmax = xmin + (ymax - ymin)
+                elif xmax == mapx:
+                    xmin = xmax - (ymax - ymin)
+            level = _map_level(map_images, (xmax - xmin) / mapx, map_pixels)
+        else:
+            xmin, xmax, ymin, ymax = 0, mapx, 0, mapy
+            level = full_map_level
 
-                ax.set_xlim([xmin, xmax])
-                ax.set_ylim([ymin, ymax])
+        ax.set_xlim([xmin, xmax])
+        ax.set_ylim([ymin, ymax])
+        if level != map_level:
+            map_artist.set_data(map_images[level])
+            map_level = level
 
-                xwidth = xmax - xmin
-                ywidth = ymax - ymin
-            except IndexError:
-                pass
+        xwidth = xmax - xmin
+        ywidth = ymax - ymin
 
         positions_x = []
         positions_y = []
@@ -441,8 +759,7 @@ def create_playback_animation(
                 if interpolate:
                     if fidx >= pos[-1][0] and player in killed:
                         raise IndexError
-                    x = interpolate_coords(fidx, pos, 0, 1)
-                    y = mapy - interpolate_coords(fidx, pos, 0, 2)
+                    x, y = player_tracks[player][:, frame_idx]
                 else:
                     x = pos[fidx][1]
                     y = mapy - pos[fidx][2]
@@ -460,25 +777,21 @@ def create_playback_animation(
 
                 # Update labels
                 if labels and player in label_players:
+                    name_labels[player].set_path_effects(label_effects)
                     if disable_labels_after is not None and frame >= disable_labels_after:
                         name_labels[player].set_position((-100000, -100000))
                     else:
                         name_labels[player].set_position((x + 10000 * xwidth / mapx, y - 10000 * ywidth / mapy))
 
                 # Update player damages
-                if damage:
-                    try:
-                        for attack in damages[player]:
-                            damage_frame = int(attack[0])
-                            if damage_frame >= fidx + interval:
-                                break
-                            elif damage_frame >= fidx and damage_frame < fidx + interval:
-                                damage_line_x = [attack[1], attack[4]]
-                                damage_line_y = [mapy - attack[2], mapy - attack[5]]
-                                damage_lines[damage_count].set_data(damage_line_x, damage_line_y)
-                                damage_count += 1
-                    except KeyError:
-                        pass
+                if damage and player in damages:
+                    first = np.searchsorted(damage_times[player], fidx, side="left")
+                    last = np.searchsorted(damage_times[player], fidx + interval, side="left")
+                    for attack in damages[player][first:last]:
+                        damage_line_x = [attack[1], attack[4]]
+                        damage_line_y = [mapy - attack[2], mapy - attack[5]]
+                        damage_lines[damage_count].set_data(damage_line_x, damage_line_y)
+                        damage_count += 1
 
             except IndexError as exc:
                 # Sometimes players have no positions
@@ -502,7 +815,7 @@ def create_playback_animation(
                     name_labels[player].set_position(
                         (pos[-1][1] + 10000 * xwidth / mapx, mapy - pos[-1][2] - 10000 * ywidth / mapy)
                     )
-                    name_labels[player].set_path_effects([patheffects.withStroke(linewidth=1, foreground="gray")])
+                    name_labels[player].set_path_effects(dead_label_effects)
                 # Offscreen if labels are off
                 elif labels and player in label_players:
                     name_labels[player].set_position((-100000, -100000))
@@ -519,6 +832,8 @@ def create_playback_animation(
         death_offsets = [(x, y) for x, y in zip(deaths_x, deaths_y)]
         if len(death_offsets) > 0:
             deaths.set_offsets(death_offsets)
+        else:
+            deaths.set_offsets([(-10000, -10000)])
         if color_teams:
             deaths.set_facecolors(death_marker_colors)
 
@@ -532,12 +847,18 @@ def create_playback_animation(
             highlight_death_offsets = [(x, y) for x, y in zip(highlights_deaths_x, highlights_deaths_y)]
             if len(highlight_death_offsets) > 0:
                 highlights_deaths.set_offsets(highlight_death_offsets)
+            else:
+                highlights_deaths.set_offsets([(-10000, -10000)])
 
         if len(care_package_lands_x) > 0:
             care_package_lands.set_data(care_package_lands_x, care_package_lands_y)
+        else:
+            care_package_lands.set_data([-10000], [-10000])
 
         if len(care_package_spawns_x) > 0:
             care_package_spawns.set_data(care_package_spawns_x, care_package_spawns_y)
+        else:
+            care_package_spawns.set_data([-10000], [-10000])
 
         # Remove the remaining slots
         for k in range(damage_count, damage_slots):
@@ -568,23 +889,4 @@ def create_playback_animation(
             updates = *updates, *damage_lines
         return updates
 
-    # Create the animation
-    animation = FuncAnimation(
-        fig,
-        update,
-        frames=range(0, maxlength + end_frames, interval),
-        interval=int(1000 / fps),
-        init_func=init,
-        blit=True,
-    )
-
-    # Write the html5 to buffer
-    h5 = animation.to_html5_video()
-
-    # Save to disk
-    logging.info("Saving file: {file}".format(file=filename))
-    with open(filename, "w") as f:
-        f.write(h5)
-    logging.info("Saved file.")
-
-    return True
+    return Playback(fig, init, update, frames)
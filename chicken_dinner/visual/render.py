@@ -0,0 +1,216 @@
+"""Rendering of playback animations to video files."""
+import base64
+import logging
+import os
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib import rcParams
+
+#: Default number of frames rendered by each task
+CHUNK_SIZE = 30
+# Max number of rendered chunks waiting to be encoded, per process
+MAX_PENDING_CHUNKS = 2
+VIDEO_TAG = """<video width="{width}" height="{height}" controls autoplay loop>
+  <source type="video/mp4" src="data:video/mp4;base64,{video}">
+  Your browser does not support the video tag.
+</video>"""
+
+# The playback animation of a worker process
+_playback = None
+
+
+def _init_worker(data, options):
+    global _playback
+    from chicken_dinner.visual.playback import build_playback
+    from chicken_dinner.visual.playback import set_map_cache_size
+
+    # Each worker holds its own copy of the map, so only keep this one
+    set_map_cache_size(1)
+    _playback = build_playback(data, **options)
+
+
+def _frame_size():
+    return _playback.size
+
+
+def _render_chunk(frames):
+    return [_playback.render(frame) for frame in frames]
+
+
+# The pad filter which makes frame dimensions even, as required by yuv420p
+_EVEN_PAD = "pad=ceil(iw/2)*2:ceil(ih/2)*2"
+
+#: The ffmpeg output options for each video file extension. ``args`` are
+#: always used, ``quality`` only when no bitrate is given.
+VIDEO_FORMATS = {
+    ".mp4": {"codec": "h264", "args": ["-pix_fmt", "yuv420p", "-vf", _EVEN_PAD], "quality": []},
+    ".webm": {
+        "codec": "libvpx-vp9",
+        "args": ["-pix_fmt", "yuv420p", "-vf", _EVEN_PAD],
+        # libvpx defaults to a low target bitrate, so use constant quality
+        "quality": ["-crf", "32", "-b:v", "0"],
+    },
+    ".gif": {
+        "codec": "gif",
+        # A palette per frame, so frames needn't be buffered for a global one
+        "args": ["-vf", "split[a][b];[a]palettegen=stats_mode=single[p];[b][p]paletteuse=new=1"],
+        "quality": [],
+    },
+}
+
+
+class FFmpegWriter(object):
+    """Encode raw RGBA frames to a video file by piping them to ffmpeg.
+
+    Frames are written to the stdin of ffmpeg as they are rendered, so memory
+    use does not grow with the length of the video. The output format is
+    chosen by ffmpeg from the file extension, and the codec and options by
+    :data:`VIDEO_FORMATS`. Uses the ffmpeg executable configured by
+    matplotlib's ``animation.ffmpeg_path`` setting.
+
+    :param str filename: the video file, e.g. ``.mp4``, ``.webm`` or ``.gif``
+    :param tuple size: the width and height of the frames in pixels
+    :param int fps: the frames per second of the video
+    :param str codec: (optional) the video codec, by default chosen by the
+        file extension
+    :param int bitrate: (optional) the video bitrate in kbps, by default
+        chosen by the format or ffmpeg
+    """
+
+    def __init__(self, filename, size, fps=30, codec=None, bitrate=None):
+        #: The video file
+        self.filename = filename
+        width, height = size
+        video_format = VIDEO_FORMATS.get(os.path.splitext(filename)[1].lower(), VIDEO_FORMATS[".mp4"])
+        command = [
+            rcParams["animation.ffmpeg_path"],
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            "{}x{}".format(width, height),
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+            "-vcodec",
+            codec or video_format["codec"],
+            *video_format["args"],
+        ]
+        if bitrate is not None:
+            command.extend(["-b:v", "{}k".format(bitrate)])
+        else:
+            command.extend(video_format["quality"])
+        command.append(filename)
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._process.kill()
+            self._process.wait()
+
+    def write(self, frame):
+        """Write a frame.
+
+        :param bytes frame: the RGBA frame
+        """
+        self._process.stdin.write(frame)
+
+    def close(self):
+        """Finish encoding the video."""
+        self._process.stdin.close()
+        if self._process.wait() != 0:
+            raise RuntimeError("ffmpeg failed to encode " + self.filename + ".")
+
+
+def write_video(playback, filename, fps=30, codec=None, bitrate=None):
+    """Render a playback animation to a video file in this process.
+
+    :param playback: a :class:`chicken_dinner.visual.playback.Playback`
+    :param str filename: the video file
+    :param int fps: the frames per second of the video
+    :param str codec: (optional) the video codec
+    :param int bitrate: (optional) the video bitrate in kbps
+    :return: the width and height of the video
+    """
+    logging.info("Rendering {} frames.".format(len(playback.frames)))
+    with FFmpegWriter(filename, playback.size, fps, codec, bitrate) as writer:
+        for frame in playback.frames:
+            writer.write(playback.render(frame))
+    return playback.size
+
+
+def render_video(data, options, filename, fps=30, processes=None, codec=None, bitrate=None, chunk_size=CHUNK_SIZE):
+    """Render a playback animation to a video file in parallel.
+
+    Frames are split into chunks which are rendered in a pool of processes,
+    each with its own copy of the figure, and are piped in order to a single
+    ffmpeg encode.
+
+    :param dict data: the data from
+        :func:`chicken_dinner.visual.playback.playback_data`
+    :param dict options: the options of
+        :func:`chicken_dinner.visual.playback.build_playback`
+    :param str filename: the video file
+    :param int fps: the frames per second of the video
+    :param int processes: (optional) the number of processes, by default the
+        number of CPUs
+    :param str codec: (optional) the video codec
+    :param int bitrate: (optional) the video bitrate in kbps
+    :param int chunk_size: the number of frames rendered by each task
+    :return: the width and height of the video
+    """
+    from chicken_dinner.visual.playback import playback_frames
+
+    processes = processes or os.cpu_count()
+    frames = playback_frames(data, options["end_frames"], options["interpolate"], options["interval"])
+    chunks = [frames[i : i + chunk_size] for i in range(0, len(frames), chunk_size)]
+    logging.info("Rendering {} frames in {} processes.".format(len(frames), processes))
+
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(data, options)) as executor:
+        size = executor.submit(_frame_size).result()
+        with FFmpegWriter(filename, size, fps, codec, bitrate) as writer:
+            # Keep a bounded number of chunks in flight so that rendered
+            # frames don't pile up in memory ahead of the encoder
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_render_chunk, chunk))
+                if len(pending) >= MAX_PENDING_CHUNKS * processes:
+                    for frame in pending.popleft().result():
+                        writer.write(frame)
+            while pending:
+                for frame in pending.popleft().result():
+                    writer.write(frame)
+    return size
+
+
+def render_html5_video(data, options, fps=30, processes=None):
+    """Render a playback animation to an HTML5 video tag in parallel.
+
+    :param dict data: the data from
+        :func:`chicken_dinner.visual.playback.playback_data`
+    :param dict options: the options of
+        :func:`chicken_dinner.visual.playback.build_playback`
+    :param int fps: the frames per second of the video
+    :param int processes: (optional) the number of processes, by default the
+        number of CPUs
+    :return: the HTML of a video tag with the embedded base64 encoded video
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "playback.mp4")
+        width, height = render_video(data, options, path, fps, processes)
+        with open(path, "rb") as f:
+            video = base64.b64encode(f.read()).decode("ascii")
+    return VIDEO_TAG.format(width=width, height=height, video=video)
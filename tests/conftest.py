@@ -0,0 +1,246 @@
+import datetime
+import http.server
+import json
+import threading
+
+import pytest
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self)
+        responses = self.server.routes[self.path.split("?")[0]]
+        respond = responses.pop(0) if len(responses) > 1 else responses[0]
+        respond(self)
+
+
+def respond(status=200, body=b"", headers=None, drop_after=None, rate_limit=True):
+    """A response for the local test server.
+
+    :param int drop_after: if given, the connection is dropped after this
+        many bytes of the body
+    :param bool rate_limit: whether to send rate limit headers
+    """
+
+    def handler(request):
+        request.send_response(status)
+        request.send_header("Content-Length", str(len(body)))
+        if rate_limit:
+            request.send_header("X-RateLimit-Remaining", "9")
+            request.send_header("X-RateLimit-Reset", "0")
+        for key, value in (headers or {}).items():
+            request.send_header(key, value)
+        request.end_headers()
+        if drop_after is None:
+            request.wfile.write(body)
+        else:
+            request.wfile.write(body[:drop_after])
+            request.wfile.flush()
+            request.connection.shutdown(2)
+            request.close_connection = True
+
+    return handler
+
+
+@pytest.fixture
+def server():
+    """A local HTTP server whose ``routes`` map paths to lists of
+    responses, which are returned in order, repeating the last."""
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    srv.routes = {}
+    srv.requests = []
+    srv.respond = respond
+    srv.url = "http://127.0.0.1:%d" % srv.server_address[1]
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+MATCH_START = datetime.datetime(2020, 5, 9, 12, 0, 0)
+
+
+def _timestamp(seconds):
+    timestamp = MATCH_START + datetime.timedelta(seconds=seconds)
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _character(name, team, x, y, ranking=0, health=100.0):
+    return {
+        "name": name,
+        "teamId": team,
+        "health": health,
+        "location": {"x": x, "y": y, "z": 10.0},
+        "ranking": ranking,
+        "accountId": "account." + name,
+        "isInBlueZone": False,
+        "isInRedZone": False,
+        "zone": ["pochinki"],
+    }
+
+
+@pytest.fixture
+def telemetry_json():
+    """The raw telemetry of a small synthetic match between two teams, in
+    which p3 is killed by p0 and team 1 wins."""
+    teams = {"p0": 1, "p1": 1, "p2": 2, "p3": 2}
+    events = [{"MatchId": "match.bro.official.x", "_D": _timestamp(-60), "_T": "LogMatchDefinition"}]
+    for name in teams:
+        events.append(
+            {"accountId": "account." + name, "common": {"isGame": 0}, "_D": _timestamp(-50), "_T": "LogPlayerLogin"}
+        )
+    for i, (name, team) in enumerate(teams.items()):
+        events.append(
+            {
+                "character": _character(name, team, 1000.0 * i, 2000.0),
+                "common": {"isGame": 0},
+                "_D": _timestamp(-49),
+                "_T": "LogPlayerCreate",
+            }
+        )
+    events.append(
+        {
+            "mapName": "Savage_Main",
+            "characters": [{"character": _character(name, team, 0.0, 0.0)} for name, team in teams.items()],
+            "blueZoneCustomOptions": json.dumps([{"phaseNum": 1, "poisonGasDamagePerSecond": 0.4}]),
+            "common": {"isGame": 1},
+            "_D": _timestamp(0),
+            "_T": "LogMatchStart",
+        }
+    )
+    for t in range(0, 31):
+        if t % 5 == 0:
+            events.append(
+                {
+                    "gameState": {
+                        "elapsedTime": t,
+                        "safetyZonePosition": {"x": 200000.0 - 100 * t, "y": 200000.0, "z": 0},
+                        "safetyZoneRadius": 150000.0 - 1000 * t,
+                        "poisonGasWarningPosition": {"x": 190000.0, "y": 200000.0, "z": 0},
+                        "poisonGasWarningRadius": 100000.0,
+                        "redZonePosition": {"x": 0, "y": 0, "z": 0},
+                        "redZoneRadius": 0,
+                    },
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(t + 0.5),
+                    "_T": "LogGameStatePeriodic",
+                }
+            )
+        for i, (name, team) in enumerate(teams.items()):
+            if name == "p3" and t > 15:
+                continue
+            ranking = 2 if name == "p3" and t == 15 else 0
+            events.append(
+                {
+                    "character": _character(name, team, 1000.0 * i + 500 * t, 2000.0 + 100 * t, ranking, 100.0 - t),
+                    "vehicle": None,
+                    "elapsedTime": t,
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(t + 0.1 * i),
+                    "_T": "LogPlayerPosition",
+                }
+            )
+        if t == 5:
+            attacker = _character("p0", 1, 2500.0, 2500.0)
+            events.append(
+                {
+                    "attackId": 1,
+                    "attacker": attacker,
+                    "attackType": "Weapon",
+                    "weapon": {"itemId": "Item_Weapon_AK47_C", "category": "Weapon", "attachedItems": []},
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(5.2),
+                    "_T": "LogPlayerAttack",
+                }
+            )
+            events.append(
+                {
+                    "attackId": 1,
+                    "attacker": attacker,
+                    "victim": _character("p3", 2, 5500.0, 2500.0),
+                    "damageTypeCategory": "Damage_Gun",
+                    "damage": 20.5,
+                    "damageCauserName": "WeapAK47_C",
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(5.3),
+                    "_T": "LogPlayerTakeDamage",
+                }
+            )
+            events.append(
+                {
+                    "attackId": -1,
+                    "attacker": None,
+                    "victim": _character("p2", 2, 4500.0, 2500.0),
+                    "damageTypeCategory": "Damage_BlueZone",
+                    "damage": 1.5,
+                    "damageCauserName": "",
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(5.4),
+                    "_T": "LogPlayerTakeDamage",
+                }
+            )
+        if t == 8:
+            item_package = {
+                "itemPackageId": "Carapackage_RedBox_C",
+                "location": {"x": 1.0, "y": 2.0, "z": 3.0},
+                "items": [{"itemId": "Item_Weapon_AK47_C", "stackCount": 1, "category": "Weapon"}],
+            }
+            events.append(
+                {
+                    "itemPackage": item_package,
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(8.5),
+                    "_T": "LogCarePackageSpawn",
+                }
+            )
+            events.append(
+                {
+                    "itemPackage": item_package,
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(9.5),
+                    "_T": "LogCarePackageLand",
+                }
+            )
+            events.append(
+                {
+                    "character": _character("p1", 1, 1.0, 2.0),
+                    "carePackageUniqueId": 1,
+                    "items": [{"itemId": "Item_Weapon_AK47_C", "stackCount": 1, "category": "Weapon"}],
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(9.8),
+                    "_T": "LogItemPickupFromCarepackage",
+                }
+            )
+        if t == 15:
+            events.append(
+                {
+                    "attackId": 2,
+                    "killer": _character("p0", 1, 7500.0, 3500.0),
+                    "victim": _character("p3", 2, 10500.0, 3500.0),
+                    "damageCauserName": "WeapAK47_C",
+                    "damageCauserAdditionalInfo": ["Item_Attach_Weapon_Muzzle_Compensator_Large_C"],
+                    "distance": 10.0,
+                    "common": {"isGame": 1},
+                    "_D": _timestamp(15.2),
+                    "_T": "LogPlayerKill",
+                }
+            )
+    rankings = {"p0": 1, "p1": 1, "p2": 2, "p3": 2}
+    events.append(
+        {
+            "characters": [
+                {"character": _character(name, team, 0.0, 0.0, rankings[name])} for name, team in teams.items()
+            ],
+            "common": {"isGame": 1},
+            "_D": _timestamp(31),
+            "_T": "LogMatchEnd",
+        }
+    )
+    return events
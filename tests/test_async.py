@@ -0,0 +1,250 @@
+import asyncio
+import gzip
+import json
+import time
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import aiohttp
+import pytest
+
+from chicken_dinner.models.telemetry import TelemetryEvent
+from chicken_dinner.pubgapi import core as core_module
+from chicken_dinner.pubgapi.async_core import AsyncPUBGCore
+from chicken_dinner.pubgapi.async_pubg import AsyncPUBG
+from chicken_dinner.pubgapi.retry import RetryPolicy
+from chicken_dinner.pubgapi.stats import RequestStats
+
+EVENTS = [{"_T": "LogMatchStart", "n": i} for i in range(100)]
+BODY = json.dumps(EVENTS).encode("utf-8")
+GZIPPED = gzip.compress(BODY)
+PLAYER = json.dumps({"data": {"type": "player", "id": "account.x", "attributes": {"name": "x"}}}).encode("utf-8")
+
+
+@pytest.fixture
+def shard_url(server, monkeypatch):
+    """Point the API requests at the local test server."""
+    monkeypatch.setattr(core_module, "SHARD_URL", server.url + "/shards/")
+    return server.url + "/shards/steam"
+
+
+def record(handler, authorizations):
+    """Record the Authorization header of each request to a handler."""
+
+    def recorded(request):
+        authorizations.append(request.headers.get("Authorization"))
+        handler(request)
+
+    return recorded
+
+
+def players_handler(missing=()):
+    """Respond to a players request with the players which aren't missing."""
+
+    def handler(request):
+        query = parse_qs(urlparse(request.path).query)
+        names = query["filter[playerNames]"][0].split(",")
+        found = [name for name in names if name not in missing]
+        body = {
+            "data": [{"type": "player", "id": "account." + name, "attributes": {"name": name}} for name in found],
+            "links": {"self": request.path},
+            "meta": {},
+        }
+        status = 200 if found else 404
+        request.server.respond(status=status, body=json.dumps(body).encode("utf-8"))(request)
+
+    return handler
+
+
+def test_429_rotates_key(server, shard_url):
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 60)}
+    authorizations = []
+    server.routes["/shards/steam/players/account.x"] = [
+        record(server.respond(status=429, headers=headers, rate_limit=False), authorizations),
+        record(server.respond(body=PLAYER), authorizations),
+    ]
+
+    async def main():
+        async with AsyncPUBGCore(["a", "b"], "steam") as pubg:
+            response = await pubg.player("account.x")
+            return response, pubg._rate_limits
+
+    response, rate_limits = asyncio.run(main())
+    assert response["data"]["id"] == "account.x"
+    assert authorizations == ["Bearer a", "Bearer b"]
+    assert rate_limits["a"].remaining == 0
+
+
+def test_retry_server_error(server, shard_url):
+    server.routes["/shards/steam/matches/m"] = [server.respond(status=503), server.respond(body=b'{"data": []}')]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", retry=RetryPolicy(backoff=0)) as pubg:
+            return await pubg.match("m")
+
+    assert asyncio.run(main()) == {"data": []}
+    assert len(server.requests) == 2
+
+
+def test_retry_dropped_connection(server, shard_url):
+    body = b'{"data": []}'
+    server.routes["/shards/steam/matches/m"] = [server.respond(body=body, drop_after=4), server.respond(body=body)]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", retry=RetryPolicy(backoff=0)) as pubg:
+            return await pubg.match("m")
+
+    assert asyncio.run(main()) == {"data": []}
+    assert len(server.requests) == 2
+
+
+def test_retries_exhausted(server, shard_url):
+    server.routes["/shards/steam/matches/m"] = [server.respond(status=503)]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", retry=RetryPolicy(max_attempts=2, backoff=0)) as pubg:
+            await pubg.match("m")
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+    assert len(server.requests) == 2
+
+
+def test_not_modified(server, shard_url):
+    headers = {"ETag": '"abc"'}
+    server.routes["/shards/steam/players/account.x"] = [
+        server.respond(body=PLAYER, headers=headers),
+        server.respond(status=304, headers=headers, rate_limit=False),
+    ]
+    stats = RequestStats()
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", conditional=True, stats=stats) as pubg:
+            first = await pubg.player("account.x")
+            first["data"]["id"] = "changed"
+            return await pubg.player("account.x")
+
+    assert asyncio.run(main()) == json.loads(PLAYER)
+    assert server.requests[-1].headers["If-None-Match"] == '"abc"'
+    assert stats.endpoints["player"].not_modified == 1
+
+
+def test_not_modified_after_eviction(server, shard_url):
+    headers = {"ETag": '"abc"'}
+    server.routes["/shards/steam/players/account.x"] = [
+        server.respond(body=PLAYER, headers=headers),
+        server.respond(status=304, headers=headers),
+        server.respond(body=PLAYER, headers=headers),
+    ]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", conditional=True) as pubg:
+            await pubg.player("account.x")
+            # The conditional headers are sent, but the response is gone by
+            # the time the 304 arrives
+            headers = pubg._conditional_headers
+            pubg._conditional_headers = lambda key: (headers(key), pubg._conditional_responses.clear())[0]
+            return await pubg.player("account.x")
+
+    assert asyncio.run(main()) == json.loads(PLAYER)
+    assert len(server.requests) == 3
+
+
+def test_players_chunks(server, shard_url):
+    names = ["p" + str(i) for i in range(25)]
+    server.routes["/shards/steam/players"] = [players_handler(missing=names[10:20])]
+
+    async def main():
+        async with AsyncPUBG("key", "steam") as pubg:
+            return await pubg.players_from_names(names)
+
+    players = asyncio.run(main())
+    assert len(server.requests) == 3
+    # The chunk with no players found is skipped
+    assert players.names == names[:10] + names[20:]
+    # The links are those of the first chunk
+    assert players.url.endswith("=" + ",".join(names[:10]))
+
+
+def test_player(server, shard_url):
+    server.routes["/shards/steam/players/account.x"] = [server.respond(body=PLAYER)]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam") as pubg:
+            return await pubg.player("account.x")
+
+    assert asyncio.run(main()) == json.loads(PLAYER)
+    assert server.requests[-1].headers["Authorization"] == "Bearer key"
+
+
+def test_players_not_found(server, shard_url):
+    server.routes["/shards/steam/players"] = [players_handler(missing=["a", "b"])]
+
+    async def main():
+        async with AsyncPUBG("key", "steam") as pubg:
+            return await pubg.players_from_names(["a", "b"])
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+
+
+def test_matches_returns_errors(server, shard_url):
+    body = json.dumps({"data": {"type": "match", "id": "m0", "attributes": {}}, "included": []}).encode("utf-8")
+    server.routes["/shards/steam/matches/m0"] = [server.respond(body=body)]
+    server.routes["/shards/steam/matches/m1"] = [server.respond(status=404)]
+
+    async def main():
+        async with AsyncPUBG("key", "steam") as pubg:
+            return await pubg.matches(["m0", "m1"])
+
+    match, error = asyncio.run(main())
+    assert match.match_id == "m0"
+    assert isinstance(error, aiohttp.ClientResponseError)
+
+
+def test_telemetry(server):
+    server.routes["/t"] = [server.respond(body=GZIPPED, headers={"Content-Encoding": "gzip"})]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam") as pubg:
+            return await pubg.telemetry(server.url + "/t")
+
+    assert asyncio.run(main()) == EVENTS
+    assert "Authorization" not in server.requests[-1].headers
+
+
+@pytest.mark.parametrize("headers", [{"Content-Encoding": "gzip"}, {}])
+def test_telemetry_stream(server, headers):
+    body = GZIPPED if headers else BODY
+    server.routes["/t"] = [server.respond(body=body, headers=headers)]
+    stats = RequestStats()
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam", stats=stats) as pubg:
+            return [event async for event in pubg.telemetry(server.url + "/t", stream=True)]
+
+    assert asyncio.run(main()) == EVENTS
+    assert stats.endpoints["telemetry"].decompressed_bytes == len(BODY)
+
+
+def test_telemetry_stream_events(server):
+    server.routes["/t"] = [server.respond(body=GZIPPED, headers={"Content-Encoding": "gzip"})]
+
+    async def main():
+        async with AsyncPUBG("key", "steam") as pubg:
+            return [event async for event in pubg.telemetry(server.url + "/t", stream=True)]
+
+    events = asyncio.run(main())
+    assert all(isinstance(event, TelemetryEvent) for event in events)
+    assert [event.n for event in events] == list(range(100))
+
+
+def test_telemetry_stream_truncated(server):
+    server.routes["/t"] = [server.respond(body=BODY[:-1])]
+
+    async def main():
+        async with AsyncPUBGCore("key", "steam") as pubg:
+            return [event async for event in pubg.telemetry(server.url + "/t", stream=True)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,164 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chicken_dinner.visual import batch
+from chicken_dinner.visual.batch import BatchStats
+from chicken_dinner.visual.batch import ReplayBatch
+
+
+class FakeMatch(object):
+    def __init__(self, match_id, fail=False):
+        self.id = match_id
+        self.downloads = 0
+        self._fail = fail
+
+    def get_telemetry(self):
+        self.downloads += 1
+        if self._fail:
+            raise IOError("download failed")
+        return self.id
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    """Stub out rendering, running the renders in threads, and record the
+    rendered replays."""
+    rendered = []
+    lock = threading.Lock()
+
+    def render(data, options, filename, fps, codec, bitrate):
+        if options.get("fail"):
+            raise ValueError("render failed")
+        with open(filename, "w") as f:
+            f.write(data)
+        with lock:
+            rendered.append((data, os.path.basename(filename), options))
+        return 1.0
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(batch, "set_map_cache_size", lambda size: None)
+    monkeypatch.setattr(batch, "playback_data", lambda telemetry: telemetry)
+    monkeypatch.setattr(batch, "_render_replay", render)
+    return rendered
+
+
+def test_batch_renders_replays(tmp_path, rendered):
+    matches = [FakeMatch("m" + str(i)) for i in range(5)]
+    replays = ReplayBatch(processes=2, download_workers=2)
+    for match in matches:
+        replays.add(match, str(tmp_path / (match.id + ".html")), size=6)
+    replays.add(matches[0], str(tmp_path / "m0_other.html"), size=8)
+    assert len(replays) == 6
+    stats = replays.run()
+    assert sorted(name for _, name, _ in rendered) == [
+        "m0.html",
+        "m0_other.html",
+        "m1.html",
+        "m2.html",
+        "m3.html",
+        "m4.html",
+    ]
+    assert all(name.startswith(data) for data, name, _ in rendered)
+    # Telemetry is downloaded once per match
+    assert [match.downloads for match in matches] == [1, 1, 1, 1, 1]
+    assert (stats.replays, stats.downloads, stats.renders, stats.skipped, stats.failed) == (6, 5, 6, 0, 0)
+    assert stats.render_time == 6.0
+
+
+def test_batch_skips_existing_replays(tmp_path, rendered):
+    match = FakeMatch("m0")
+    (tmp_path / "m0.html").write_text("done")
+    replays = ReplayBatch(processes=1)
+    replays.add(match, str(tmp_path / "m0.html"))
+    replays.add(FakeMatch("m1"), str(tmp_path / "m1.html"))
+    stats = replays.run()
+    assert [name for _, name, _ in rendered] == ["m1.html"]
+    assert match.downloads == 0
+    assert (stats.replays, stats.skipped, stats.renders) == (2, 1, 1)
+
+
+def test_batch_counts_failures(tmp_path, rendered):
+    replays = ReplayBatch(processes=1)
+    replays.add(FakeMatch("m0", fail=True), str(tmp_path / "m0.html"))
+    replays.add(FakeMatch("m0", fail=True), str(tmp_path / "m0_other.html"))
+    replays.add(FakeMatch("m1"), str(tmp_path / "m1.html"), fail=True)
+    replays.add(FakeMatch("m2"), str(tmp_path / "m2.html"))
+    stats = replays.run()
+    assert [name for _, name, _ in rendered] == ["m2.html"]
+    assert (stats.replays, stats.downloads, stats.renders, stats.failed) == (4, 2, 1, 3)
+
+
+def test_batch_bounds_pending_matches(tmp_path, rendered, monkeypatch):
+    pending = []
+    active = set()
+    lock = threading.Lock()
+    render = batch._render_replay
+
+    def download(self, match):
+        with lock:
+            active.add(match.id)
+            pending.append(len(active))
+        return match.get_telemetry(), 0.0
+
+    def tracked_render(data, options, filename, fps, codec, bitrate):
+        duration = render(data, options, filename, fps, codec, bitrate)
+        with lock:
+            active.discard(data)
+        return duration
+
+    monkeypatch.setattr(ReplayBatch, "_download", download)
+    monkeypatch.setattr(batch, "_render_replay", tracked_render)
+    replays = ReplayBatch(processes=1, download_workers=4, max_pending=2)
+    for i in range(8):
+        replays.add(FakeMatch("m" + str(i)), str(tmp_path / ("m" + str(i) + ".html")))
+    stats = replays.run()
+    assert stats.renders == 8
+    assert max(pending) <= 2
+
+
+def test_render_replay_replaces_file(tmp_path, monkeypatch):
+    filename = str(tmp_path / "m0.mp4")
+
+    def save_playback(data, options, partial, fps, processes, codec, bitrate):
+        assert partial == str(tmp_path / "m0.part.mp4")
+        with open(partial, "w") as f:
+            f.write(data)
+
+    monkeypatch.setattr(batch, "save_playback", save_playback)
+    batch._render_replay("replay", {}, filename, 30, None, None)
+    assert os.listdir(str(tmp_path)) == ["m0.mp4"]
+
+
+def test_render_replay_removes_partial_file(tmp_path, monkeypatch):
+    def save_playback(data, options, partial, fps, processes, codec, bitrate):
+        with open(partial, "w") as f:
+            f.write("partial")
+        raise ValueError("render failed")
+
+    monkeypatch.setattr(batch, "save_playback", save_playback)
+    with pytest.raises(ValueError):
+        batch._render_replay("replay", {}, str(tmp_path / "m0.mp4"), 30, None, None)
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_batch_stats():
+    stats = BatchStats()
+    assert stats.to_dict()["renders_per_hour"] == 0.0
+    stats.replays = 4
+    stats.renders = 3
+    stats.skipped = 1
+    stats.downloads = 2
+    stats.download_time = 5.0
+    stats.render_time = 90.0
+    stats.wall_time = 60.0
+    data = stats.to_dict()
+    assert data["downloads_per_hour"] == 120.0
+    assert data["renders_per_hour"] == 180.0
+    assert stats.summary().splitlines() == [
+        "4 replays: 3 rendered, 1 skipped, 0 failed in 60.0s",
+        "download: 2 matches, 5.0s busy, 120.0 per hour",
+        "render: 3 replays, 90.0s busy, 180.0 per hour",
+    ]
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+
+import pytest
+
+from chicken_dinner.pubgapi.cache import FileCache
+from chicken_dinner.pubgapi.cache import SQLiteCache
+from chicken_dinner.pubgapi.cache import cache_key
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "file":
+        return FileCache(str(tmp_path / "cache"), max_size=1000)
+    return SQLiteCache(str(tmp_path / "cache.db"), max_size=1000)
+
+
+def test_cache_key():
+    assert cache_key("https://x/y") == "https://x/y"
+    assert cache_key("https://x/y", {"b": 2, "a": 1}) == "https://x/y?a=1&b=2"
+
+
+def test_get_set(cache):
+    assert cache.get("a") is None
+    cache.set("a", b"value")
+    assert cache.get("a") == b"value"
+    cache.set("a", b"other")
+    assert cache.get("a") == b"other"
+
+
+def test_expiry(cache):
+    cache.set("a", b"value", ttl=-1)
+    assert cache.get("a") is None
+    cache.set("b", b"value", ttl=60)
+    assert cache.get("b") == b"value"
+
+
+def test_evicts_least_recently_used(cache):
+    cache.set("a", b"x" * 400)
+    time.sleep(0.01)
+    cache.set("b", b"x" * 400)
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.set("c", b"x" * 400)
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_clear(cache):
+    cache.set("a", b"value")
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_ttl_for(cache):
+    assert cache.ttl_for("match") is None
+    assert cache.ttl_for("status") == 0
+    assert cache.ttl_for("unknown") == 0
+
+
+def test_file_cache_concurrent_writes(tmp_path):
+    path = str(tmp_path / "cache")
+    caches = [FileCache(path) for _ in range(4)]
+    values = [bytes([i]) * 100000 for i in range(4)]
+
+    def write(i):
+        for _ in range(20):
+            caches[i].set("key", values[i])
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert caches[0].get("key") in values
+    assert not [name for name in os.listdir(path) if name.endswith(".tmp")]
+
+
+def test_base_cache_is_abstract():
+    from chicken_dinner.pubgapi.cache import BaseCache
+
+    with pytest.raises(TypeError):
+        BaseCache()
+
+
+def test_file_cache_size_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache")
+    # Separate instances stand in for separate processes sharing the directory
+    caches = [FileCache(path, max_size=1000), FileCache(path, max_size=1000)]
+    for i in range(10):
+        caches[i % 2].set(str(i), b"x" * 300)
+        time.sleep(0.01)
+        assert sum(entry.stat().st_size for entry in os.scandir(path)) <= 1000
+    assert caches[0].get("9") is not None
+    assert caches[1].get("0") is None
@@ -0,0 +1,114 @@
+import importlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from click.testing import CliRunner
+
+cli_module = importlib.import_module("chicken_dinner.cli.cli")
+
+
+class FakeTelemetry(object):
+    def __init__(self, rendered):
+        self.rendered = rendered
+
+    def playback_animation(self, filename, **kwargs):
+        self.rendered.append(filename)
+
+
+class FakeRoster(object):
+    def __init__(self, player_names):
+        self.player_names = player_names
+
+
+class FakeMatch(object):
+    game_mode = "squad"
+
+    def __init__(self, match_id, winners, rendered):
+        self.id = match_id
+        self.created_at = "2020-05-09T12:00:00Z"
+        self.winner = FakeRoster(winners)
+        self._rendered = rendered
+
+    def get_telemetry(self):
+        return FakeTelemetry(self._rendered)
+
+
+class FakePlayer(object):
+    name = "me"
+    match_ids = ["m0", "m1", "m2", "m3"]
+
+
+class FakePUBG(object):
+    def __init__(self):
+        self.fetched = []
+        self.rendered = []
+
+    def players_from_names(self, names):
+        return [FakePlayer()]
+
+    def match(self, match_id):
+        self.fetched.append(match_id)
+        return FakeMatch(match_id, ["me"] if match_id in ("m1", "m3") else ["other"], self.rendered)
+
+    def matches(self, match_ids):
+        return [self.match(match_id) for match_id in match_ids]
+
+
+def run(monkeypatch, *args):
+    pubg = FakePUBG()
+    monkeypatch.setattr(cli_module, "get_pubg", lambda api_key, shard: pubg)
+    result = CliRunner().invoke(cli_module.cli, ["replay", "--api-key=key"] + list(args) + ["me"])
+    assert result.exit_code == 0, result.output
+    return pubg
+
+
+def test_latest_win_stops_at_first_win(monkeypatch):
+    pubg = run(monkeypatch, "--latest", "--wins-only")
+    assert pubg.fetched == ["m0", "m1"]
+    assert [filename.rsplit("_", 1)[1] for filename in pubg.rendered] == ["m1.html"]
+
+
+def test_wins_only(monkeypatch):
+    pubg = run(monkeypatch, "--wins-only", "--format=mp4")
+    assert pubg.fetched == ["m0", "m1", "m2", "m3"]
+    assert [filename.rsplit("_", 1)[1] for filename in pubg.rendered] == ["m1.mp4", "m3.mp4"]
+
+
+def test_latest(monkeypatch):
+    pubg = run(monkeypatch, "--latest")
+    assert pubg.fetched == ["m0"]
+    assert len(pubg.rendered) == 1
+
+
+def run_batch(monkeypatch, tmp_path, *args):
+    batch = importlib.import_module("chicken_dinner.visual.batch")
+    rendered = []
+
+    def render(data, options, filename, fps, codec, bitrate):
+        rendered.append(os.path.basename(filename))
+        return 0.0
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(batch, "set_map_cache_size", lambda size: None)
+    monkeypatch.setattr(batch, "playback_data", lambda telemetry: telemetry)
+    monkeypatch.setattr(batch, "_render_replay", render)
+    pubg = FakePUBG()
+    monkeypatch.setattr(cli_module, "get_pubg", lambda api_key, shard: pubg)
+    args = ["replay-batch", "--api-key=key", "--path=" + str(tmp_path)] + list(args) + ["me"]
+    result = CliRunner().invoke(cli_module.cli, args)
+    assert result.exit_code == 0, result.output
+    return pubg, sorted(filename.rsplit("_", 1)[1] for filename in rendered), result.output
+
+
+def test_batch_wins_only(monkeypatch, tmp_path):
+    pubg, rendered, output = run_batch(monkeypatch, tmp_path, "--wins-only", "--format=mp4")
+    assert pubg.fetched == ["m0", "m1", "m2", "m3"]
+    assert rendered == ["m1.mp4", "m3.mp4"]
+    assert "Rendering 2 replays" in output
+    assert "2 replays: 2 rendered, 0 skipped, 0 failed" in output
+
+
+def test_batch_latest(monkeypatch, tmp_path):
+    pubg, rendered, _ = run_batch(monkeypatch, tmp_path, "--latest")
+    assert pubg.fetched == ["m0"]
+    assert rendered == ["m0.html"]
@@ -0,0 +1,55 @@
+import json
+import threading
+
+from chicken_dinner.pubgapi.core import PUBGCore
+from chicken_dinner.pubgapi.stats import RequestStats
+
+BODY = json.dumps({"data": {"id": "account.x", "matches": [1, 2]}}).encode("utf-8")
+
+
+def routes(server):
+    headers = {"ETag": '"abc"'}
+    return [server.respond(body=BODY, headers=headers), server.respond(status=304, headers=headers)]
+
+
+def test_not_modified_returns_fresh_copies(server):
+    server.routes["/p"] = routes(server)
+    stats = RequestStats()
+    pubg = PUBGCore("key", "steam", conditional=True, stats=stats)
+    first = pubg._get_json("player", server.url + "/p", limited=False)
+    first["data"]["matches"].append(3)
+    second = pubg._get_json("player", server.url + "/p", limited=False)
+    assert second == json.loads(BODY)
+    assert server.requests[-1].headers["If-None-Match"] == '"abc"'
+    assert stats.endpoints["player"].not_modified == 1
+
+
+def test_not_conditional_endpoint(server):
+    server.routes["/p"] = [server.respond(body=BODY, headers={"ETag": '"abc"'})]
+    pubg = PUBGCore("key", "steam", conditional=True)
+    pubg._get_json("match", server.url + "/p", limited=False)
+    pubg._get_json("match", server.url + "/p", limited=False)
+    assert "If-None-Match" not in server.requests[-1].headers
+
+
+def test_concurrent_conditional_responses():
+    pubg = PUBGCore("key", "steam", conditional=True)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(5000):
+                key = str((i + offset) % 2000)
+                pubg._store_conditional(key, {"ETag": key}, key.encode())
+                content = pubg._conditional_response(str((i * 7) % 2000))
+                assert content is None or content == str((i * 7) % 2000).encode()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(pubg._conditional_responses) <= 1024
@@ -0,0 +1,99 @@
+import gzip
+import io
+import json
+import os
+
+import pytest
+from requests.exceptions import ContentDecodingError
+
+from chicken_dinner.pubgapi import core as core_module
+from chicken_dinner.pubgapi.cache import FileCache
+from chicken_dinner.pubgapi.core import PUBGCore
+from chicken_dinner.pubgapi.retry import RetryPolicy
+from chicken_dinner.store import TelemetryStore
+
+EVENTS = [{"_T": "LogMatchStart", "n": i} for i in range(100)]
+BODY = json.dumps(EVENTS).encode("utf-8")
+GZIPPED = gzip.compress(BODY)
+
+
+def core(**kwargs):
+    return PUBGCore("key", "steam", retry=RetryPolicy(max_attempts=3, backoff=0), **kwargs)
+
+
+def test_accept_encoding(server):
+    server.routes["/t"] = [server.respond(body=BODY)]
+    for gzip_flag, encoding in ((True, "gzip"), (False, "identity")):
+        pubg = core(gzip=gzip_flag)
+        pubg.telemetry(server.url + "/t", fileobj=io.BytesIO())
+        assert server.requests[-1].headers["Accept-Encoding"] == encoding
+        assert "Authorization" not in server.requests[-1].headers
+
+
+def test_raw_gzip_passthrough(server):
+    server.routes["/t"] = [server.respond(body=GZIPPED, headers={"Content-Encoding": "gzip"})]
+    f = io.BytesIO()
+    assert core().telemetry(server.url + "/t", fileobj=f) == len(GZIPPED)
+    assert f.getvalue() == GZIPPED
+
+
+def test_raw_identity(server):
+    server.routes["/t"] = [server.respond(body=BODY)]
+    f = io.BytesIO()
+    core().telemetry(server.url + "/t", fileobj=f)
+    assert f.getvalue() == BODY
+
+
+def test_raw_unsupported_encoding(server):
+    server.routes["/t"] = [server.respond(body=b"xx", headers={"Content-Encoding": "br"})]
+    with pytest.raises(ContentDecodingError):
+        core().telemetry(server.url + "/t", fileobj=io.BytesIO())
+
+
+def test_raw_retries_dropped_connection(server):
+    headers = {"Content-Encoding": "gzip"}
+    server.routes["/t"] = [
+        server.respond(body=GZIPPED, headers=headers, drop_after=100),
+        server.respond(body=GZIPPED, headers=headers),
+    ]
+    f = io.BytesIO(b"prefix")
+    f.seek(0, 2)
+    core().telemetry(server.url + "/t", fileobj=f)
+    assert f.getvalue() == b"prefix" + GZIPPED
+    assert len(server.requests) == 2
+
+
+def test_store_fetch(server, tmp_path):
+    server.routes["/gz"] = [server.respond(body=GZIPPED, headers={"Content-Encoding": "gzip"})]
+    server.routes["/plain"] = [server.respond(body=BODY)]
+
+    class Pubg(object):
+        _core = core()
+
+    store = TelemetryStore(str(tmp_path))
+    store.fetch(Pubg, "a", telemetry_url=server.url + "/gz")
+    store.fetch(Pubg, "b", telemetry_url=server.url + "/plain")
+    assert store.get_bytes("a") == GZIPPED
+    assert store.load("a") == EVENTS
+    assert store.load("b") == EVENTS
+    assert list(store.stream("b")) == EVENTS
+
+
+def test_raw_endpoints(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(core_module, "SHARD_URL", server.url + "/shards/")
+    headers = {"Content-Encoding": "gzip"}
+    server.routes["/shards/steam/matches/m"] = [server.respond(body=GZIPPED, headers=headers)]
+    server.routes["/shards/steam/players"] = [server.respond(body=GZIPPED, headers=headers)]
+    cache = FileCache(str(tmp_path))
+    pubg = core(cache=cache)
+    f = io.BytesIO()
+    assert pubg.match("m", fileobj=f) == len(GZIPPED)
+    assert f.getvalue() == GZIPPED
+    f = io.BytesIO()
+    pubg.players("player_names", ["a", "b"], fileobj=f)
+    assert f.getvalue() == GZIPPED
+    request = server.requests[-1]
+    assert request.path == "/shards/steam/players?filter%5BplayerNames%5D=a%2Cb"
+    assert request.headers["Authorization"] == "Bearer key"
+    # Raw responses are not cached
+    assert os.listdir(str(tmp_path)) == []
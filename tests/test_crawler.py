@@ -0,0 +1,118 @@
+import datetime
+import gzip
+import json
+
+from chicken_dinner.crawler import SAMPLES_MARGIN
+from chicken_dinner.crawler import SAMPLES_MAX_AGE
+from chicken_dinner.crawler import TIMESTAMP_FORMAT
+from chicken_dinner.crawler import SamplesCrawler
+from chicken_dinner.store import TelemetryStore
+
+WINDOW = datetime.timedelta(days=5)
+
+
+class FakeSamples(object):
+    def __init__(self, match_ids):
+        self.match_ids = match_ids
+
+
+class FakeMatch(object):
+    def __init__(self, match_id):
+        self.telemetry_url = "telemetry/" + match_id
+
+
+class FakeCore(object):
+    def __init__(self, pubg):
+        self._pubg = pubg
+
+    def telemetry(self, url, fileobj=None):
+        match_id = url.split("/")[1]
+        if match_id in self._pubg.failing:
+            raise IOError("telemetry failed")
+        body = gzip.compress(json.dumps([{"_T": "LogMatchStart", "id": match_id}]).encode("utf-8"))
+        fileobj.write(body)
+        return len(body)
+
+
+class FakePUBG(object):
+    shard = "steam"
+
+    def __init__(self, windows, failing=()):
+        self.windows = list(windows)
+        self.failing = set(failing)
+        self.starts = []
+        self.fetched = []
+        self._core = FakeCore(self)
+
+    def samples(self, start, shard):
+        self.starts.append((shard, start))
+        return FakeSamples(self.windows.pop(0) if self.windows else [])
+
+    def match(self, match_id, shard):
+        self.fetched.append(match_id)
+        return FakeMatch(match_id)
+
+
+def crawler(tmp_path, pubg, **kwargs):
+    kwargs.setdefault("window", WINDOW)
+    return SamplesCrawler(pubg, str(tmp_path / "store"), str(tmp_path / "crawler.json"), **kwargs)
+
+
+def test_crawl_advances_windows(tmp_path):
+    pubg = FakePUBG([["a", "b"], ["c"]])
+    samples_crawler = crawler(tmp_path, pubg)
+    oldest = samples_crawler.next_start("steam")
+    assert samples_crawler.crawl() == ["a", "b", "c"]
+    starts = [datetime.datetime.strptime(start, TIMESTAMP_FORMAT) for _, start in pubg.starts]
+    # Only complete windows are crawled
+    assert starts == [oldest, oldest + WINDOW]
+    assert samples_crawler.next_start("steam") == oldest + 2 * WINDOW
+    assert samples_crawler.crawl_window("steam") is None
+    assert samples_crawler.store.load("c") == [{"_T": "LogMatchStart", "id": "c"}]
+
+
+def test_checkpoint_resumes(tmp_path):
+    pubg = FakePUBG([["a"], ["b"]])
+    samples_crawler = crawler(tmp_path, pubg)
+    samples_crawler.crawl_window("steam")
+    next_start = samples_crawler.next_start("steam")
+    resumed = crawler(tmp_path, FakePUBG([["b"]]))
+    assert resumed.next_start("steam") == next_start
+    assert resumed.crawl() == ["b"]
+    with open(str(tmp_path / "crawler.json")) as f:
+        state = json.load(f)
+    assert state["shards"]["steam"]["next_start"] == (next_start + WINDOW).strftime(TIMESTAMP_FORMAT)
+
+
+def test_oldest_start(tmp_path):
+    samples_crawler = crawler(tmp_path, FakePUBG([]))
+    now = datetime.datetime.utcnow()
+    assert abs(samples_crawler.next_start("steam") - (now - SAMPLES_MAX_AGE + SAMPLES_MARGIN)).total_seconds() < 5
+
+
+def test_skips_stored_matches(tmp_path):
+    store = TelemetryStore(str(tmp_path / "store"))
+    store.put("a", [{"_T": "LogMatchStart"}])
+    pubg = FakePUBG([["a", "b", "b"]])
+    assert crawler(tmp_path, pubg).crawl_window("steam") == ["b"]
+    assert pubg.fetched == ["b"]
+
+
+def test_failed_matches_are_retried(tmp_path):
+    pubg = FakePUBG([["a", "b"], ["c"]], failing=["b"])
+    samples_crawler = crawler(tmp_path, pubg)
+    assert samples_crawler.crawl_window("steam") == ["a"]
+    resumed = crawler(tmp_path, pubg)
+    assert resumed._state["shards"]["steam"]["failed"] == {"b": 1}
+    pubg.failing.clear()
+    assert resumed.crawl_window("steam") == ["b", "c"]
+    assert resumed._state["shards"]["steam"]["failed"] == {}
+
+
+def test_failed_matches_are_given_up(tmp_path):
+    pubg = FakePUBG([["a"], [], [], []], failing=["a"])
+    samples_crawler = crawler(tmp_path, pubg, window=datetime.timedelta(days=3), max_attempts=3)
+    assert samples_crawler.crawl() == []
+    # Fetched for its own window and retried with the next two
+    assert pubg.fetched == ["a", "a", "a"]
+    assert samples_crawler._state["shards"]["steam"]["failed"] == {}
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from chicken_dinner.util import JSONArrayDecoder
+from chicken_dinner.util import iter_json_array
+
+DOCUMENT = json.dumps(
+    [
+        1.5,
+        -2,
+        3e-7,
+        10,
+        0,
+        -0.25e3,
+        True,
+        False,
+        None,
+        "naïve ☃",
+        {"_T": "LogPlayerPosition", "character": {"location": {"x": 1.25, "y": -3}}, "elapsedTime": 123},
+        [[], {}, ""],
+    ],
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+@pytest.mark.parametrize("offset", range(len(DOCUMENT) + 1))
+def test_split_at_every_offset(offset):
+    chunks = [DOCUMENT[:offset], DOCUMENT[offset:]]
+    assert list(iter_json_array(chunks)) == json.loads(DOCUMENT)
+
+
+def test_byte_at_a_time():
+    chunks = [DOCUMENT[i : i + 1] for i in range(len(DOCUMENT))]
+    assert list(iter_json_array(chunks)) == json.loads(DOCUMENT)
+
+
+def test_number_waits_for_delimiter():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b"[1.") == []
+    assert decoder.feed(b"5") == []
+    assert decoder.feed(b"]") == [1.5]
+    assert decoder.finished
+
+
+def test_number_at_end_of_final_chunk():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed("[1, 2") == [1]
+    with pytest.raises(ValueError):
+        decoder.feed("", final=True)
+
+
+def test_truncated_array():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+
+
+@pytest.mark.parametrize("document", ["[1,,2]", "[,1]", "[1,]", "[1 2]", '[{"a": 1} {"b": 2}]', "[1}", "[,]"])
+def test_malformed_array(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array([document.encode("utf-8")]))
+
+
+@pytest.mark.parametrize("document", ["[1,,2]", "[1,]", "[1 2]", "[12x, 3]"])
+def test_malformed_array_at_every_offset(document):
+    for offset in range(len(document) + 1):
+        with pytest.raises(ValueError):
+            list(iter_json_array([document[:offset], document[offset:]]))
+
+
+def test_empty_array():
+    assert list(iter_json_array([b"[", b" ]"])) == []
+
+
+def test_corrupt_element_fails_fast():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed('[{"a": 1}, {"b": nope}') == [{"a": 1}]
+    with pytest.raises(ValueError):
+        decoder.feed(", " + json.dumps({"padding": "x" * 100}))
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from chicken_dinner.pubgapi.core import PUBGCore
+
+
+def test_keys_share_requests():
+    pubg = PUBGCore(["a", "b"], "steam")
+    keys = [pubg._acquire() for _ in range(20)]
+    assert keys.count("a") == 10
+    assert keys.count("b") == 10
+
+
+def test_concurrent_acquire_never_overdraws(monkeypatch):
+    pubg = PUBGCore(["a", "b"], "steam")
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    keys = []
+
+    def worker():
+        for _ in range(5):
+            keys.append(pubg._acquire())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(keys) == 20
+    assert not sleeps
+    assert all(rate_limit.remaining == 0 for rate_limit in pubg._rate_limits.values())
+
+
+def test_remaining_resets_with_window():
+    pubg = PUBGCore("a", "steam")
+    pubg._set_rate_limit("a", 0, time.time() - 1)
+    assert pubg._acquire() == "a"
+    rate_limit = pubg._rate_limits["a"]
+    assert rate_limit.remaining == rate_limit.limit - 1
+    assert rate_limit.reset > time.time()
+
+
+def test_rate_limited_key_is_skipped():
+    pubg = PUBGCore(["a", "b"], "steam")
+    pubg._set_rate_limit("a", 0, time.time() + 60)
+    assert [pubg._acquire() for _ in range(3)] == ["b", "b", "b"]
+
+
+def test_429_rotates_key(server):
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 60)}
+    server.routes["/p"] = [
+        server.respond(status=429, headers=headers, rate_limit=False),
+        server.respond(body=b"{}"),
+    ]
+    pubg = PUBGCore(["a", "b"], "steam")
+    pubg._get(server.url + "/p")
+    assert len(server.requests) == 2
+    assert server.requests[-1].headers["Authorization"] == "Bearer b"
+    assert pubg._rate_limits["a"].remaining == 0
+    assert pubg._rate_limits["b"].remaining == 9
+
+
+def test_response_headers_update_rate_limit(server):
+    headers = {"X-RateLimit-Limit": "100"}
+    server.routes["/p"] = [server.respond(body=b"{}", headers=headers)]
+    pubg = PUBGCore("a", "steam")
+    pubg._get(server.url + "/p")
+    rate_limit = pubg._rate_limits["a"]
+    assert (rate_limit.limit, rate_limit.remaining) == (100, 9)
+
+
+def test_response_without_rate_limit_headers(server):
+    server.routes["/p"] = [server.respond(status=304, rate_limit=False)]
+    pubg = PUBGCore("a", "steam")
+    response = pubg._get(server.url + "/p")
+    assert response.status_code == 304
+    assert pubg._rate_limits["a"].remaining == pubg._rate_limits["a"].limit - 1
@@ -0,0 +1,131 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.image as mpimg  # noqa: E402
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from chicken_dinner.visual import playback  # noqa: E402
+
+
+@pytest.fixture
+def map_images(tmp_path):
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / ("map%d.png" % i))
+        img = np.random.RandomState(i).randint(0, 256, size=(512, 512, 3)).astype(np.uint8)
+        mpimg.imsave(path, img)
+        paths.append(path)
+    yield paths
+    playback.set_map_cache_size(playback.MAP_CACHE_SIZE)
+
+
+def test_map_levels(map_images):
+    levels = playback.map_levels(map_images[0])
+    assert [level.shape[:2] for level in levels] == [(512, 512), (256, 256), (128, 128)]
+    assert all(level.dtype == np.uint8 for level in levels)
+    expected = levels[0].reshape(256, 2, 256, 2, -1).mean(axis=(1, 3))
+    assert np.abs(levels[1] - expected).max() <= 0.5
+
+
+def test_map_cache(map_images):
+    playback.set_map_cache_size(2)
+    first = playback.map_levels(map_images[0])
+    assert playback.map_levels(map_images[0]) is first
+    playback.map_levels(map_images[1])
+    playback.map_levels(map_images[2])
+    assert playback.map_levels(map_images[0]) is not first
+    playback.set_map_cache_size(1)
+    assert len(playback._map_cache) == 1
+
+
+def test_map_level():
+    levels = [np.zeros((n, n)) for n in (4096, 2048, 1024, 512, 256)]
+    assert playback._map_level(levels, 1, 500) == 3
+    assert playback._map_level(levels, 1, 4096) == 0
+    assert playback._map_level(levels, 0.1, 500) == 0
+    assert playback._map_level(levels, 1, 10) == 4
+
+
+@pytest.fixture
+def match_data(tmp_path, monkeypatch):
+    img = np.random.RandomState(0).randint(0, 256, size=(256, 256, 3)).astype(np.uint8)
+    mpimg.imsave(str(tmp_path / "Savage_Main_Low_Res.png"), img)
+    monkeypatch.setattr(playback, "MAP_ASSET_PATH", str(tmp_path))
+    players = ["alice", "bob", "carol", "dave"]
+    positions = {
+        player: [(t, 100000 + 5000 * t + 20000 * i, 150000 + 3000 * t, 0) for t in range(0, 31 - 8 * i)]
+        for i, player in enumerate(players)
+    }
+    circles = {
+        color: [(t, 200000 + 1000 * t, 200000 - 1000 * t, 0, (200000 - 8000 * t) / scale) for t in range(21)]
+        for color, scale in (("blue", 1), ("red", 4), ("white", 2))
+    }
+    yield {
+        "positions": positions,
+        "circles": circles,
+        "winner": ["alice"],
+        "killed": ["bob", "carol", "dave"],
+        "rosters": {1: ["alice", "bob"], 2: ["carol", "dave"]},
+        "damages": {},
+        "package_spawns": [(5, 250000, 250000, 0)],
+        "package_lands": [(12, 250000, 250000, 0)],
+        "map_id": "Savage_Main",
+    }
+    playback.set_map_cache_size(playback.MAP_CACHE_SIZE)
+
+
+@pytest.mark.parametrize("interpolate", [True, False])
+def test_render_out_of_order(match_data, interpolate):
+    options = dict(
+        zoom=True,
+        highlight_winner=True,
+        dead_player_labels=True,
+        label_players=["carol"],
+        team_colors={"alice": "r", "bob": "r", "carol": "b", "dave": "b"},
+        end_frames=5,
+        interpolate=interpolate,
+        size=1,
+        dpi=50,
+    )
+    sequential = playback.build_playback(match_data, **options)
+    expected = [sequential.render(frame) for frame in sequential.frames]
+    reverse = playback.build_playback(match_data, **options)
+    frames = list(reverse.frames)
+    rendered = [reverse.render(frame) for frame in reversed(frames)]
+    assert rendered[::-1] == expected
+
+
+def naive_resample(coords, frames, tidx, vidxs, step=False):
+    resampled = []
+    for t in frames:
+        after = next((c for c in coords if c[tidx] > t), None)
+        before = [c for c in coords if c[tidx] <= t]
+        if not before:
+            values = [coords[0][v] for v in vidxs]
+        elif after is None:
+            values = [coords[-1][v] for v in vidxs]
+        elif step:
+            values = [after[v] for v in vidxs]
+        else:
+            before = before[-1]
+            fraction = (t - before[tidx]) / (after[tidx] - before[tidx])
+            values = [before[v] + fraction * (after[v] - before[v]) for v in vidxs]
+        resampled.append(values)
+    return np.array(resampled).T
+
+
+@pytest.mark.parametrize("step", [False, True])
+def test_resample(step):
+    coords = [(2, 10.0, 100.0, 0), (3, 20.0, 50.0, 0), (7, 60.0, 50.0, 0), (8, 0.0, 0.0, 0)]
+    frames = np.arange(0, 12, 0.5)
+    resampled = playback._resample(coords, frames, 0, [1, 2], step=step)
+    assert resampled.shape == (2, len(frames))
+    np.testing.assert_allclose(resampled, naive_resample(coords, frames, 0, [1, 2], step=step))
+
+
+def test_resample_single_coordinate():
+    frames = np.arange(5, dtype=float)
+    resampled = playback._resample([(2, 1.0, 2.0)], frames, 0, [2, 1])
+    np.testing.assert_array_equal(resampled, [[2.0] * 5, [1.0] * 5])
@@ -0,0 +1,68 @@
+import pytest
+import requests
+
+from chicken_dinner.models.players import Players
+
+
+class FakeCore(object):
+    def __init__(self, missing=(), status=404):
+        self.missing = set(missing)
+        self.status = status
+        self.requests = []
+
+    def players(self, filter_type, filter_value, shard=None):
+        self.requests.append(list(filter_value))
+        found = [name for name in filter_value if name not in self.missing]
+        if not found:
+            response = requests.Response()
+            response.status_code = self.status
+            raise requests.HTTPError(response=response)
+        return {
+            "data": [{"type": "player", "id": "account." + name, "attributes": {"name": name}} for name in found],
+            "links": {"self": "players?" + ",".join(filter_value)},
+            "meta": {"chunk" + str(len(self.requests)): True},
+        }
+
+
+class FakePUBG(object):
+    shard = "steam"
+
+    def __init__(self, core):
+        self._core = core
+
+
+def test_chunk_filter_value():
+    names = ["p" + str(i) for i in range(25)] + ["p0"]
+    chunks = Players.chunk_filter_value(names)
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert Players.chunk_filter_value("a,b,a") == [["a", "b"]]
+
+
+def test_merges_chunks():
+    core = FakeCore()
+    names = ["p" + str(i) for i in range(15)]
+    players = Players(FakePUBG(core), "player_names", names)
+    assert players.names == names
+    assert players.response["meta"] == {"chunk1": True, "chunk2": True}
+    assert players.url == "players?" + ",".join(names[:10])
+
+
+def test_missing_chunk_is_skipped():
+    names = ["p" + str(i) for i in range(15)]
+    core = FakeCore(missing=names[10:])
+    players = Players(FakePUBG(core), "player_names", names)
+    assert players.names == names[:10]
+
+
+def test_all_missing_raises():
+    core = FakeCore(missing=["a", "b"])
+    with pytest.raises(requests.HTTPError):
+        Players(FakePUBG(core), "player_names", ["a", "b"])
+
+
+def test_other_errors_raise():
+    names = ["p" + str(i) for i in range(15)]
+    core = FakeCore(missing=names[:10], status=500)
+    with pytest.raises(requests.HTTPError):
+        Players(FakePUBG(core), "player_names", names)
+    assert len(core.requests) == 1
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from chicken_dinner.pubgapi.limiter import BaseLimiter
+from chicken_dinner.pubgapi.limiter import SQLiteLimiter
+from chicken_dinner.pubgapi.limiter import TokenBucketLimiter
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_limiter(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return TokenBucketLimiter(**kwargs)
+        return SQLiteLimiter(str(tmp_path / "limiter.db"), **kwargs)
+
+    return make
+
+
+def test_base_limiter_is_abstract():
+    with pytest.raises(TypeError):
+        BaseLimiter()
+
+
+def test_burst_then_wait(make_limiter):
+    limiter = make_limiter(rate=10, period=60)
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+    # Each request over the burst waits for another token, 6 seconds apart
+    assert limiter.reserve() == pytest.approx(6, abs=0.1)
+    assert limiter.reserve() == pytest.approx(12, abs=0.1)
+
+
+def test_update_drains_to_remaining(make_limiter):
+    limiter = make_limiter(rate=10, period=60)
+    limiter.update(2, time.time() + 60)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() > 0
+
+
+def test_update_waits_for_reset(make_limiter):
+    limiter = make_limiter(rate=10, period=60)
+    limiter.update(0, time.time() + 30)
+    assert limiter.reserve() == pytest.approx(30, abs=0.1)
+
+
+def test_sqlite_limiter_is_shared(tmp_path):
+    path = str(tmp_path / "limiter.db")
+    first = SQLiteLimiter(path, rate=2, period=60)
+    second = SQLiteLimiter(path, rate=2, period=60)
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    assert first.reserve() > 0
+    # Separate buckets in the same database are independent
+    assert SQLiteLimiter(path, name="other", rate=2, period=60).reserve() == 0.0
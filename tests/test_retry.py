@@ -0,0 +1,97 @@
+import pytest
+import requests
+
+from chicken_dinner.pubgapi import retry
+from chicken_dinner.pubgapi.core import PUBGCore
+from chicken_dinner.pubgapi.retry import CircuitBreaker
+from chicken_dinner.pubgapi.retry import CircuitOpenError
+from chicken_dinner.pubgapi.retry import RetryPolicy
+
+BODY = b'{"data": []}'
+
+
+def test_delay_is_capped_exponential(monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    policy = RetryPolicy(backoff=0.5, max_backoff=3)
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+def test_delay_has_full_jitter():
+    policy = RetryPolicy(backoff=1, max_backoff=60)
+    delays = [policy.delay(3) for _ in range(200)]
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_for_endpoint():
+    telemetry = RetryPolicy(max_attempts=5)
+    policy = RetryPolicy(endpoints={"telemetry": telemetry})
+    assert policy.for_endpoint("telemetry") is telemetry
+    assert policy.for_endpoint("match") is policy
+    assert policy.for_endpoint(None) is policy
+
+
+def test_circuit_breaker(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(retry.time, "time", lambda: now[0])
+    breaker = CircuitBreaker(threshold=2, recovery_time=30)
+    breaker.failure("steam")
+    breaker.check("steam")
+    breaker.failure("steam")
+    assert breaker.is_open("steam")
+    assert not breaker.is_open("kakao")
+    with pytest.raises(CircuitOpenError):
+        breaker.check("steam")
+    breaker.check("kakao")
+
+    now[0] += 31
+    # One trial request is allowed, and others wait for its outcome
+    breaker.check("steam")
+    with pytest.raises(CircuitOpenError):
+        breaker.check("steam")
+    breaker.success("steam")
+    assert not breaker.is_open("steam")
+    breaker.failure("steam")
+    breaker.check("steam")
+
+
+def test_retry_server_error(server):
+    server.routes["/m"] = [server.respond(status=503), server.respond(body=BODY)]
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(backoff=0))
+    assert pubg._get_json("match", server.url + "/m", limited=False) == {"data": []}
+    assert len(server.requests) == 2
+
+
+def test_retry_connection_error(server):
+    server.routes["/m"] = [server.respond(body=BODY, drop_after=4), server.respond(body=BODY)]
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(backoff=0))
+    assert pubg._get_json("match", server.url + "/m", limited=False) == {"data": []}
+    assert len(server.requests) == 2
+
+
+def test_no_retry_client_error(server):
+    server.routes["/m"] = [server.respond(status=404)]
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(backoff=0))
+    with pytest.raises(requests.HTTPError):
+        pubg._get_json("match", server.url + "/m", limited=False)
+    assert len(server.requests) == 1
+
+
+def test_retries_exhausted(server):
+    server.routes["/m"] = [server.respond(status=503)]
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(max_attempts=3, backoff=0))
+    with pytest.raises(requests.HTTPError):
+        pubg._get_json("match", server.url + "/m", limited=False)
+    assert len(server.requests) == 3
+
+
+def test_circuit_opens(server):
+    server.routes["/m"] = [server.respond(status=503)]
+    breaker = CircuitBreaker(threshold=2)
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(max_attempts=1), circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            pubg._get_json("match", server.url + "/m", limited=False)
+    with pytest.raises(CircuitOpenError):
+        pubg._get_json("match", server.url + "/m", limited=False)
+    assert len(server.requests) == 2
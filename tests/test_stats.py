@@ -0,0 +1,51 @@
+from chicken_dinner.pubgapi.core import PUBGCore
+from chicken_dinner.pubgapi.retry import RetryPolicy
+from chicken_dinner.pubgapi.stats import RequestStats
+
+
+def test_latency_histogram():
+    stats = RequestStats(buckets=(0.1, 1))
+    for latency in (0.05, 0.1, 0.5, 2):
+        stats.record_response("match", latency, 10, 40)
+    match = stats.endpoints["match"]
+    assert match.requests == 4
+    assert match.latency_histogram == [2, 1, 1]
+    assert match.latency_mean == 2.65 / 4
+    assert match.compressed_bytes == 40
+    assert match.decompressed_bytes == 160
+    assert stats.to_dict()["endpoints"]["match"]["latency_histogram"] == {"0.1": 2, "1": 1, "inf": 1}
+
+
+def test_record_hooks():
+    stats = RequestStats()
+    stats.record_retry("player", 1.5)
+    stats.record_retry(None, 0.5)
+    stats.record_rate_limit_sleep(3)
+    stats.record_cache_hit("match")
+    stats.record_not_modified("player")
+    stats.record_decode("match", 0.25)
+    stats.record_bytes("telemetry", 100, None)
+    assert stats.endpoints["player"].retries == 1
+    assert stats.endpoints["unknown"].retries == 1
+    assert stats.retry_sleep == 2
+    assert stats.rate_limit_sleep == 3
+    assert stats.endpoints["match"].cache_hits == 1
+    assert stats.endpoints["match"].decode_time == 0.25
+    assert stats.endpoints["player"].not_modified == 1
+    assert stats.endpoints["telemetry"].compressed_bytes == 100
+    assert stats.endpoints["telemetry"].requests == 0
+    stats.reset()
+    assert stats.to_dict() == {"endpoints": {}, "rate_limit_sleep": 0.0, "retry_sleep": 0.0}
+
+
+def test_core_records_requests(server):
+    body = b'{"data": []}'
+    server.routes["/m"] = [server.respond(status=503), server.respond(body=body)]
+    stats = RequestStats()
+    pubg = PUBGCore("key", "steam", retry=RetryPolicy(backoff=0), stats=stats)
+    pubg._get_json("match", server.url + "/m", limited=False)
+    match = stats.endpoints["match"]
+    assert match.requests == 2
+    assert match.retries == 1
+    assert match.decompressed_bytes == len(body)
+    assert match.decode_time > 0
@@ -0,0 +1,77 @@
+import gzip
+import json
+import os
+import threading
+import time
+
+from chicken_dinner.store import TelemetryStore
+
+EVENTS = [{"_T": "LogMatchStart", "_D": "2020-05-09T12:00:00.000Z"}, {"_T": "LogMatchEnd", "value": 1.5}]
+
+
+def test_put_and_load(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    store.put("a", EVENTS)
+    store.put("b", json.dumps(EVENTS[:1]).encode("utf-8"))
+    store.put("c", gzip.compress(json.dumps(EVENTS[1:]).encode("utf-8")))
+    assert store.match_ids == ["a", "b", "c"]
+    assert store.load("a") == EVENTS
+    assert store.load("b") == EVENTS[:1]
+    assert store.load("c") == EVENTS[1:]
+    assert list(store.stream("a", chunk_size=7)) == EVENTS
+    assert list(store.stream("c", chunk_size=1)) == EVENTS[1:]
+
+
+def test_overwrite(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    store.put("a", EVENTS)
+    store.put("a", EVENTS[:1])
+    assert store.load("a") == EVENTS
+    store.put("a", EVENTS[:1], overwrite=True)
+    assert store.load("a") == EVENTS[:1]
+    assert len(store) == 1
+
+
+def test_reopen(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    store.put("a", EVENTS)
+    store.put("b", EVENTS[:1])
+    reopened = TelemetryStore(str(tmp_path))
+    assert "a" in reopened and "b" in reopened
+    assert reopened.load("b") == EVENTS[:1]
+
+
+def test_interrupted_write(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    store.put("a", EVENTS)
+    store.put("b", EVENTS)
+    # Lose the end of the archive and leave a partial index line
+    archive = os.path.join(str(tmp_path), os.path.basename(store._archive_path))
+    with open(archive, "r+b") as f:
+        f.truncate(os.path.getsize(archive) - 1)
+    with open(store._index_path, "a") as f:
+        f.write('{"match_id": "c", "off')
+    reopened = TelemetryStore(str(tmp_path))
+    assert reopened.match_ids == ["a"]
+    reopened.put("d", EVENTS)
+    assert TelemetryStore(str(tmp_path)).match_ids == ["a", "d"]
+    assert TelemetryStore(str(tmp_path)).load("d") == EVENTS
+
+
+def test_concurrent_put(tmp_path, monkeypatch):
+    store = TelemetryStore(str(tmp_path))
+    compress = gzip.compress
+
+    def slow_compress(data):
+        time.sleep(0.05)
+        return compress(data)
+
+    monkeypatch.setattr(gzip, "compress", slow_compress)
+    threads = [threading.Thread(target=store.put, args=("a", EVENTS)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with open(store._index_path) as f:
+        assert len(f.readlines()) == 1
+    assert store.load("a") == EVENTS
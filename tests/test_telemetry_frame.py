@@ -0,0 +1,83 @@
+import sys
+
+import numpy as np
+import pytest
+
+from chicken_dinner.models.telemetry import Telemetry
+
+
+@pytest.fixture
+def telemetry(telemetry_json):
+    return Telemetry(None, None, telemetry_json)
+
+
+def test_players(telemetry):
+    frame = telemetry.to_arrays()
+    assert frame.players == telemetry.player_names()
+    assert len(frame) == len(telemetry.filter_by("log_player_position"))
+
+
+def test_positions(telemetry):
+    frame = telemetry.to_arrays()
+    assert frame.positions["player"].dtype == np.int32
+    assert frame.positions["x"].dtype == np.float64
+    for row, (dt, event) in enumerate(telemetry._filter_elapsed("log_player_position")):
+        character = event.character
+        assert frame.players[frame.positions["player"][row]] == character.name
+        assert frame.positions["t"][row] == dt
+        assert frame.positions["x"][row] == character.location.x
+        assert frame.positions["y"][row] == character.location.y
+        assert frame.positions["z"][row] == character.location.z
+        assert frame.positions["health"][row] == character.health
+        assert frame.positions["ranking"][row] == character.ranking
+        assert frame.positions["elapsed_time"][row] == event.elapsed_time
+
+
+def test_player_positions(telemetry):
+    frame = telemetry.to_arrays()
+    for player, expected in telemetry.player_positions().items():
+        columns = frame.player_positions(player)
+        ingame = columns["elapsed_time"] > 0
+        rows = list(zip(*(columns[name][ingame].tolist() for name in ("t", "x", "y", "z"))))
+        assert len(expected) > 0
+        assert rows[: len(expected)] == expected
+
+
+def test_damages(telemetry):
+    frame = telemetry.to_arrays()
+    damages = frame.damages
+    assert len(damages["t"]) == len(telemetry.filter_by("log_player_take_damage"))
+    expected = telemetry.player_damages()
+    found = {}
+    for row in range(len(damages["t"])):
+        if damages["attacker"][row] == -1:
+            assert damages["attack_id"][row] == -1
+            assert np.isnan(damages["attacker_x"][row])
+            continue
+        attacker = frame.players[damages["attacker"][row]]
+        names = ("t", "attacker_x", "attacker_y", "attacker_z", "victim_x", "victim_y", "victim_z")
+        found.setdefault(attacker, []).append(tuple(damages[name][row] for name in names))
+    assert found == expected
+    assert damages["damage"].tolist() == [20.5, 1.5]
+
+
+def test_circles(telemetry):
+    frame = telemetry.to_arrays()
+    circles = telemetry.circle_positions()
+    # circle_positions times are relative to the first game state, not the match start
+    offset = frame.circles["t"][0] - circles["blue"][0][0]
+    for color in ("white", "blue", "red"):
+        for row, (t, x, y, z, r) in enumerate(circles[color]):
+            assert frame.circles["t"][row] == pytest.approx(t + offset)
+            assert frame.circles[color + "_x"][row] == x
+            assert frame.circles[color + "_y"][row] == y
+            assert frame.circles[color + "_z"][row] == z
+            assert frame.circles[color + "_radius"][row] == r
+
+
+def test_missing_numpy(telemetry, monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.delitem(sys.modules, "chicken_dinner.models.telemetry.frame", raising=False)
+    with pytest.raises(ModuleNotFoundError):
+        telemetry.to_arrays()
+    assert "chicken_dinner[frame]" in capsys.readouterr().out
@@ -0,0 +1,30 @@
+from chicken_dinner.models.telemetry import Telemetry
+from chicken_dinner.util import camel_to_snake
+
+
+def test_event_index(telemetry_json):
+    telemetry = Telemetry(None, None, telemetry_json)
+    expected = {}
+    for idx, event in enumerate(telemetry_json):
+        expected.setdefault(camel_to_snake(event["_T"]), []).append(idx)
+    assert telemetry._event_index == expected
+    assert telemetry.event_types() == sorted(expected)
+
+
+def test_filter_by_matches_scan(telemetry_json):
+    for lazy in (False, True):
+        telemetry = Telemetry(None, None, telemetry_json, lazy=lazy)
+        for event_type in telemetry.event_types():
+            scanned = [event for event in telemetry.events if event.event_type == event_type]
+            filtered = telemetry.filter_by(event_type)
+            assert len(filtered) == len(scanned)
+            assert all(a is b for a, b in zip(filtered, scanned))
+        assert telemetry.filter_by("log_unknown") == []
+        assert telemetry.filter_by() == telemetry.events
+        assert telemetry.filter_by() is not telemetry.events
+
+
+def test_filter_by_returns_new_list(telemetry_json):
+    telemetry = Telemetry(None, None, telemetry_json)
+    telemetry.filter_by("log_player_kill").clear()
+    assert len(telemetry.filter_by("log_player_kill")) == 1
@@ -0,0 +1,102 @@
+import pytest
+
+from chicken_dinner.models.telemetry import LazyTelemetryEvent
+from chicken_dinner.models.telemetry import LazyTelemetryObject
+from chicken_dinner.models.telemetry import Telemetry
+from chicken_dinner.models.telemetry import TelemetryEvent
+
+
+@pytest.fixture(params=[False, True], ids=["raw", "map_assets"])
+def telemetries(request, telemetry_json):
+    eager = Telemetry(None, None, telemetry_json, map_assets=request.param)
+    lazy = Telemetry(None, None, telemetry_json, map_assets=request.param, lazy=True)
+    return eager, lazy
+
+
+def test_event_classes(telemetries):
+    eager, lazy = telemetries
+    assert all(type(event) is TelemetryEvent for event in eager.events)
+    assert all(isinstance(event, LazyTelemetryEvent) for event in lazy.events)
+    assert isinstance(lazy.filter_by("log_player_position")[0].character, LazyTelemetryObject)
+
+
+def test_to_dict(telemetries):
+    eager, lazy = telemetries
+    assert [event.to_dict() for event in lazy.events] == [event.to_dict() for event in eager.events]
+    assert [event.dumps() for event in lazy.events] == [event.dumps() for event in eager.events]
+
+
+def test_filter_by(telemetries):
+    eager, lazy = telemetries
+    assert lazy.event_types() == eager.event_types()
+    for event_type in eager.event_types() + ["log_unknown"]:
+        expected = [event.to_dict() for event in eager.filter_by(event_type)]
+        assert [event.to_dict() for event in lazy.filter_by(event_type)] == expected
+
+
+def test_event_surface(telemetries):
+    eager, lazy = telemetries
+    for eager_event, lazy_event in zip(eager.events, lazy.events):
+        assert lazy_event.event_type == eager_event.event_type
+        assert lazy_event.timestamp == eager_event.timestamp
+        assert lazy_event._T == eager_event._T
+        assert lazy_event.keys() == eager_event.keys()
+        # An "items" field shadows the method, in both models
+        if eager_event.event_type != "log_item_pickup_from_carepackage":
+            assert [k for k, _ in lazy_event.items()] == [k for k, _ in eager_event.items()]
+            assert len(lazy_event.values()) == len(eager_event.values())
+
+
+def test_attribute_access(telemetries):
+    eager, lazy = telemetries
+    for telemetry in (eager, lazy):
+        position = telemetry.filter_by("log_player_position")[0]
+        assert position.character.location.x == 0.0
+        assert position["character"]["location"]["y"] == 2000.0
+        assert position.character["accountId"] == "account.p0"
+        assert position.character.reference == "character"
+        assert position.character.zone == ["pochinki"]
+        with pytest.raises(AttributeError):
+            position.not_a_field
+        with pytest.raises(AttributeError):
+            position.character.not_a_field
+        match_start = telemetry.filter_by("log_match_start")[0]
+        assert match_start.blue_zone_custom_options[0].phase_num == 1
+        damage = telemetry.filter_by("log_player_take_damage")[1]
+        assert damage.attacker is None
+
+
+def test_map_assets(telemetry_json):
+    for lazy in (False, True):
+        telemetry = Telemetry(None, None, telemetry_json, map_assets=True, lazy=lazy)
+        attack = telemetry.filter_by("log_player_attack")[0]
+        assert attack.weapon.item_id == "AKM"
+        kill = telemetry.filter_by("log_player_kill")[0]
+        assert kill.damage_causer_additional_info == ["Large Compensator"]
+
+
+def test_shadowed_keys(telemetries):
+    eager, lazy = telemetries
+    for telemetry in (eager, lazy):
+        pickup = telemetry.filter_by("log_item_pickup_from_carepackage")[0]
+        assert pickup.items[0].stack_count == 1
+        assert pickup["items"][0].category == "Weapon"
+        assert "items" in pickup.keys()
+        spawn = telemetry.filter_by("log_care_package_spawn")[0]
+        assert spawn.item_package.items[0].stack_count == 1
+        assert "items" in spawn.item_package.keys()
+
+
+def test_analytics(telemetries):
+    eager, lazy = telemetries
+    assert lazy.player_positions() == eager.player_positions()
+    assert lazy.player_damages() == eager.player_damages()
+    assert lazy.circle_positions() == eager.circle_positions()
+    assert lazy.care_package_positions(land=False) == eager.care_package_positions(land=False)
+    assert lazy.damage_done() == eager.damage_done()
+    assert lazy.rosters() == eager.rosters()
+    assert lazy.rankings() == eager.rankings()
+    assert sorted(lazy.killed()) == sorted(eager.killed())
+    assert lazy.match_id() == eager.match_id() == "match.bro.official.x"
+    assert lazy.map_id() == eager.map_id()
+    assert lazy.platform == eager.platform == "pc"
@@ -0,0 +1,63 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from chicken_dinner.util import camel_to_snake
+from chicken_dinner.util import camel_to_snake_cache_info
+from chicken_dinner.util import parse_timestamp
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def strptime_microseconds(timestamp):
+    parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+    delta = parsed - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2020-05-09T12:34:56.789Z",
+        "2020-05-09T00:00:00.000Z",
+        "2019-12-31T23:59:59.999Z",
+        "2020-02-29T08:07:06.5Z",
+        "2021-07-01T13:14:15.123456Z",
+        "1970-01-01T00:00:00.000Z",
+    ],
+)
+def test_parse_timestamp(timestamp):
+    assert parse_timestamp(timestamp) == strptime_microseconds(timestamp)
+
+
+def test_parse_timestamp_without_fraction():
+    assert parse_timestamp("2020-05-09T12:34:56Z") == strptime_microseconds("2020-05-09T12:34:56.0Z")
+
+
+def test_parse_timestamp_truncates_to_microseconds():
+    assert parse_timestamp("2020-05-09T12:34:56.1234567Z") == strptime_microseconds("2020-05-09T12:34:56.123456Z")
+
+
+def test_elapsed_time_is_exact():
+    start = parse_timestamp("2020-05-09T23:59:59.900Z")
+    end = parse_timestamp("2020-05-10T00:00:00.100Z")
+    assert end - start == 200000
+
+
+@pytest.mark.parametrize("timestamp", ["2020-05-09 12:34:56.789Z", "2020-05-09T12:34:56.789", "2020-05-09Tab:34:56Z"])
+def test_parse_timestamp_invalid(timestamp):
+    with pytest.raises(ValueError):
+        parse_timestamp(timestamp)
+
+
+def test_camel_to_snake():
+    assert camel_to_snake("DBNOs") == "dbnos"
+    assert camel_to_snake("damageCauserName") == "damage_causer_name"
+    assert camel_to_snake("someHTTPKeyName") == "some_http_key_name"
+    misses = camel_to_snake_cache_info().misses
+    assert camel_to_snake("unknownCamelKey") == "unknown_camel_key"
+    assert camel_to_snake("unknownCamelKey") == "unknown_camel_key"
+    info = camel_to_snake_cache_info()
+    assert info.misses == misses + 1
+    assert info.currsize <= info.maxsize